@@ -62,8 +62,12 @@ from common.circuit_breaker import (
 
 from common.caching import (
     LRUCache,
+    SQLiteCache,
     get_guardrails_cache,
     get_llm_cache,
+    get_merge_cache,
+    get_pricing_cache,
+    get_pricing_disk_cache,
     get_all_cache_stats,
     clear_all_caches,
 )
@@ -114,8 +118,12 @@ __all__ = [
     "circuit_breaker_protected",
     # Caching
     "LRUCache",
+    "SQLiteCache",
     "get_guardrails_cache",
     "get_llm_cache",
+    "get_merge_cache",
+    "get_pricing_cache",
+    "get_pricing_disk_cache",
     "get_all_cache_stats",
     "clear_all_caches",
     # Input validation
@@ -7,12 +7,16 @@ Provides caching for expensive operations like LLM calls and guardrail processin
 import hashlib
 import json
 import logging
+import sqlite3
 import time
 from dataclasses import dataclass, field
-from typing import Any, Dict, Optional, Callable
-from threading import Lock
+from pathlib import Path
+from typing import Any, Dict, Optional, Callable, Union
+from threading import Lock, local
 from collections import OrderedDict
 
+from common import json_utils
+
 logger = logging.getLogger(__name__)
 
 
@@ -156,6 +160,75 @@ class LRUCache:
             }
 
 
+class SQLiteCache:
+    """
+    Persistent key-value cache backed by a SQLite file.
+    
+    Survives process restarts, so re-runs over the same data skip repeated
+    work (e.g. LLM calls). Values are stored as JSON and must be
+    JSON-serializable. Safe to share between processes via SQLite's file
+    locking; each thread uses its own connection.
+    """
+    
+    def __init__(self, path: Union[str, Path], default_ttl_seconds: float = 30 * 86400.0):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.default_ttl_seconds = default_ttl_seconds
+        self._local = local()
+        
+        with self._connection() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                "key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL NOT NULL)"
+            )
+    
+    def _connection(self) -> sqlite3.Connection:
+        """Get this thread's connection (opened on first use)."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30.0)
+            self._local.conn = conn
+        return conn
+    
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Get a value from the cache.
+        
+        Args:
+            key: Cache key
+            
+        Returns:
+            Cached value or None if not found/expired
+        """
+        row = self._connection().execute(
+            "SELECT value, expires_at FROM cache WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None or row[1] < time.time():
+            return None
+        return json_utils.loads(row[0])
+    
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Set a value in the cache.
+        
+        Args:
+            key: Cache key
+            value: JSON-serializable value to cache
+            ttl: Time-to-live in seconds (uses default if not specified)
+        """
+        expires_at = time.time() + (ttl or self.default_ttl_seconds)
+        with self._connection() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, json_utils.dumps(value), expires_at),
+            )
+    
+    def clear(self) -> None:
+        """Clear all entries from the cache."""
+        with self._connection() as conn:
+            conn.execute("DELETE FROM cache")
+
+
 def make_cache_key(*args, **kwargs) -> str:
     """
     Create a cache key from arguments.
@@ -181,6 +254,15 @@ _guardrails_cache: Optional[LRUCache] = None
 # Cache for LLM results
 _llm_cache: Optional[LRUCache] = None
 
+# Cache for Stage 4 verify/merge/derived results
+_merge_cache: Optional[LRUCache] = None
+
+# Cache for Stage 7 LLM price estimates
+_pricing_cache: Optional[LRUCache] = None
+
+# Persistent cache for Stage 7 LLM price estimates
+_pricing_disk_cache: Optional[SQLiteCache] = None
+
 
 def get_guardrails_cache() -> LRUCache:
     """Get the guardrails result cache."""
@@ -204,6 +286,45 @@ def get_llm_cache() -> LRUCache:
     return _llm_cache
 
 
+def get_merge_cache() -> LRUCache:
+    """Get the Stage 4 merge result cache."""
+    global _merge_cache
+    if _merge_cache is None:
+        _merge_cache = LRUCache(CacheConfig(
+            max_size=4096,
+            default_ttl_seconds=86400.0,  # 24 hours (keyed on all inputs)
+        ))
+    return _merge_cache
+
+
+def get_pricing_cache() -> LRUCache:
+    """Get the Stage 7 price estimate cache."""
+    global _pricing_cache
+    if _pricing_cache is None:
+        _pricing_cache = LRUCache(CacheConfig(
+            max_size=4096,
+            default_ttl_seconds=3600.0,  # 1 hour (LLM results may change)
+        ))
+    return _pricing_cache
+
+
+def get_pricing_disk_cache() -> Optional[SQLiteCache]:
+    """
+    Get the persistent Stage 7 price estimate cache.
+    
+    Returns:
+        SQLiteCache under LLM_CACHE_DIR, or None if disabled
+        (STAGE7_PRICING_DISK_CACHE=false)
+    """
+    global _pricing_disk_cache
+    if _pricing_disk_cache is None:
+        from config import LLM_CACHE_DIR, PRICING_DISK_CACHE_ENABLED
+        if not PRICING_DISK_CACHE_ENABLED:
+            return None
+        _pricing_disk_cache = SQLiteCache(LLM_CACHE_DIR / "pricing.sqlite3")
+    return _pricing_disk_cache
+
+
 def cached_guardrails(func: Callable) -> Callable:
     """
     Decorator to cache guardrail results.
@@ -279,6 +400,8 @@ def get_all_cache_stats() -> Dict[str, Any]:
     return {
         "guardrails": get_guardrails_cache().get_stats(),
         "llm": get_llm_cache().get_stats(),
+        "merge": get_merge_cache().get_stats(),
+        "pricing": get_pricing_cache().get_stats(),
     }
 
 
@@ -286,4 +409,6 @@ def clear_all_caches() -> None:
     """Clear all caches."""
     get_guardrails_cache().clear()
     get_llm_cache().clear()
+    get_merge_cache().clear()
+    get_pricing_cache().clear()
     logger.info("All caches cleared")
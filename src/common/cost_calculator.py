@@ -16,6 +16,7 @@ class TokenUsage:
     completion_tokens: int
     total_tokens: int
     model: str
+    batch: bool = False  # Billed through the Batch API
 
 
 # OpenAI Pricing (per 1M tokens) - Updated as of 2024
@@ -60,6 +61,11 @@ OPENAI_PRICING: Dict[str, Dict[str, float]] = {
 }
 
 
+# Batch API jobs are billed at half the on-demand price
+# Source: https://platform.openai.com/docs/guides/batch
+BATCH_API_DISCOUNT = 0.5
+
+
 def get_model_pricing(model: str) -> Optional[Dict[str, float]]:
     """
     Get pricing for a model.
@@ -85,7 +91,8 @@ def get_model_pricing(model: str) -> Optional[Dict[str, float]]:
 def calculate_cost(
     prompt_tokens: int,
     completion_tokens: int,
-    model: str
+    model: str,
+    batch: bool = False
 ) -> Tuple[float, Optional[Dict[str, float]]]:
     """
     Calculate cost for a single API call.
@@ -94,6 +101,7 @@ def calculate_cost(
         prompt_tokens: Number of input tokens
         completion_tokens: Number of output tokens
         model: Model name used
+        batch: If True, apply the Batch API discount
         
     Returns:
         Tuple of (total_cost_usd, pricing_info_dict or None if model unknown)
@@ -103,14 +111,18 @@ def calculate_cost(
     if pricing is None:
         return 0.0, None
     
+    multiplier = BATCH_API_DISCOUNT if batch else 1.0
+    prompt_price = pricing["prompt"] * multiplier
+    completion_price = pricing["completion"] * multiplier
+    
     # Calculate cost: (tokens / 1M) * price_per_1M
-    prompt_cost = (prompt_tokens / 1_000_000) * pricing["prompt"]
-    completion_cost = (completion_tokens / 1_000_000) * pricing["completion"]
+    prompt_cost = (prompt_tokens / 1_000_000) * prompt_price
+    completion_cost = (completion_tokens / 1_000_000) * completion_price
     total_cost = prompt_cost + completion_cost
     
     pricing_info = {
-        "prompt_price_per_1M": pricing["prompt"],
-        "completion_price_per_1M": pricing["completion"],
+        "prompt_price_per_1M": prompt_price,
+        "completion_price_per_1M": completion_price,
         "prompt_cost": prompt_cost,
         "completion_cost": completion_cost,
         "total_cost": total_cost,
@@ -141,7 +153,8 @@ def calculate_batch_cost(
         cost, pricing_info = calculate_cost(
             usage.prompt_tokens,
             usage.completion_tokens,
-            usage.model
+            usage.model,
+            batch=usage.batch
         )
         
         total_cost += cost
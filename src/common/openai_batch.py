@@ -0,0 +1,176 @@
+"""
+OpenAI Batch API Module
+
+Submits many chat-completion requests as a single OpenAI Batch API job
+(https://platform.openai.com/docs/guides/batch). Batch jobs are billed at a
+discount and complete within a 24h window, which suits offline bulk runs
+where latency does not matter.
+
+Flow:
+1. Split requests into jobs of at most MAX_REQUESTS_PER_BATCH
+2. Serialize each job's requests to JSONL (one line per request, keyed by custom_id)
+3. Upload the file with purpose="batch" and create the batch job
+4. Poll each job until it reaches a terminal status
+5. Download the output files and map each response back to its custom_id
+"""
+
+import io
+import json
+import logging
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from openai import OpenAI
+
+from config import get_openai_api_key
+from common import json_utils
+
+logger = logging.getLogger(__name__)
+
+# Endpoint used for chat-completion batch lines
+CHAT_COMPLETIONS_URL = "/v1/chat/completions"
+
+# Batch statuses after which polling stops
+TERMINAL_BATCH_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+# Batch API limit on requests in a single job's input file
+MAX_REQUESTS_PER_BATCH = 50_000
+
+
+class BatchJobError(Exception):
+    """Raised when a batch job does not complete successfully."""
+    pass
+
+
+def build_batch_jsonl(requests: List[Tuple[str, Dict[str, Any]]]) -> bytes:
+    """
+    Serialize chat-completion requests into Batch API JSONL.
+    
+    Args:
+        requests: List of (custom_id, request_body) tuples
+    
+    Returns:
+        JSONL file content as bytes
+    """
+    lines = [
+        json.dumps({
+            "custom_id": custom_id,
+            "method": "POST",
+            "url": CHAT_COMPLETIONS_URL,
+            "body": body,
+        })
+        for custom_id, body in requests
+    ]
+    return ("\n".join(lines) + "\n").encode("utf-8")
+
+
+def parse_batch_output(content: bytes) -> Dict[str, Dict[str, Any]]:
+    """
+    Parse a Batch API output (or error) file.
+    
+    Args:
+        content: Raw JSONL content of the output file
+    
+    Returns:
+        Mapping of custom_id -> result line ({"response": ..., "error": ...})
+    """
+    results = {}
+    for line in content.splitlines():
+        if not line.strip():
+            continue
+        record = json_utils.loads(line)
+        results[record.get("custom_id")] = record
+    return results
+
+
+def _submit_batch(
+    client: OpenAI,
+    requests: List[Tuple[str, Dict[str, Any]]],
+    completion_window: str,
+    file_name: str,
+):
+    """Upload one job's requests and create its batch."""
+    batch_file = client.files.create(
+        file=(file_name, io.BytesIO(build_batch_jsonl(requests))),
+        purpose="batch",
+    )
+    batch = client.batches.create(
+        input_file_id=batch_file.id,
+        endpoint=CHAT_COMPLETIONS_URL,
+        completion_window=completion_window,
+    )
+    logger.info(f"Submitted batch {batch.id} with {len(requests)} requests")
+    return batch
+
+
+def run_chat_batch(
+    requests: List[Tuple[str, Dict[str, Any]]],
+    client: Optional[OpenAI] = None,
+    poll_interval: float = 30.0,
+    max_wait_seconds: Optional[float] = None,
+    completion_window: str = "24h",
+    file_name: str = "stage4_batch.jsonl",
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Run chat-completion requests as Batch API jobs and wait for results.
+    
+    Requests are split into jobs of at most MAX_REQUESTS_PER_BATCH; all
+    jobs are submitted up front so they run concurrently.
+    
+    Args:
+        requests: List of (custom_id, request_body) tuples
+        client: Optional OpenAI client (created if not provided)
+        poll_interval: Seconds between status checks
+        max_wait_seconds: Give up after this many seconds (None = no limit)
+        completion_window: Batch completion window
+        file_name: Name of the uploaded request file
+    
+    Returns:
+        Mapping of custom_id -> result line. Requests missing from the
+        mapping produced no output.
+    
+    Raises:
+        BatchJobError: If a job fails, expires, is cancelled or times out
+    """
+    if not requests:
+        return {}
+    
+    client = client or OpenAI(api_key=get_openai_api_key())
+    
+    # Upload request files and create batch jobs
+    batches = [
+        _submit_batch(
+            client,
+            requests[i:i + MAX_REQUESTS_PER_BATCH],
+            completion_window,
+            file_name,
+        )
+        for i in range(0, len(requests), MAX_REQUESTS_PER_BATCH)
+    ]
+    
+    start_time = time.time()
+    results = {}
+    for batch in batches:
+        # Poll until terminal status
+        while batch.status not in TERMINAL_BATCH_STATUSES:
+            if max_wait_seconds is not None and time.time() - start_time > max_wait_seconds:
+                raise BatchJobError(
+                    f"Batch {batch.id} still '{batch.status}' after {max_wait_seconds:.0f}s"
+                )
+            time.sleep(poll_interval)
+            batch = client.batches.retrieve(batch.id)
+            logger.debug(f"Batch {batch.id} status: {batch.status}")
+        
+        if batch.status != "completed":
+            raise BatchJobError(f"Batch {batch.id} ended with status '{batch.status}'")
+        
+        # Download results (successful lines and per-request errors)
+        for file_id in (batch.error_file_id, batch.output_file_id):
+            if file_id:
+                results.update(parse_batch_output(client.files.content(file_id).content))
+    
+    logger.info(
+        f"{len(batches)} batch job(s) completed: {len(results)}/{len(requests)} results "
+        f"in {time.time() - start_time:.0f}s"
+    )
+    return results
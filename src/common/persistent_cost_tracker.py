@@ -2,16 +2,18 @@
 Persistent Cost Tracker
 
 Stores token usage and costs to a file so they persist across sessions.
+Records are appended as newline-delimited JSON (.metrics/usage_history.jsonl).
 """
 
-import json
 import logging
 from pathlib import Path
 from datetime import datetime, timezone
-from typing import Dict, List, Optional
+from collections import deque
+from typing import Dict, Iterator, List, Optional
 from dataclasses import dataclass, asdict
 from threading import Lock
 
+from common import json_utils
 from common.cost_calculator import TokenUsage, calculate_cost
 
 logger = logging.getLogger(__name__)
@@ -29,11 +31,20 @@ class UsageRecord:
     cost_usd: float
 
 
+# Default storage file (one JSON record per line) and the single-document
+# file it replaces, which is migrated on first use
+HISTORY_FILE_NAME = "usage_history.jsonl"
+LEGACY_HISTORY_FILE_NAME = "usage_history.json"
+
+
 class PersistentCostTracker:
     """
     Tracks token usage and costs persistently across sessions.
     
-    Stores data in a JSON file that accumulates over time.
+    Stores records as newline-delimited JSON. Recording appends one line and
+    statistics stream the file in a single pass, so neither keeps the full
+    history in memory or rewrites it. The summary report is not rebuilt on
+    each write; regenerate it with generate_usage_report() when needed.
     """
     
     def __init__(self, storage_path: Optional[Path] = None):
@@ -41,62 +52,64 @@ class PersistentCostTracker:
         Initialize persistent tracker.
         
         Args:
-            storage_path: Path to JSON file for storage (defaults to project root)
+            storage_path: Path to ndjson file for storage (defaults to project root)
         """
         if storage_path is None:
-            # Default to project root / .metrics/usage_history.json
+            # Default to project root / .metrics/usage_history.jsonl
             project_root = Path(__file__).parent.parent.parent
             metrics_dir = project_root / ".metrics"
             metrics_dir.mkdir(exist_ok=True)
-            storage_path = metrics_dir / "usage_history.json"
+            storage_path = metrics_dir / HISTORY_FILE_NAME
         
         self.storage_path = storage_path
         self._lock = Lock()
-        self._records: List[UsageRecord] = []
-        self._load()
+        self._migrate_legacy_history()
     
-    def _load(self) -> None:
-        """Load existing records from file."""
-        if not self.storage_path.exists():
+    def _migrate_legacy_history(self) -> None:
+        """Convert a legacy usage_history.json next to storage_path to ndjson."""
+        legacy_path = self.storage_path.with_name(LEGACY_HISTORY_FILE_NAME)
+        if legacy_path == self.storage_path or self.storage_path.exists() or not legacy_path.exists():
             return
         
         try:
-            with open(self.storage_path, 'r') as f:
-                data = json.load(f)
-                self._records = [
-                    UsageRecord(**record) for record in data.get("records", [])
-                ]
-            logger.debug(f"Loaded {len(self._records)} usage records from {self.storage_path}")
+            with open(legacy_path, 'rb') as f:
+                records = json_utils.loads(f.read()).get("records", [])
+            
+            # Write atomically (write to temp file, then rename)
+            temp_path = self.storage_path.with_suffix('.tmp')
+            with open(temp_path, 'wb') as f:
+                for record in records:
+                    f.write(json_utils.dumps(record) + b"\n")
+            temp_path.replace(self.storage_path)
+            
+            logger.info(f"Migrated {len(records)} usage records from {legacy_path} to {self.storage_path}")
         except Exception as e:
-            logger.warning(f"Failed to load usage history: {e}")
-            self._records = []
+            logger.warning(f"Failed to migrate usage history: {e}")
+    
+    def _iter_records(self) -> Iterator[UsageRecord]:
+        """Stream records from the storage file, skipping unreadable lines."""
+        if not self.storage_path.exists():
+            return
+        
+        with open(self.storage_path, 'rb') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    record = UsageRecord(**json_utils.loads(line))
+                except Exception as e:
+                    # e.g. a line truncated by a crash mid-write
+                    logger.warning(f"Skipping unreadable usage record: {e}")
+                    continue
+                yield record
     
-    def _save(self) -> None:
-        """Save records to file."""
+    def _update_report(self) -> None:
+        """Regenerate the usage summary report."""
         try:
-            with self._lock:
-                data = {
-                    "last_updated": datetime.now(timezone.utc).isoformat(),
-                    "total_records": len(self._records),
-                    "records": [asdict(record) for record in self._records]
-                }
-                
-                # Write atomically (write to temp file, then rename)
-                temp_path = self.storage_path.with_suffix('.tmp')
-                with open(temp_path, 'w') as f:
-                    json.dump(data, f, indent=2)
-                temp_path.replace(self.storage_path)
-                
-                logger.debug(f"Saved {len(self._records)} usage records to {self.storage_path}")
-            
-            # Auto-generate summary report
-            try:
-                from common.usage_report_generator import generate_usage_report
-                generate_usage_report()
-            except Exception as e:
-                logger.debug(f"Failed to auto-generate usage report: {e}")
+            from common.usage_report_generator import generate_usage_report
+            generate_usage_report()
         except Exception as e:
-            logger.error(f"Failed to save usage history: {e}")
+            logger.debug(f"Failed to auto-generate usage report: {e}")
     
     def record_usage(
         self,
@@ -113,7 +126,8 @@ class PersistentCostTracker:
         cost, _ = calculate_cost(
             token_usage.prompt_tokens,
             token_usage.completion_tokens,
-            token_usage.model
+            token_usage.model,
+            batch=token_usage.batch
         )
         
         record = UsageRecord(
@@ -126,41 +140,45 @@ class PersistentCostTracker:
             cost_usd=cost
         )
         
-        with self._lock:
-            self._records.append(record)
-        
-        self._save()
+        try:
+            with self._lock, open(self.storage_path, 'ab') as f:
+                f.write(json_utils.dumps(asdict(record)) + b"\n")
+        except Exception as e:
+            logger.error(f"Failed to save usage record: {e}")
     
     def get_cumulative_stats(self) -> Dict:
         """
         Get cumulative statistics across all sessions.
         
         Returns:
-            Dict with total tokens, costs, breakdown by model, etc.
+            Dict with total tokens, costs, breakdown by model (sorted by
+            model name), etc.
         """
+        total_calls = 0
+        total_tokens = 0
+        total_prompt = 0
+        total_completion = 0
+        total_cost = 0.0
+        model_breakdown: Dict[str, Dict] = {}
+        first_record = None
+        last_record = None
+        
         with self._lock:
-            if not self._records:
-                return {
-                    "total_calls": 0,
-                    "total_tokens": 0,
-                    "total_prompt_tokens": 0,
-                    "total_completion_tokens": 0,
-                    "total_cost_usd": 0.0,
-                    "model_breakdown": {},
-                    "first_record": None,
-                    "last_record": None,
-                }
-            
-            total_tokens = sum(r.total_tokens for r in self._records)
-            total_prompt = sum(r.prompt_tokens for r in self._records)
-            total_completion = sum(r.completion_tokens for r in self._records)
-            total_cost = sum(r.cost_usd for r in self._records)
-            
-            # Breakdown by model
-            model_breakdown: Dict[str, Dict] = {}
-            for record in self._records:
-                if record.model not in model_breakdown:
-                    model_breakdown[record.model] = {
+            for record in self._iter_records():
+                total_calls += 1
+                total_tokens += record.total_tokens
+                total_prompt += record.prompt_tokens
+                total_completion += record.completion_tokens
+                total_cost += record.cost_usd
+                
+                if first_record is None:
+                    first_record = record.timestamp
+                last_record = record.timestamp
+                
+                # Breakdown by model
+                breakdown = model_breakdown.get(record.model)
+                if breakdown is None:
+                    breakdown = model_breakdown[record.model] = {
                         "calls": 0,
                         "total_tokens": 0,
                         "prompt_tokens": 0,
@@ -168,33 +186,41 @@ class PersistentCostTracker:
                         "total_cost": 0.0,
                     }
                 
-                model_breakdown[record.model]["calls"] += 1
-                model_breakdown[record.model]["total_tokens"] += record.total_tokens
-                model_breakdown[record.model]["prompt_tokens"] += record.prompt_tokens
-                model_breakdown[record.model]["completion_tokens"] += record.completion_tokens
-                model_breakdown[record.model]["total_cost"] += record.cost_usd
-            
-            return {
-                "total_calls": len(self._records),
-                "total_tokens": total_tokens,
-                "total_prompt_tokens": total_prompt,
-                "total_completion_tokens": total_completion,
-                "total_cost_usd": total_cost,
-                "model_breakdown": model_breakdown,
-                "first_record": self._records[0].timestamp if self._records else None,
-                "last_record": self._records[-1].timestamp if self._records else None,
-            }
+                breakdown["calls"] += 1
+                breakdown["total_tokens"] += record.total_tokens
+                breakdown["prompt_tokens"] += record.prompt_tokens
+                breakdown["completion_tokens"] += record.completion_tokens
+                breakdown["total_cost"] += record.cost_usd
+        
+        return {
+            "total_calls": total_calls,
+            "total_tokens": total_tokens,
+            "total_prompt_tokens": total_prompt,
+            "total_completion_tokens": total_completion,
+            "total_cost_usd": total_cost,
+            # Sorted by model name once here, so callers iterate it as-is
+            "model_breakdown": dict(sorted(model_breakdown.items())),
+            "first_record": first_record,
+            "last_record": last_record,
+        }
     
     def get_recent_usage(self, limit: int = 10) -> List[UsageRecord]:
         """Get most recent usage records."""
         with self._lock:
-            return self._records[-limit:] if limit > 0 else list(self._records)
+            if limit > 0:
+                return list(deque(self._iter_records(), maxlen=limit))
+            return list(self._iter_records())
     
     def reset(self) -> None:
         """Reset all records (clears file)."""
-        with self._lock:
-            self._records.clear()
-        self._save()
+        try:
+            with self._lock, open(self.storage_path, 'wb'):
+                pass
+        except Exception as e:
+            logger.error(f"Failed to reset usage history: {e}")
+            return
+        
+        self._update_report()
         logger.info("Usage history reset")
 
 
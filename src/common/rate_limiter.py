@@ -64,16 +64,30 @@ class RateLimiter:
         )
         self._last_update = now
     
-    def acquire(self, timeout: Optional[float] = None) -> bool:
+    def _check_tokens(self, tokens: float) -> None:
+        """Reject requests larger than the bucket rather than under-charge them."""
+        if tokens > self.config.burst_limit:
+            raise ValueError(
+                f"Cannot acquire {tokens} tokens; burst_limit is {self.config.burst_limit}"
+            )
+    
+    def acquire(self, timeout: Optional[float] = None, tokens: float = 1.0) -> bool:
         """
-        Acquire a token (blocking).
+        Acquire tokens (blocking).
         
         Args:
-            timeout: Maximum time to wait for a token
+            timeout: Maximum time to wait for the tokens
+            tokens: Number of tokens to take (e.g. estimated LLM tokens
+                for a tokens-per-minute limiter)
             
         Returns:
-            True if token acquired, False if timeout
+            True if tokens acquired, False if timeout
+        
+        Raises:
+            ValueError: If tokens exceeds burst_limit (the bucket can never
+                hold that many)
         """
+        self._check_tokens(tokens)
         timeout = timeout or self.config.max_wait_seconds
         deadline = time.time() + timeout
         
@@ -81,8 +95,8 @@ class RateLimiter:
             with self._lock:
                 self._refill_tokens()
                 
-                if self._tokens >= 1.0:
-                    self._tokens -= 1.0
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
                     self._call_times.append(time.time())
                     return True
             
@@ -96,16 +110,21 @@ class RateLimiter:
             wait_time = min(0.1, remaining)
             time.sleep(wait_time)
     
-    async def acquire_async(self, timeout: Optional[float] = None) -> bool:
+    async def acquire_async(self, timeout: Optional[float] = None, tokens: float = 1.0) -> bool:
         """
-        Acquire a token (async).
+        Acquire tokens (async).
         
         Args:
-            timeout: Maximum time to wait for a token
+            timeout: Maximum time to wait for the tokens
+            tokens: Number of tokens to take
             
         Returns:
-            True if token acquired, False if timeout
+            True if tokens acquired, False if timeout
+        
+        Raises:
+            ValueError: If tokens exceeds burst_limit
         """
+        self._check_tokens(tokens)
         timeout = timeout or self.config.max_wait_seconds
         deadline = time.time() + timeout
         
@@ -113,8 +132,8 @@ class RateLimiter:
             async with self._async_lock:
                 self._refill_tokens()
                 
-                if self._tokens >= 1.0:
-                    self._tokens -= 1.0
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
                     self._call_times.append(time.time())
                     return True
             
@@ -5,7 +5,8 @@ Estimates how easy it is to buy and resell a vehicle for profit with low risk.
 Deterministic, explainable, and stable.
 """
 
-from typing import Dict, List, Any, Optional, Tuple
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Sequence, Tuple
 import math
 
 # --- Constants & Multipliers ---
@@ -166,6 +167,14 @@ def calculate_risk_multiplier(
 
     return risk_multiplier, penalties_applied
 
+def calculate_final_score(value_score: int, liquidity_score: int, risk_multiplier: float) -> int:
+    """
+    Combines component scores into the final Flipability Score (0-100).
+    """
+    base_score = (0.55 * value_score) + (0.45 * liquidity_score)
+    final_score = round(base_score * risk_multiplier)
+    return max(0, min(100, final_score))
+
 def calculate_confidence(
     comps_used_count: int,
     risk_level_overall: str,
@@ -257,9 +266,7 @@ def calculate_flipability(
     risk_multiplier, penalties = calculate_risk_multiplier(signals, service_history_level)
     
     # 3. Compute Final Score
-    base_score = (0.55 * value_score) + (0.45 * liquidity_score)
-    final_score = round(base_score * risk_multiplier)
-    final_score = max(0, min(100, final_score))
+    final_score = calculate_final_score(value_score, liquidity_score, risk_multiplier)
 
     # 4. Compute Confidence
     confidence = calculate_confidence(comps_used_count, risk_level_overall, extraction_warnings)
@@ -295,3 +302,73 @@ def calculate_flipability(
             "risk_level_overall": risk_level_overall
         }
     }
+
+@lru_cache(maxsize=None)
+def _numpy():
+    """Return numpy if installed (imported on first use), else None."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+def calculate_flipability_batch(
+    stage7_payloads: Sequence[Dict[str, Any]],
+    stage4_payloads: Sequence[Dict[str, Any]]
+) -> List[int]:
+    """
+    Calculate flipability_score for many listings at once.
+    
+    Scores only (no components or explanations); each score equals
+    calculate_flipability(stage7, stage4)["flipability_score"]. The value,
+    liquidity and final-score arithmetic is vectorized with numpy when it
+    is installed; otherwise listings are scored one by one.
+    """
+    risk_multipliers = [
+        calculate_risk_multiplier(
+            stage4.get("signals", {}),
+            stage4.get("service_history_level", "unknown")
+        )[0]
+        for stage4 in stage4_payloads
+    ]
+
+    np = _numpy()
+    if np is None:
+        return [
+            calculate_final_score(
+                calculate_value_advantage(stage7.get("asking_price"), stage7.get("estimated_market_price_p50")),
+                calculate_liquidity_score(stage7.get("comps_used_count", 0)),
+                risk_multiplier
+            )
+            for stage7, risk_multiplier in zip(stage7_payloads, risk_multipliers)
+        ]
+
+    asking = np.array([p.get("asking_price") or 0 for p in stage7_payloads], dtype=float)
+    market_p50 = np.array([p.get("estimated_market_price_p50") or 0 for p in stage7_payloads], dtype=float)
+    comps = np.array([p.get("comps_used_count", 0) for p in stage7_payloads], dtype=float)
+    risk = np.array(risk_multipliers, dtype=float)
+
+    # Value advantage (same bands as calculate_value_advantage)
+    has_prices = (asking != 0) & (market_p50 != 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        deal_delta_pct = np.where(has_prices, (market_p50 - asking) / market_p50, 0.0)
+    value_score = np.select(
+        [deal_delta_pct <= -0.05, deal_delta_pct <= 0.00, deal_delta_pct <= 0.05,
+         deal_delta_pct <= 0.10, deal_delta_pct < 0.20],
+        [10, 20, 40, 60, 80],
+        95
+    )
+    value_score = np.where(has_prices, value_score, 0)
+
+    # Liquidity (same bands as calculate_liquidity_score, including its gaps
+    # for non-integer counts, e.g. 49.5 falls through to 30)
+    liquidity_score = np.select(
+        [comps >= 50, (20 <= comps) & (comps <= 49), (10 <= comps) & (comps <= 19),
+         (5 <= comps) & (comps <= 9)],
+        [100, 80, 60, 45],
+        30
+    )
+
+    # Same formula as calculate_final_score; np.round rounds half to even, like round()
+    final_score = np.round(((0.55 * value_score) + (0.45 * liquidity_score)) * risk)
+    return np.clip(final_score, 0, 100).astype(int).tolist()
@@ -76,7 +76,7 @@ def generate_usage_report(output_path: Optional[Path] = None) -> Path:
             report_lines.append("## 💰 Cost Breakdown by Model")
             report_lines.append("")
             
-            for model, breakdown in sorted(stats["model_breakdown"].items()):
+            for model, breakdown in stats["model_breakdown"].items():
                 avg_cost = breakdown['total_cost'] / breakdown['calls'] if breakdown['calls'] > 0 else 0
                 avg_tokens = breakdown['total_tokens'] / breakdown['calls'] if breakdown['calls'] > 0 else 0
                 
@@ -130,10 +130,10 @@ def generate_usage_report(output_path: Optional[Path] = None) -> Path:
     report_lines.append("")
     report_lines.append("## 📝 Notes")
     report_lines.append("")
-    report_lines.append("- This report is automatically generated from `.metrics/usage_history.json`")
+    report_lines.append("- This report is automatically generated from `.metrics/usage_history.jsonl`")
     report_lines.append("- Data persists across all notebook runs and kernel restarts")
     report_lines.append("- To regenerate this report, run: `python generate_usage_report.py`")
-    report_lines.append("- To view raw data, see: `.metrics/usage_history.json`")
+    report_lines.append("- To view raw data, see: `.metrics/usage_history.jsonl`")
     report_lines.append("")
     report_lines.append(f"*Last updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*")
     
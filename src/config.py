@@ -93,3 +93,57 @@ EVIDENCE_WINDOW_SIZE = 200
 
 # Minimum description length to consider "short"
 SHORT_DESCRIPTION_THRESHOLD = 30
+
+# Use the fastjsonschema compiled validator when installed (set to "false"
+# to force the jsonschema path, e.g. when debugging validation issues)
+USE_FASTJSONSCHEMA = os.getenv("USE_FASTJSONSCHEMA", "true").lower() not in ("0", "false", "no")
+
+# Use a Hyperscan database to find matching guardrail rules in one pass when
+# the hyperscan package is installed (set to "false" to use re only)
+USE_HYPERSCAN = os.getenv("USE_HYPERSCAN", "true").lower() not in ("0", "false", "no")
+
+# With validate=True, run full schema validation on every Nth output and only
+# a shallow required-keys check on the rest (1 = validate every output)
+DEEP_VALIDATE_EVERY = max(1, int(os.getenv("STAGE4_DEEP_VALIDATE_EVERY", "1")))
+
+# Bypass all in-process memoization (normalize_text, merge cache), e.g.
+# when debugging a suspected stale-cache issue
+DISABLE_CACHE = os.getenv("STAGE4_DISABLE_CACHE", "").lower() in ("1", "true", "yes")
+
+# Memoize verification/guardrails/merge/derived results for listings whose
+# title, description and LLM payload repeat (set to "false" to disable)
+MERGE_CACHE_ENABLED = (
+    not DISABLE_CACHE
+    and os.getenv("STAGE4_MERGE_CACHE", "true").lower() not in ("0", "false", "no")
+)
+
+# ============================================================================
+# Batch Settings
+# ============================================================================
+
+# Maximum number of concurrent LLM requests in run_stage4_batch
+BATCH_CONCURRENCY = int(os.getenv("STAGE4_BATCH_CONCURRENCY", "16"))
+
+# skip_llm batches at least this large are spread across worker processes
+# (smaller batches run serially; process startup would dominate)
+BATCH_PROCESS_POOL_MIN_SIZE = int(os.getenv("STAGE4_BATCH_PROCESS_POOL_MIN_SIZE", "64"))
+
+# Worker processes for skip_llm batches (default: one per CPU)
+BATCH_MAX_WORKERS = int(os.getenv("STAGE4_BATCH_MAX_WORKERS", "0")) or os.cpu_count() or 1
+
+# ============================================================================
+# Stage 7 Settings
+# ============================================================================
+
+# Maximum number of concurrent pricing requests in estimate_prices_with_llm_async
+PRICER_CONCURRENCY = int(os.getenv("STAGE7_PRICER_CONCURRENCY", "20"))
+
+# Pacing for estimate_prices_with_llm_async; match the account's OpenAI limits
+PRICER_REQUESTS_PER_MINUTE = int(os.getenv("STAGE7_PRICER_RPM", "500"))
+PRICER_TOKENS_PER_MINUTE = int(os.getenv("STAGE7_PRICER_TPM", "200000"))
+
+# Persist LLM price estimates across runs (set to "false" to disable)
+PRICING_DISK_CACHE_ENABLED = os.getenv("STAGE7_PRICING_DISK_CACHE", "true").lower() not in ("0", "false", "no")
+
+# Directory for persistent LLM response caches
+LLM_CACHE_DIR = Path(os.getenv("LLM_CACHE_DIR", str(PROJECT_ROOT / ".llm_cache")))
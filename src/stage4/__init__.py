@@ -16,7 +16,18 @@ Includes:
 - Schema Validator: Output validation
 """
 
-from stage4.runner import run_stage4, run_stage4_safe, run_stage4_batch, PipelineResult
+from stage4.runner import (
+    run_stage4,
+    run_stage4_async,
+    run_stage4_bytes,
+    run_stage4_safe,
+    run_stage4_batch,
+    run_stage4_batch_async,
+    run_stage4_batch_offline,
+    PipelineResult,
+    BatchSummary,
+    JsonlSink,
+)
 from stage4.text_prep import normalize_text, split_sentences
 from stage4.llm_extractor import extract_with_llm
 from stage4.evidence_verifier import verify_signals
@@ -29,14 +40,19 @@ from stage4.normalizer import (
     normalize_maintenance,
 )
 from stage4.derived_fields import compute_derived_fields
-from stage4.schema_validator import validate_stage4_output
 
 __all__ = [
     # Runner
     "run_stage4",
+    "run_stage4_async",
+    "run_stage4_bytes",
     "run_stage4_safe",
     "run_stage4_batch",
+    "run_stage4_batch_async",
+    "run_stage4_batch_offline",
     "PipelineResult",
+    "BatchSummary",
+    "JsonlSink",
     # Text prep
     "normalize_text",
     "split_sentences",
@@ -58,3 +74,11 @@ __all__ = [
     # Validation
     "validate_stage4_output",
 ]
+
+
+def __getattr__(name):
+    # Lazy export: importing schema_validator pulls in jsonschema
+    if name == "validate_stage4_output":
+        from stage4.schema_validator import validate_stage4_output
+        return validate_stage4_output
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
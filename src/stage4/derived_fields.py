@@ -24,12 +24,13 @@ def compute_derived_fields(
     Returns:
         Dictionary of computed summary fields
     """
+    # Keys are in output payload order so build_output can splat this dict
     return {
         "risk_level_overall": compute_risk_level_overall(signals),
-        "mods_risk_level": compute_mods_risk_level(signals.get("mods_performance", [])),
-        "service_history_level": compute_service_history_level(maintenance),
         "negotiation_stance": compute_negotiation_stance(signals.get("seller_behavior", [])),
         "claimed_condition": compute_claimed_condition(signals, llm_summaries),
+        "service_history_level": compute_service_history_level(maintenance),
+        "mods_risk_level": compute_mods_risk_level(signals.get("mods_performance", [])),
     }
 
 
@@ -10,7 +10,7 @@ import logging
 from typing import Any, Dict, List, Optional, Tuple
 
 from config import VERIFIED_MIN_CONFIDENCE, INFERRED_MIN_CONFIDENCE
-from stage4.text_prep import check_evidence_exists
+from stage4.text_prep import check_evidence_exists, normalize_for_match
 from common.schema_enums import get_all_signal_types, is_valid_signal_type
 
 # Configure logging
@@ -20,6 +20,7 @@ logger = logging.getLogger(__name__)
 def verify_signals(
     extraction_result: Dict[str, Any],
     original_text: str,
+    original_normalized: Optional[str] = None,
 ) -> Dict[str, Any]:
     """
     Verify all signals in the extraction result have valid evidence.
@@ -32,6 +33,8 @@ def verify_signals(
     Args:
         extraction_result: Raw LLM extraction output
         original_text: Original title + description text
+        original_normalized: Optional precomputed lowercased,
+            whitespace-collapsed original text (PreparedText.normalized_text)
         
     Returns:
         Extraction result with verified signals only
@@ -41,40 +44,53 @@ def verify_signals(
     
     payload = extraction_result["payload"]
     
+    # Normalize the original once for all evidence checks below
+    if original_normalized is None:
+        original_normalized = normalize_for_match(original_text)
+    
     # Verify signal arrays
     if "signals" in payload:
         signals = payload["signals"]
         
         signals["legality"] = verify_signal_list(
-            signals.get("legality", []), original_text, category="legality"
+            signals.get("legality", []), original_text, category="legality",
+            original_normalized=original_normalized,
         )
         signals["accident_history"] = verify_signal_list(
-            signals.get("accident_history", []), original_text, category="accident_history"
+            signals.get("accident_history", []), original_text, category="accident_history",
+            original_normalized=original_normalized,
         )
         signals["mechanical_issues"] = verify_signal_list(
-            signals.get("mechanical_issues", []), original_text, category="mechanical_issues"
+            signals.get("mechanical_issues", []), original_text, category="mechanical_issues",
+            original_normalized=original_normalized,
         )
         signals["cosmetic_issues"] = verify_signal_list(
-            signals.get("cosmetic_issues", []), original_text, category="cosmetic_issues"
+            signals.get("cosmetic_issues", []), original_text, category="cosmetic_issues",
+            original_normalized=original_normalized,
         )
         signals["mods_performance"] = verify_signal_list(
-            signals.get("mods_performance", []), original_text, category="mods_performance"
+            signals.get("mods_performance", []), original_text, category="mods_performance",
+            original_normalized=original_normalized,
         )
         signals["mods_cosmetic"] = verify_signal_list(
-            signals.get("mods_cosmetic", []), original_text, category="mods_cosmetic"
+            signals.get("mods_cosmetic", []), original_text, category="mods_cosmetic",
+            original_normalized=original_normalized,
         )
         signals["seller_behavior"] = verify_signal_list(
-            signals.get("seller_behavior", []), original_text, category="seller_behavior"
+            signals.get("seller_behavior", []), original_text, category="seller_behavior",
+            original_normalized=original_normalized,
         )
     
     # Verify maintenance claims
     if "maintenance" in payload:
         maintenance = payload["maintenance"]
         maintenance["claims"] = verify_maintenance_claims(
-            maintenance.get("claims", []), original_text
+            maintenance.get("claims", []), original_text,
+            original_normalized=original_normalized,
         )
         maintenance["red_flags"] = verify_signal_list(
-            maintenance.get("red_flags", []), original_text
+            maintenance.get("red_flags", []), original_text,
+            original_normalized=original_normalized,
         )
     
     return extraction_result
@@ -84,6 +100,7 @@ def verify_signal_list(
     signals: List[Dict[str, Any]],
     original_text: str,
     category: str = None,
+    original_normalized: Optional[str] = None,
 ) -> List[Dict[str, Any]]:
     """
     Verify a list of signals, rejecting those without valid evidence or invalid types.
@@ -92,14 +109,20 @@ def verify_signal_list(
         signals: List of signal dictionaries
         original_text: Original text to check against
         category: Signal category name for type validation
+        original_normalized: Optional precomputed normalized original text
         
     Returns:
         List of verified signals only
     """
+    if original_normalized is None:
+        original_normalized = normalize_for_match(original_text)
+    
     verified_signals = []
     
     for signal in signals:
-        verified_signal = verify_single_signal(signal, original_text, category=category)
+        verified_signal = verify_single_signal(
+            signal, original_text, category=category, original_normalized=original_normalized
+        )
         if verified_signal is not None:
             verified_signals.append(verified_signal)
     
@@ -136,6 +159,7 @@ def verify_single_signal(
     signal: Dict[str, Any],
     original_text: str,
     category: str = None,
+    original_normalized: Optional[str] = None,
 ) -> Optional[Dict[str, Any]]:
     """
     Verify a single signal has valid evidence and type.
@@ -144,6 +168,7 @@ def verify_single_signal(
         signal: Signal dictionary with evidence_text
         original_text: Original text to check against
         category: Optional category name for type validation
+        original_normalized: Optional precomputed normalized original text
         
     Returns:
         Verified signal or None if rejected
@@ -160,7 +185,7 @@ def verify_single_signal(
         return None
     
     # Check if evidence exists in original text
-    if not check_evidence_exists(evidence_text, original_text):
+    if not check_evidence_exists(evidence_text, original_text, original_normalized):
         # Evidence not found - reject
         return None
     
@@ -187,6 +212,7 @@ def verify_single_signal(
 def verify_maintenance_claims(
     claims: List[Dict[str, Any]],
     original_text: str,
+    original_normalized: Optional[str] = None,
 ) -> List[Dict[str, Any]]:
     """
     Verify maintenance claims have valid evidence.
@@ -194,10 +220,14 @@ def verify_maintenance_claims(
     Args:
         claims: List of maintenance claim dictionaries
         original_text: Original text to check against
+        original_normalized: Optional precomputed normalized original text
         
     Returns:
         List of verified claims only
     """
+    if original_normalized is None:
+        original_normalized = normalize_for_match(original_text)
+    
     verified_claims = []
     
     for claim in claims:
@@ -206,7 +236,7 @@ def verify_maintenance_claims(
         if not evidence_text:
             continue
             
-        if not check_evidence_exists(evidence_text, original_text):
+        if not check_evidence_exists(evidence_text, original_text, original_normalized):
             continue
         
         # Evidence valid - keep claim
@@ -12,9 +12,15 @@ Rules:
 """
 
 import re
-from typing import Any, Dict, List, Set
+from functools import cache
+from typing import Any, Dict, List, Optional, Set, Tuple
 
-from config import GUARDRAIL_DEFAULT_CONFIDENCE
+try:
+    import hyperscan
+except ImportError:  # pragma: no cover - optional speedup
+    hyperscan = None
+
+from config import GUARDRAIL_DEFAULT_CONFIDENCE, USE_HYPERSCAN
 from stage4.text_prep import PreparedText, find_evidence_span
 
 
@@ -120,6 +126,110 @@ ALL_RULES = (
 )
 
 
+def _group_rules_by_category(rules: List[Tuple[str, str, str, str]]):
+    """
+    Compile rules into (category, prefilter, compiled_rules) groups.
+    
+    Each compiled rule is (rule_id, regex, signal_type, severity), where
+    rule_id is the rule's index in `rules`.
+    
+    The prefilter is one alternation of the category's patterns: if it
+    finds nothing, none of the category's rules can match and they are
+    skipped. Rules themselves stay separate because overlapping rules,
+    e.g. "write off" inside "repairable write off", must each match.
+    Categories and rules keep their ALL_RULES order.
+    
+    Patterns are compiled without IGNORECASE: they are all lowercase and
+    only ever run against PreparedText.normalized_text, which is already
+    lowercased, so case folding would be wasted work per character.
+    """
+    grouped: Dict[str, List[Tuple[int, Tuple[str, str, str, str]]]] = {}
+    for rule_id, rule in enumerate(rules):
+        grouped.setdefault(rule[2], []).append((rule_id, rule))
+    
+    return [
+        (
+            category,
+            re.compile("|".join(f"(?:{rule[0]})" for _, rule in category_rules)),
+            [
+                (rule_id, re.compile(pattern), signal_type, severity)
+                for rule_id, (pattern, signal_type, _, severity) in category_rules
+            ],
+        )
+        for category, category_rules in grouped.items()
+    ]
+
+
+@cache
+def _rules_by_category():
+    """
+    Compiled rule groups for ALL_RULES, built on first use.
+    
+    Built lazily so importing this module (e.g. for check_high_risk_keywords)
+    does not compile every rule, then shared by all later calls.
+    """
+    return _group_rules_by_category(ALL_RULES)
+
+
+@cache
+def _hyperscan_db():
+    """
+    Hyperscan database of ALL_RULES, or None when unavailable.
+    
+    Scanning with it reports which rules match anywhere in the text in a
+    single pass, so run_guardrails only runs those rules' regexes (which
+    still produce the actual matches and evidence). Returns None when
+    hyperscan is not installed, disabled via USE_HYPERSCAN, or cannot
+    compile a pattern.
+    """
+    if hyperscan is None or not USE_HYPERSCAN:
+        return None
+    
+    db = hyperscan.Database()
+    try:
+        db.compile(
+            expressions=[pattern.encode("utf-8") for pattern, _, _, _ in ALL_RULES],
+            ids=list(range(len(ALL_RULES))),
+            flags=hyperscan.HS_FLAG_SINGLEMATCH | hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP,
+        )
+    except Exception:
+        # Leave disabled; the per-category prefilters handle it
+        return None
+    return db
+
+
+def _matching_rule_ids(text: str) -> Optional[Set[int]]:
+    """Rule ids matching text via Hyperscan, or None if it is unavailable."""
+    db = _hyperscan_db()
+    if db is None:
+        return None
+    
+    matched: Set[int] = set()
+    
+    def on_match(rule_id, start, end, flags, context):
+        matched.add(rule_id)
+    
+    db.scan(text.encode("utf-8"), match_event_handler=on_match)
+    return matched
+
+
+# High-risk keywords for source_text_stats.contains_keywords_high_risk,
+# compiled into one alternation so the check is a single regex pass
+HIGH_RISK_PATTERNS = [
+    r'\bwrite[\s-]?off\b',
+    r'\bdefect(?:ed)?\b',
+    r'\bnot\s*running\b',
+    r'\bsalvage\b',
+    r'\bflood\b',
+    r'\bstructural\s*damage\b',
+    r'\bstage\s*[23]\b',
+    r'\be85\b',
+    r'\btrack\s*(?:car|use)\b',
+]
+
+_HIGH_RISK_RE = re.compile("|".join(f"(?:{pattern})" for pattern in HIGH_RISK_PATTERNS))
+
+
 # ============================================================================
 # Main Guardrail Functions
 # ============================================================================
@@ -147,38 +257,49 @@ def run_guardrails(prepared_text: PreparedText) -> Dict[str, List[Dict[str, Any]
     # Track what we've already detected to avoid duplicates
     detected = set()
     
-    for pattern, signal_type, category, severity in ALL_RULES:
-        # Search in normalized (lowercase) text
-        matches = list(re.finditer(pattern, prepared_text.normalized_text, re.IGNORECASE))
+    text = prepared_text.normalized_text
+    matched_ids = _matching_rule_ids(text)
+    
+    for category, prefilter, rules in _rules_by_category():
+        # One pass over the text rules out categories with no matches
+        if matched_ids is None and prefilter.search(text) is None:
+            continue
         
-        for match in matches:
-            # Create unique key for deduplication
-            key = (category, signal_type, match.group().lower())
-            if key in detected:
+        for rule_id, regex, signal_type, severity in rules:
+            if matched_ids is not None and rule_id not in matched_ids:
                 continue
-            detected.add(key)
-            
-            # Find evidence span in original text
-            evidence = find_evidence_span(
-                match.group(),
-                prepared_text.combined_text,
-                prepared_text.sentences,
-            )
-            
-            if not evidence:
-                # Fallback to the match itself if we can't find context
-                evidence = match.group()
             
-            # Create signal
-            signal = {
-                "type": signal_type,
-                "severity": severity,
-                "verification_level": "verified",
-                "evidence_text": evidence,
-                "confidence": GUARDRAIL_DEFAULT_CONFIDENCE,
-            }
-            
-            signals[category].append(signal)
+            # Search in normalized (lowercase) text
+            for match in regex.finditer(text):
+                # Create unique key for deduplication
+                key = (category, signal_type, match.group())
+                if key in detected:
+                    continue
+                detected.add(key)
+                
+                # Find evidence span in original text
+                evidence = find_evidence_span(
+                    match.group(),
+                    prepared_text.combined_text,
+                    prepared_text.sentences,
+                    sentence_offsets=prepared_text.sentence_offsets or None,
+                    text_lower=prepared_text.combined_lower or None,
+                )
+                
+                if not evidence:
+                    # Fallback to the match itself if we can't find context
+                    evidence = match.group()
+                
+                # Create signal
+                signal = {
+                    "type": signal_type,
+                    "severity": severity,
+                    "verification_level": "verified",
+                    "evidence_text": evidence,
+                    "confidence": GUARDRAIL_DEFAULT_CONFIDENCE,
+                }
+                
+                signals[category].append(signal)
     
     return signals
 
@@ -195,25 +316,7 @@ def check_high_risk_keywords(text: str) -> bool:
     Returns:
         True if any high-risk keyword found
     """
-    text_lower = text.lower()
-    
-    high_risk_patterns = [
-        r'\bwrite[\s-]?off\b',
-        r'\bdefect(?:ed)?\b',
-        r'\bnot\s*running\b',
-        r'\bsalvage\b',
-        r'\bflood\b',
-        r'\bstructural\s*damage\b',
-        r'\bstage\s*[23]\b',
-        r'\be85\b',
-        r'\btrack\s*(?:car|use)\b',
-    ]
-    
-    for pattern in high_risk_patterns:
-        if re.search(pattern, text_lower):
-            return True
-    
-    return False
+    return _HIGH_RISK_RE.search(text.lower()) is not None
 
 
 def get_guardrail_categories() -> List[str]:
@@ -13,8 +13,6 @@ from pathlib import Path
 from typing import Any, Optional, Dict, List, Tuple
 from dataclasses import dataclass
 
-from openai import OpenAI, APIError, APITimeoutError, RateLimitError
-
 from config import (
     get_openai_api_key,
     DEFAULT_MODEL,
@@ -28,6 +26,7 @@ from config import (
     EXTRACTOR_PROMPT_PATH,
 )
 from stage4.extraction_schema import get_extraction_schema_for_openai
+from common import json_utils
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -93,6 +92,7 @@ class TokenUsage:
     completion_tokens: int
     total_tokens: int
     model: str
+    batch: bool = False  # Billed through the Batch API
 
 
 def extract_with_llm(
@@ -180,6 +180,53 @@ def extract_with_llm(
         ), None
 
 
+# System message shared by the online and Batch API request paths
+EXTRACTOR_SYSTEM_MESSAGE = (
+    "You are a precise JSON extraction assistant for vehicle listings. "
+    "Extract signals, maintenance info, and summaries from the listing text. "
+    "Only include signals with verbatim evidence from the text. "
+    "Output valid JSON matching the schema."
+)
+
+
+def build_chat_request(
+    prompt: str,
+    model: str,
+    use_structured_output: bool = True,
+) -> Dict[str, Any]:
+    """
+    Build the chat-completion request body for an extraction prompt.
+    
+    The body is also used verbatim as the "body" of Batch API request lines,
+    so it must not contain client-only options such as timeout.
+    
+    Args:
+        prompt: Complete prompt to send
+        model: Model to use
+        use_structured_output: Whether to use JSON schema mode
+        
+    Returns:
+        Request parameters dictionary
+    """
+    request_params = {
+        "model": model,
+        "messages": [
+            {"role": "system", "content": EXTRACTOR_SYSTEM_MESSAGE},
+            {"role": "user", "content": prompt},
+        ],
+        "temperature": DEFAULT_TEMPERATURE,
+        "max_tokens": MAX_OUTPUT_TOKENS,
+    }
+    
+    # Add structured output format if enabled
+    if use_structured_output:
+        request_params["response_format"] = {
+            "type": "json_object"
+        }
+    
+    return request_params
+
+
 def call_openai_with_retry(
     prompt: str,
     model: str,
@@ -200,40 +247,18 @@ def call_openai_with_retry(
     Returns:
         Tuple of (parsed response dict or None on failure, total tokens used or None)
     """
+    # Imported here so importing this module (e.g. for create_fallback_output
+    # on the skip_llm path) does not pay the openai package import cost
+    from openai import OpenAI, APIError, APITimeoutError, RateLimitError
+    
     client = OpenAI(api_key=get_openai_api_key())
     
     for attempt in range(max_retries):
         try:
             logger.debug(f"OpenAI API call attempt {attempt + 1}/{max_retries}")
             
-            # Build request parameters
-            request_params = {
-                "model": model,
-                "messages": [
-                    {
-                        "role": "system",
-                        "content": (
-                            "You are a precise JSON extraction assistant for vehicle listings. "
-                            "Extract signals, maintenance info, and summaries from the listing text. "
-                            "Only include signals with verbatim evidence from the text. "
-                            "Output valid JSON matching the schema."
-                        )
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                "temperature": DEFAULT_TEMPERATURE,
-                "max_tokens": MAX_OUTPUT_TOKENS,
-                "timeout": OPENAI_TIMEOUT,
-            }
-            
-            # Add structured output format if enabled
-            if use_structured_output:
-                request_params["response_format"] = {
-                    "type": "json_object"
-                }
+            request_params = build_chat_request(prompt, model, use_structured_output)
+            request_params["timeout"] = OPENAI_TIMEOUT
             
             response = client.chat.completions.create(**request_params)
             
@@ -320,7 +345,7 @@ def parse_llm_response(response_text: str) -> Dict[str, Any]:
             lines = lines[:-1]
         text = "\n".join(lines)
     
-    return json.loads(text)
+    return json_utils.loads(text)
 
 
 def build_llm_output(
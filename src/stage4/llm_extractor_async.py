@@ -10,7 +10,7 @@ import json
 import logging
 import time
 from datetime import datetime, timezone
-from typing import Any, Optional, Dict, List
+from typing import Any, Optional, Dict, List, Tuple
 
 import httpx
 from openai import AsyncOpenAI, APIError, APITimeoutError, RateLimitError
@@ -18,8 +18,6 @@ from openai import AsyncOpenAI, APIError, APITimeoutError, RateLimitError
 from config import (
     get_openai_api_key,
     DEFAULT_MODEL,
-    DEFAULT_TEMPERATURE,
-    MAX_OUTPUT_TOKENS,
     OPENAI_TIMEOUT,
     MAX_RETRIES,
     RETRY_DELAY_BASE,
@@ -27,7 +25,9 @@ from config import (
     RULESET_VERSION,
 )
 from stage4.llm_extractor import (
+    TokenUsage,
     build_extraction_prompt,
+    build_chat_request,
     parse_llm_response,
     build_llm_output,
     create_fallback_output,
@@ -47,7 +47,8 @@ async def extract_with_llm_async(
     mileage: Optional[int] = None,
     model: str = DEFAULT_MODEL,
     use_structured_output: bool = True,
-) -> Dict[str, Any]:
+    client: Optional[AsyncOpenAI] = None,
+) -> Tuple[Dict[str, Any], Optional[TokenUsage]]:
     """
     Extract structured intelligence from listing using LLM (async version).
     
@@ -61,9 +62,10 @@ async def extract_with_llm_async(
         mileage: Odometer reading
         model: OpenAI model to use
         use_structured_output: Whether to use JSON mode
+        client: Optional shared AsyncOpenAI client (created per call if None)
         
     Returns:
-        Parsed extraction result or fallback structure on failure
+        Tuple of (parsed extraction result or fallback structure on failure, token usage or None)
     """
     logger.info(f"Starting async LLM extraction for listing {listing_id}")
     start_time = time.time()
@@ -79,10 +81,11 @@ async def extract_with_llm_async(
     )
     
     # Call OpenAI with retries
-    extraction_result = await call_openai_async(
+    extraction_result, token_usage = await call_openai_async(
         prompt=prompt,
         model=model,
         use_structured_output=use_structured_output,
+        client=client,
     )
     
     elapsed = time.time() - start_time
@@ -96,7 +99,7 @@ async def extract_with_llm_async(
             title=title,
             description=description,
             warning="LLM extraction failed after retries",
-        )
+        ), None
     
     # Build full output structure from extraction
     try:
@@ -108,7 +111,7 @@ async def extract_with_llm_async(
             description=description,
             model=model,
         )
-        return result
+        return result, token_usage
         
     except Exception as e:
         logger.error(f"Error building output for listing {listing_id}: {e}")
@@ -118,7 +121,7 @@ async def extract_with_llm_async(
             title=title,
             description=description,
             warning=f"Error processing LLM output: {str(e)}",
-        )
+        ), None
 
 
 async def call_openai_async(
@@ -126,7 +129,8 @@ async def call_openai_async(
     model: str,
     max_retries: int = MAX_RETRIES,
     use_structured_output: bool = True,
-) -> Optional[Dict[str, Any]]:
+    client: Optional[AsyncOpenAI] = None,
+) -> Tuple[Optional[Dict[str, Any]], Optional[TokenUsage]]:
     """
     Call OpenAI API asynchronously with exponential backoff retry.
     
@@ -135,54 +139,40 @@ async def call_openai_async(
         model: Model to use
         max_retries: Maximum retry attempts
         use_structured_output: Whether to use JSON mode
+        client: Optional shared AsyncOpenAI client (created per call if None)
         
     Returns:
-        Parsed response dict or None on failure
+        Tuple of (parsed response dict or None on failure, token usage or None)
     """
-    client = AsyncOpenAI(api_key=get_openai_api_key())
+    if client is None:
+        client = AsyncOpenAI(api_key=get_openai_api_key())
     
     for attempt in range(max_retries):
         try:
             logger.debug(f"Async OpenAI API call attempt {attempt + 1}/{max_retries}")
             
-            # Build request parameters
-            request_params = {
-                "model": model,
-                "messages": [
-                    {
-                        "role": "system",
-                        "content": (
-                            "You are a precise JSON extraction assistant for vehicle listings. "
-                            "Extract signals, maintenance info, and summaries from the listing text. "
-                            "Only include signals with verbatim evidence from the text. "
-                            "Output valid JSON matching the schema."
-                        )
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                "temperature": DEFAULT_TEMPERATURE,
-                "max_tokens": MAX_OUTPUT_TOKENS,
-                "timeout": OPENAI_TIMEOUT,
-            }
-            
-            if use_structured_output:
-                request_params["response_format"] = {"type": "json_object"}
+            request_params = build_chat_request(prompt, model, use_structured_output)
+            request_params["timeout"] = OPENAI_TIMEOUT
             
             response = await client.chat.completions.create(**request_params)
             
             response_text = response.choices[0].message.content
             
-            # Log token usage
+            # Extract and log token usage
+            token_usage = None
             if response.usage:
+                token_usage = TokenUsage(
+                    prompt_tokens=response.usage.prompt_tokens,
+                    completion_tokens=response.usage.completion_tokens,
+                    total_tokens=response.usage.total_tokens,
+                    model=model
+                )
                 logger.info(
-                    f"Token usage: prompt={response.usage.prompt_tokens}, "
-                    f"completion={response.usage.completion_tokens}"
+                    f"Token usage: prompt={token_usage.prompt_tokens}, "
+                    f"completion={token_usage.completion_tokens}"
                 )
             
-            return parse_llm_response(response_text)
+            return parse_llm_response(response_text), token_usage
             
         except RateLimitError as e:
             logger.warning(f"Rate limit error: {e}")
@@ -192,7 +182,7 @@ async def call_openai_async(
                 await asyncio.sleep(delay)
             else:
                 logger.error("Max retries exceeded due to rate limiting")
-                return None
+                return None, None
                 
         except (APIError, APITimeoutError) as e:
             logger.warning(f"API error: {e}")
@@ -202,20 +192,20 @@ async def call_openai_async(
                 await asyncio.sleep(delay)
             else:
                 logger.error(f"Max retries exceeded: {e}")
-                return None
+                return None, None
                 
         except json.JSONDecodeError as e:
             logger.error(f"JSON parse error: {e}")
             if attempt < max_retries - 1:
                 await asyncio.sleep(RETRY_DELAY_BASE)
             else:
-                return None
+                return None, None
                 
         except Exception as e:
             logger.error(f"Unexpected error: {e}")
-            return None
+            return None, None
     
-    return None
+    return None, None
 
 
 async def extract_batch_async(
@@ -238,7 +228,7 @@ async def extract_batch_async(
     
     async def extract_with_semaphore(listing: Dict[str, Any]) -> Dict[str, Any]:
         async with semaphore:
-            return await extract_with_llm_async(
+            result, _ = await extract_with_llm_async(
                 listing_id=str(listing.get("listing_id", "unknown")),
                 source_snapshot_id=str(listing.get("listing_id", "unknown")),
                 title=listing.get("title", ""),
@@ -248,6 +238,7 @@ async def extract_batch_async(
                 mileage=listing.get("mileage"),
                 model=model,
             )
+            return result
     
     logger.info(f"Starting async batch extraction of {len(listings)} listings")
     start_time = time.time()
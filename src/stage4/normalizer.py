@@ -191,6 +191,45 @@ VALID_MAINTENANCE_CLAIM_TYPES = {
     "other"  # Fallback for unknown types
 }
 
+# Signal categories in schema order
+SIGNAL_CATEGORIES = (
+    "legality",
+    "accident_history",
+    "mechanical_issues",
+    "cosmetic_issues",
+    "mods_performance",
+    "mods_cosmetic",
+    "seller_behavior",
+)
+
+# Maps lowercased severity / verification_level values (including common LLM
+# synonyms) to valid schema values; anything else falls back to the default
+SEVERITY_MAPPING: Dict[str, str] = {
+    "low": "low",
+    "medium": "medium",
+    "high": "high",
+    "minor": "low",
+    "med": "medium",
+    "moderate": "medium",
+    "severe": "high",
+    "critical": "high",
+}
+
+VERIFICATION_LEVEL_MAPPING: Dict[str, str] = {
+    "verified": "verified",
+    "inferred": "inferred",
+    "confirmed": "verified",
+    "explicit": "verified",
+    "implied": "inferred",
+}
+
+# Schema-loaded valid values, resolved once at import and shared by every
+# SignalNormalizer instance
+_VALID_SIGNAL_TYPES = get_all_signal_types()
+_VALID_EVIDENCE_PRESENT = get_evidence_present_types()
+_VALID_CLAIM_TYPES = get_maintenance_claim_types()
+_VALID_RED_FLAG_TYPES = get_red_flag_types()
+
 
 class SignalNormalizer:
     """
@@ -198,13 +237,20 @@ class SignalNormalizer:
     
     Provides graceful handling of variations without rejecting valid data.
     """
-    
+
+    __slots__ = (
+        "_valid_signal_types",
+        "_valid_evidence_present",
+        "_valid_claim_types",
+        "_valid_red_flag_types",
+    )
+
     def __init__(self):
-        """Initialize normalizer with schema-loaded valid values."""
-        self._valid_signal_types = get_all_signal_types()
-        self._valid_evidence_present = get_evidence_present_types()
-        self._valid_claim_types = get_maintenance_claim_types()
-        self._valid_red_flag_types = get_red_flag_types()
+        """Initialize normalizer with the shared schema-loaded valid values."""
+        self._valid_signal_types = _VALID_SIGNAL_TYPES
+        self._valid_evidence_present = _VALID_EVIDENCE_PRESENT
+        self._valid_claim_types = _VALID_CLAIM_TYPES
+        self._valid_red_flag_types = _VALID_RED_FLAG_TYPES
     
     def normalize_signal_type(
         self,
@@ -237,10 +283,10 @@ class SignalNormalizer:
         if type_lower in valid_types:
             return type_lower
         
-        # Try mapping
-        mapping_key = (category, type_lower)
-        if mapping_key in SIGNAL_TYPE_MAPPING:
-            mapped = SIGNAL_TYPE_MAPPING[mapping_key]
+        # Try mapping (single hash probe; the table is small enough that a
+        # plain dict beats any compressed structure on both lookup and RSS)
+        mapped = SIGNAL_TYPE_MAPPING.get((category, type_lower))
+        if mapped is not None:
             logger.debug(f"Mapped signal type '{signal_type}' -> '{mapped}'")
             return mapped
         
@@ -282,8 +328,8 @@ class SignalNormalizer:
             return value_lower
         
         # Try mapping
-        if value_lower in EVIDENCE_PRESENT_MAPPING:
-            mapped = EVIDENCE_PRESENT_MAPPING[value_lower]
+        mapped = EVIDENCE_PRESENT_MAPPING.get(value_lower)
+        if mapped is not None:
             logger.debug(f"Mapped evidence_present '{value}' -> '{mapped}'")
             return mapped
         
@@ -357,28 +403,20 @@ class SignalNormalizer:
         normalized_type = self.normalize_signal_type(raw_type, category)
         
         # Create normalized signal with only allowed properties
+        # Severity and verification_level are mapped to valid values with a
+        # single lookup each (unknown values fall back to the defaults)
         normalized = {
             "type": normalized_type,
-            "severity": signal.get("severity", "medium"),
-            "verification_level": signal.get("verification_level", "inferred"),
+            "severity": SEVERITY_MAPPING.get(
+                str(signal.get("severity", "medium")).lower(), "medium"
+            ),
+            "verification_level": VERIFICATION_LEVEL_MAPPING.get(
+                str(signal.get("verification_level", "inferred")).lower(), "inferred"
+            ),
             "evidence_text": evidence_text,
             "confidence": signal.get("confidence", 0.5),
         }
         
-        # Ensure severity is valid
-        severity = str(normalized["severity"]).lower()
-        if severity not in {"low", "medium", "high"}:
-            normalized["severity"] = "medium"
-        else:
-            normalized["severity"] = severity
-        
-        # Ensure verification_level is valid
-        verification = str(normalized["verification_level"]).lower()
-        if verification not in {"verified", "inferred"}:
-            normalized["verification_level"] = "inferred"
-        else:
-            normalized["verification_level"] = verification
-        
         # Ensure confidence is in valid range
         confidence = normalized["confidence"]
         if not isinstance(confidence, (int, float)):
@@ -400,22 +438,15 @@ class SignalNormalizer:
         Returns:
             Normalized signals dict with only valid signals
         """
-        normalized = {}
-        
-        for category in ["legality", "accident_history", "mechanical_issues",
-                         "cosmetic_issues", "mods_performance", "mods_cosmetic",
-                         "seller_behavior"]:
-            raw_list = signals.get(category, [])
-            normalized_list = []
-            
-            for signal in raw_list:
-                result = self.normalize_signal(signal, category)
-                if result:
-                    normalized_list.append(result)
-            
-            normalized[category] = normalized_list
-        
-        return normalized
+        normalize_signal = self.normalize_signal
+        return {
+            category: [
+                result
+                for signal in signals.get(category, ())
+                if (result := normalize_signal(signal, category)) is not None
+            ]
+            for category in SIGNAL_CATEGORIES
+        }
     
     def normalize_maintenance_claim_type(
         self,
@@ -442,8 +473,8 @@ class SignalNormalizer:
             return type_lower
         
         # Try mapping
-        if type_lower in MAINTENANCE_CLAIM_MAPPING:
-            mapped = MAINTENANCE_CLAIM_MAPPING[type_lower]
+        mapped = MAINTENANCE_CLAIM_MAPPING.get(type_lower)
+        if mapped is not None:
             logger.debug(f"Mapped maintenance claim type '{claim_type}' -> '{mapped}'")
             return mapped
         
@@ -487,13 +518,11 @@ class SignalNormalizer:
             "details": claim.get("details"),  # Can be null
             "evidence_text": evidence_text,
             "confidence": max(0.0, min(1.0, float(claim.get("confidence", 0.5)))),
-            "verification_level": claim.get("verification_level", "inferred"),
+            "verification_level": VERIFICATION_LEVEL_MAPPING.get(
+                str(claim.get("verification_level", "inferred")).lower(), "inferred"
+            ),
         }
         
-        # Ensure verification_level is valid
-        if normalized["verification_level"] not in {"verified", "inferred"}:
-            normalized["verification_level"] = "inferred"
-        
         return normalized
     
     def normalize_red_flag_type(
@@ -561,20 +590,16 @@ class SignalNormalizer:
         # Build normalized red flag with required properties
         normalized = {
             "type": normalized_type,
-            "severity": flag.get("severity", "medium"),
-            "verification_level": flag.get("verification_level", "inferred"),
+            "severity": SEVERITY_MAPPING.get(
+                str(flag.get("severity", "medium")).lower(), "medium"
+            ),
+            "verification_level": VERIFICATION_LEVEL_MAPPING.get(
+                str(flag.get("verification_level", "inferred")).lower(), "inferred"
+            ),
             "evidence_text": evidence_text,
             "confidence": max(0.0, min(1.0, float(flag.get("confidence", 0.5)))),
         }
         
-        # Ensure severity is valid
-        if normalized["severity"] not in {"low", "medium", "high"}:
-            normalized["severity"] = "medium"
-        
-        # Ensure verification_level is valid
-        if normalized["verification_level"] not in {"verified", "inferred"}:
-            normalized["verification_level"] = "inferred"
-        
         return normalized
     
     def normalize_missing_info_type(
@@ -14,25 +14,45 @@ Orchestrates the full Stage 4 extraction pipeline:
 Includes comprehensive logging and metrics collection.
 """
 
+import asyncio
+import copy
+import itertools
 import logging
 import time
-from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import cache, partial
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from pathlib import Path
+from threading import Lock
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Union
 
 from config import (
+    get_openai_api_key,
     STAGE_VERSION,
     RULESET_VERSION,
     DEFAULT_MODEL,
     SHORT_DESCRIPTION_THRESHOLD,
+    BATCH_CONCURRENCY,
+    BATCH_PROCESS_POOL_MIN_SIZE,
+    BATCH_MAX_WORKERS,
+    DEEP_VALIDATE_EVERY,
+    MERGE_CACHE_ENABLED,
+)
+from stage4.text_prep import _DATACLASS_KWARGS, normalize_text, PreparedText
+from stage4.llm_extractor import (
+    extract_with_llm,
+    create_fallback_output,
+    build_extraction_prompt,
+    build_chat_request,
+    build_llm_output,
+    parse_llm_response,
+    TokenUsage,
 )
-from stage4.text_prep import normalize_text, PreparedText
-from stage4.llm_extractor import extract_with_llm, create_fallback_output
 from stage4.evidence_verifier import verify_signals
 from stage4.guardrails import run_guardrails, check_high_risk_keywords
 from stage4.merger import merge_signals, merge_maintenance
 from stage4.derived_fields import compute_derived_fields
-from stage4.schema_validator import validate_stage4_output, validate_or_raise
 from stage4.normalizer import normalize_missing_info_list
 from common.metrics import (
     get_metrics,
@@ -45,12 +65,53 @@ from common.metrics import (
 from common.cost_calculator import calculate_cost, format_cost, TokenUsage as CostTokenUsage
 from common.cost_tracker import record_token_usage
 from common.persistent_cost_tracker import record_usage_persistent
+from common import json_utils
+from common.caching import get_merge_cache, make_cache_key
+
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+# Counts validated outputs for sampled deep validation (DEEP_VALIDATE_EVERY)
+_validation_counter = itertools.count()
+
+
+# ============================================================================
+# Lazy module loaders
+# ============================================================================
+# The openai package (and to a lesser extent jsonschema) dominates import
+# time, so modules that need them are only imported on first use.
+# skip_llm runs and guardrail-only callers never pay for openai.
+
+@cache
+def _openai():
+    import openai
+    return openai
+
+
+@cache
+def _llm_async():
+    from stage4 import llm_extractor_async
+    return llm_extractor_async
+
+
+@cache
+def _openai_batch():
+    from common import openai_batch
+    return openai_batch
+
+
+@cache
+def _validator_mod():
+    # jsonschema is only needed when validate=True
+    from stage4 import schema_validator
+    return schema_validator
+
+
+@dataclass(**_DATACLASS_KWARGS)
 class PipelineResult:
     """
     Result container for pipeline execution.
@@ -60,14 +121,89 @@ class PipelineResult:
     success: bool
     output: Optional[Dict[str, Any]]
     error: Optional[Exception] = None
-    warnings: List[str] = None
-    metrics: Dict[str, Any] = None
+    warnings: List[str] = field(default_factory=list)
+    metrics: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass(**_DATACLASS_KWARGS)
+class BatchSummary:
+    """
+    Summary of a batch run whose results were streamed to a sink.
     
-    def __post_init__(self):
-        if self.warnings is None:
-            self.warnings = []
-        if self.metrics is None:
-            self.metrics = {}
+    Returned by the batch runners instead of the result list when a sink
+    is given, so outputs are not all held in memory.
+    """
+    total: int
+    success_count: int
+    error_count: int
+    total_time_s: float
+
+
+# Callable receiving each PipelineResult as soon as it is ready
+ResultSink = Callable[[PipelineResult], None]
+
+
+class JsonlSink:
+    """
+    Batch sink that writes each result's output as one JSON line.
+    
+    Usable as a context manager; thread-safe, so it can be shared by the
+    async batch runner's worker threads.
+    
+    Example:
+        with JsonlSink("stage4_outputs.jsonl") as sink:
+            summary = run_stage4_batch(listings, sink=sink)
+    """
+    
+    def __init__(self, path: Union[str, Path]):
+        self._file = open(path, "wb")
+        self._lock = Lock()
+    
+    def __call__(self, result: PipelineResult) -> None:
+        line = json_utils.dumps(result.output) + b"\n"
+        with self._lock:
+            self._file.write(line)
+    
+    def close(self) -> None:
+        self._file.close()
+    
+    def __enter__(self) -> "JsonlSink":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class _BatchCollector:
+    """Collects batch results in input order, or forwards them to a sink."""
+    
+    def __init__(self, size: int, sink: Optional[ResultSink] = None):
+        self.sink = sink
+        self._results: List[Optional[PipelineResult]] = [None] * size if sink is None else []
+        self._size = size
+        self._success_count = 0
+        self._lock = Lock()
+    
+    def add(self, index: int, result: PipelineResult) -> None:
+        """Record the result for listings[index]."""
+        if self.sink is not None:
+            self.sink(result)
+        else:
+            self._results[index] = result
+        with self._lock:
+            self._success_count += result.success
+    
+    def finish(self, total_time: float) -> Union[List[PipelineResult], BatchSummary]:
+        """Record batch metrics; return the results (or a summary if sinking)."""
+        _record_batch_metrics(self._size, self._success_count, total_time)
+        if self.sink is not None:
+            return BatchSummary(
+                total=self._size,
+                success_count=self._success_count,
+                error_count=self._size - self._success_count,
+                total_time_s=total_time,
+            )
+        return self._results
 
 
 def run_stage4(
@@ -76,6 +212,8 @@ def run_stage4(
     skip_llm: bool = False,
     model: str = DEFAULT_MODEL,
     validate: bool = True,
+    prepared_text: Optional[PreparedText] = None,
+    created_at: Optional[str] = None,
 ) -> Dict[str, Any]:
     """
     Run the complete Stage 4 pipeline on a listing.
@@ -89,6 +227,10 @@ def run_stage4(
         skip_llm: If True, only run guardrail rules (for testing)
         model: OpenAI model to use
         validate: If True, validate output against schema
+        prepared_text: Optional already-normalized text for this listing;
+            computed if not given
+        created_at: Optional ISO-8601 timestamp for the output (batches
+            share one); defaults to now
         
     Returns:
         Stage 4 output dictionary (schema-valid)
@@ -97,30 +239,19 @@ def run_stage4(
         ValidationError: If validate=True and output fails validation
     """
     start_time = time.time()
-    metrics = get_metrics()
     
-    # Extract required fields
-    listing_id = str(listing.get("listing_id", "unknown"))
-    title = listing.get("title", "") or ""
-    description = listing.get("description", "") or ""
+    listing_id, title, description, vehicle_type, price, mileage = _listing_fields(listing)
     
     logger.info(f"Starting Stage 4 pipeline for listing {listing_id}")
     
-    # Optional fields
-    vehicle_type = listing.get("vehicle_type", "unknown")
-    if vehicle_type not in ["car", "bike", "unknown"]:
-        vehicle_type = "unknown"
-    
-    price = listing.get("price")
-    mileage = listing.get("mileage")
-    
     # Use listing_id as snapshot_id if not provided
     if source_snapshot_id is None:
         source_snapshot_id = listing_id
     
     # Step 1: Text preparation
-    with timer("stage4.text_prep"):
-        prepared_text = normalize_text(title, description)
+    if prepared_text is None:
+        with timer("stage4.text_prep"):
+            prepared_text = normalize_text(title, description)
     
     logger.debug(f"Text prepared: {len(prepared_text.combined_text)} chars")
     
@@ -128,13 +259,7 @@ def run_stage4(
     llm_start = time.time()
     if skip_llm:
         logger.info(f"Skipping LLM for listing {listing_id}")
-        llm_result = create_fallback_output(
-            listing_id=listing_id,
-            source_snapshot_id=source_snapshot_id,
-            title=title,
-            description=description,
-            warning="LLM skipped (skip_llm=True)",
-        )
+        llm_result = _skipped_llm_output(listing_id, source_snapshot_id, title, description)
         llm_latency_ms = None
         token_usage = None
     else:
@@ -151,27 +276,210 @@ def run_stage4(
             )
         llm_latency_ms = (time.time() - llm_start) * 1000
         logger.info(f"LLM extraction completed in {llm_latency_ms:.0f}ms")
+        _record_llm_cost(token_usage)
+    
+    return _finalize_from_llm(
+        listing_id=listing_id,
+        source_snapshot_id=source_snapshot_id,
+        title=title,
+        description=description,
+        prepared_text=prepared_text,
+        llm_result=llm_result,
+        model=model if not skip_llm else None,
+        validate=validate,
+        start_time=start_time,
+        token_usage=token_usage,
+        llm_latency_ms=llm_latency_ms,
+        created_at=created_at,
+    )
+
+
+async def run_stage4_async(
+    listing: Dict[str, Any],
+    source_snapshot_id: Optional[str] = None,
+    skip_llm: bool = False,
+    model: str = DEFAULT_MODEL,
+    validate: bool = True,
+    client: Optional["AsyncOpenAI"] = None,
+    created_at: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Run the complete Stage 4 pipeline on a listing (async version).
+    
+    The LLM call is awaited so many listings can overlap their network I/O;
+    the CPU-bound steps after it run inline exactly as in run_stage4.
+    
+    Args:
+        listing: Raw listing dictionary (see run_stage4)
+        source_snapshot_id: Optional snapshot ID (defaults to listing_id)
+        skip_llm: If True, only run guardrail rules (for testing)
+        model: OpenAI model to use
+        validate: If True, validate output against schema
+        client: Optional shared AsyncOpenAI client
+        created_at: Optional ISO-8601 timestamp for the output
         
-        # Calculate cost if token usage is available
-        if token_usage:
-            cost, pricing_info = calculate_cost(
-                token_usage.prompt_tokens,
-                token_usage.completion_tokens,
-                token_usage.model
-            )
-            if pricing_info:
-                logger.info(
-                    f"API call cost: {format_cost(cost)} "
-                    f"(prompt: {format_cost(pricing_info['prompt_cost'])}, "
-                    f"completion: {format_cost(pricing_info['completion_cost'])})"
-                )
-            # Track cost in metrics
-            if cost > 0:
-                metrics.histogram("stage4.llm_cost_usd", cost, tags={"model": token_usage.model})
+    Returns:
+        Stage 4 output dictionary (schema-valid)
+        
+    Raises:
+        ValidationError: If validate=True and output fails validation
+    """
+    finalize_kwargs = await _extract_stage_async(
+        listing=listing,
+        source_snapshot_id=source_snapshot_id,
+        skip_llm=skip_llm,
+        model=model,
+        validate=validate,
+        client=client,
+        created_at=created_at,
+    )
+    return _finalize_from_llm(**finalize_kwargs)
+
+
+async def _extract_stage_async(
+    listing: Dict[str, Any],
+    source_snapshot_id: Optional[str],
+    skip_llm: bool,
+    model: str,
+    validate: bool,
+    client: Optional["AsyncOpenAI"],
+    created_at: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Run the I/O stage of the async pipeline (steps 1-2).
+    
+    Returns:
+        Keyword arguments for _finalize_from_llm
+    """
+    start_time = time.time()
     
+    listing_id, title, description, vehicle_type, price, mileage = _listing_fields(listing)
+    
+    logger.info(f"Starting async Stage 4 pipeline for listing {listing_id}")
+    
+    if source_snapshot_id is None:
+        source_snapshot_id = listing_id
+    
+    with timer("stage4.text_prep"):
+        prepared_text = normalize_text(title, description)
+    
+    llm_start = time.time()
+    if skip_llm:
+        llm_result = _skipped_llm_output(listing_id, source_snapshot_id, title, description)
+        llm_latency_ms = None
+        token_usage = None
+    else:
+        llm_result, token_usage = await _llm_async().extract_with_llm_async(
+            listing_id=listing_id,
+            source_snapshot_id=source_snapshot_id,
+            title=title,
+            description=description,
+            vehicle_type=vehicle_type,
+            price=price,
+            mileage=mileage,
+            model=model,
+            client=client,
+        )
+        llm_latency_ms = (time.time() - llm_start) * 1000
+        get_metrics().timing("stage4.llm_extraction", llm_latency_ms)
+        logger.info(f"LLM extraction completed in {llm_latency_ms:.0f}ms")
+        _record_llm_cost(token_usage)
+    
+    return dict(
+        listing_id=listing_id,
+        source_snapshot_id=source_snapshot_id,
+        title=title,
+        description=description,
+        prepared_text=prepared_text,
+        llm_result=llm_result,
+        model=model if not skip_llm else None,
+        validate=validate,
+        start_time=start_time,
+        token_usage=token_usage,
+        llm_latency_ms=llm_latency_ms,
+        created_at=created_at,
+    )
+
+
+def _listing_fields(
+    listing: Dict[str, Any],
+) -> Tuple[str, str, str, str, Optional[float], Optional[int]]:
+    """
+    Extract the pipeline inputs from a raw listing.
+    
+    Returns:
+        Tuple of (listing_id, title, description, vehicle_type, price, mileage)
+    """
+    listing_id = str(listing.get("listing_id", "unknown"))
+    title = listing.get("title", "") or ""
+    description = listing.get("description", "") or ""
+    
+    vehicle_type = listing.get("vehicle_type", "unknown")
+    if vehicle_type not in ["car", "bike", "unknown"]:
+        vehicle_type = "unknown"
+    
+    return listing_id, title, description, vehicle_type, listing.get("price"), listing.get("mileage")
+
+
+def _skipped_llm_output(
+    listing_id: str,
+    source_snapshot_id: str,
+    title: str,
+    description: str,
+) -> Dict[str, Any]:
+    """Build the empty LLM result used when skip_llm=True."""
+    return create_fallback_output(
+        listing_id=listing_id,
+        source_snapshot_id=source_snapshot_id,
+        title=title,
+        description=description,
+        warning="LLM skipped (skip_llm=True)",
+    )
+
+
+def _record_llm_cost(token_usage: Optional[TokenUsage]) -> None:
+    """Log and record the cost of an LLM call if token usage is available."""
+    if not token_usage:
+        return
+    
+    cost, pricing_info = calculate_cost(
+        token_usage.prompt_tokens,
+        token_usage.completion_tokens,
+        token_usage.model,
+        batch=token_usage.batch
+    )
+    if pricing_info:
+        logger.info(
+            f"API call cost: {format_cost(cost)} "
+            f"(prompt: {format_cost(pricing_info['prompt_cost'])}, "
+            f"completion: {format_cost(pricing_info['completion_cost'])})"
+        )
+    # Track cost in metrics
+    if cost > 0:
+        get_metrics().histogram("stage4.llm_cost_usd", cost, tags={"model": token_usage.model})
+
+
+def _merge_stage(
+    prepared_text: PreparedText,
+    llm_result: Dict[str, Any],
+) -> Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any], Dict[str, Any]]:
+    """
+    Run evidence verification, guardrails, merging and derived fields (steps 3-6).
+    
+    Args:
+        prepared_text: Prepared text for the listing
+        llm_result: LLM extraction result (verified in place)
+        
+    Returns:
+        Tuple of (verified_result, merged_signals, merged_maintenance, derived)
+    """
     # Step 3: Evidence verification
     with timer("stage4.evidence_verification"):
-        verified_result = verify_signals(llm_result, prepared_text.combined_text)
+        verified_result = verify_signals(
+            llm_result,
+            prepared_text.combined_text,
+            original_normalized=prepared_text.normalized_text,
+        )
     
     # Step 4: Guardrail rules
     with timer("stage4.guardrails"):
@@ -190,6 +498,101 @@ def run_stage4(
         llm_maintenance = verified_result.get("payload", {}).get("maintenance", {})
         merged_maintenance = merge_maintenance(llm_maintenance, rule_signals)
     
+    # Step 6: Compute derived fields
+    with timer("stage4.derived_fields"):
+        llm_summaries = {
+            "claimed_condition": verified_result.get("payload", {}).get("claimed_condition", "unknown"),
+            "negotiation_stance": verified_result.get("payload", {}).get("negotiation_stance", "unknown"),
+            "service_history_level": verified_result.get("payload", {}).get("service_history_level", "unknown"),
+            "mods_risk_level": verified_result.get("payload", {}).get("mods_risk_level", "unknown"),
+        }
+        
+        derived = compute_derived_fields(merged_signals, merged_maintenance, llm_summaries)
+    
+    return verified_result, merged_signals, merged_maintenance, derived
+
+
+def _cached_merge_stage(
+    title: str,
+    description: str,
+    prepared_text: PreparedText,
+    llm_result: Dict[str, Any],
+) -> Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any], Dict[str, Any]]:
+    """
+    _merge_stage memoized on (title, description, LLM payload).
+    
+    The cache stores and hands out deep copies, since callers embed the
+    results in outputs that may be mutated later.
+    """
+    # Keyed before verification, which modifies llm_result in place
+    key = make_cache_key(title, description, llm_result.get("payload"))
+    cache = get_merge_cache()
+    
+    cached = cache.get(key)
+    if cached is not None:
+        logger.debug(f"Merge cache hit: {key[:8]}")
+        increment("stage4.merge_cache_hit")
+        return copy.deepcopy(cached)
+    
+    result = _merge_stage(prepared_text, llm_result)
+    cache.set(key, copy.deepcopy(result))
+    return result
+
+
+def _finalize_from_llm(
+    listing_id: str,
+    source_snapshot_id: str,
+    title: str,
+    description: str,
+    prepared_text: PreparedText,
+    llm_result: Dict[str, Any],
+    model: Optional[str],
+    validate: bool,
+    start_time: float,
+    token_usage: Optional[TokenUsage] = None,
+    llm_latency_ms: Optional[float] = None,
+    created_at: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Run the post-LLM pipeline steps (3-8) and record metrics.
+    
+    Shared by the sync, async and batch entry points so every path applies
+    evidence verification, guardrails, merging, derived fields and
+    validation identically.
+    
+    Args:
+        listing_id: Listing identifier
+        source_snapshot_id: Snapshot identifier
+        title: Original title
+        description: Original description
+        prepared_text: Prepared text for the listing
+        llm_result: LLM extraction result (or fallback output)
+        model: Model used (None if LLM skipped)
+        validate: If True, validate output against schema
+        start_time: Pipeline start time (time.time()) for total timing
+        token_usage: Token usage of the LLM call, if any
+        llm_latency_ms: LLM latency in milliseconds, if any
+        created_at: Optional ISO-8601 timestamp for the output
+        
+    Returns:
+        Stage 4 output dictionary
+        
+    Raises:
+        ValidationError: If validate=True and output fails validation
+    """
+    # Steps 3-6 are deterministic given the text and LLM payload, so
+    # repeated listings (e.g. the same ad across snapshots) reuse them
+    if MERGE_CACHE_ENABLED:
+        verified_result, merged_signals, merged_maintenance, derived = _cached_merge_stage(
+            title, description, prepared_text, llm_result
+        )
+    else:
+        verified_result, merged_signals, merged_maintenance, derived = _merge_stage(
+            prepared_text, llm_result
+        )
+    
+    metrics = get_metrics()
+    
     # Count total signals
     total_signals = sum(len(signals) for signals in merged_signals.values())
     histogram("stage4.signals_per_extraction", total_signals)
@@ -204,17 +607,6 @@ def run_stage4(
                 verification_level=signal.get("verification_level", "inferred"),
             )
     
-    # Step 6: Compute derived fields
-    with timer("stage4.derived_fields"):
-        llm_summaries = {
-            "claimed_condition": verified_result.get("payload", {}).get("claimed_condition", "unknown"),
-            "negotiation_stance": verified_result.get("payload", {}).get("negotiation_stance", "unknown"),
-            "service_history_level": verified_result.get("payload", {}).get("service_history_level", "unknown"),
-            "mods_risk_level": verified_result.get("payload", {}).get("mods_risk_level", "unknown"),
-        }
-        
-        derived = compute_derived_fields(merged_signals, merged_maintenance, llm_summaries)
-    
     logger.info(f"Derived fields: risk={derived['risk_level_overall']}, mods={derived['mods_risk_level']}")
     
     # Step 7: Build final output
@@ -227,7 +619,9 @@ def run_stage4(
         maintenance=merged_maintenance,
         derived=derived,
         llm_result=verified_result,
-        model=model if not skip_llm else None,
+        model=model,
+        prepared_text=prepared_text,
+        created_at=created_at,
     )
     
     # Step 8: Validate
@@ -235,7 +629,12 @@ def run_stage4(
     if validate:
         with timer("stage4.validation"):
             try:
-                validate_or_raise(output)
+                # Full validation on every DEEP_VALIDATE_EVERY-th output,
+                # required-keys check on the rest
+                if next(_validation_counter) % DEEP_VALIDATE_EVERY == 0:
+                    _validator_mod().validate_or_raise(output)
+                else:
+                    _validator_mod().shallow_check_or_raise(output)
                 logger.debug("Schema validation passed")
             except Exception as e:
                 validation_passed = False
@@ -251,7 +650,7 @@ def run_stage4(
     
     record_extraction_metrics(
         listing_id=listing_id,
-        llm_used=not skip_llm,
+        llm_used=model is not None,
         llm_latency_ms=llm_latency_ms,
         tokens_used=tokens_used,
         signals_extracted=total_signals,
@@ -264,7 +663,8 @@ def run_stage4(
             prompt_tokens=token_usage.prompt_tokens,
             completion_tokens=token_usage.completion_tokens,
             total_tokens=token_usage.total_tokens,
-            model=token_usage.model
+            model=token_usage.model,
+            batch=token_usage.batch
         )
         # Record for in-memory cost tracking (current session)
         record_token_usage(cost_token_usage)
@@ -282,12 +682,49 @@ def run_stage4(
     return output
 
 
+def run_stage4_bytes(
+    listing: Dict[str, Any],
+    source_snapshot_id: Optional[str] = None,
+    skip_llm: bool = False,
+    model: str = DEFAULT_MODEL,
+    validate: bool = True,
+) -> bytes:
+    """
+    Run the Stage 4 pipeline and return the output serialized as JSON bytes.
+    
+    For callers that write the output straight to a file, queue or HTTP
+    response; serialization uses orjson when installed.
+    
+    Args:
+        listing: Raw listing dictionary (see run_stage4)
+        source_snapshot_id: Optional snapshot ID (defaults to listing_id)
+        skip_llm: If True, only run guardrail rules (for testing)
+        model: OpenAI model to use
+        validate: If True, validate output against schema
+        
+    Returns:
+        UTF-8 encoded JSON of the Stage 4 output
+        
+    Raises:
+        ValidationError: If validate=True and output fails validation
+    """
+    return json_utils.dumps(run_stage4(
+        listing=listing,
+        source_snapshot_id=source_snapshot_id,
+        skip_llm=skip_llm,
+        model=model,
+        validate=validate,
+    ))
+
+
 def run_stage4_safe(
     listing: Dict[str, Any],
     source_snapshot_id: Optional[str] = None,
     skip_llm: bool = False,
     model: str = DEFAULT_MODEL,
     validate: bool = True,
+    prepared_text: Optional[PreparedText] = None,
+    created_at: Optional[str] = None,
 ) -> PipelineResult:
     """
     Run Stage 4 pipeline with error handling, returning a Result object.
@@ -301,6 +738,8 @@ def run_stage4_safe(
         skip_llm: If True, skip LLM extraction
         model: OpenAI model to use
         validate: If True, validate output
+        prepared_text: Optional already-normalized text for this listing
+        created_at: Optional ISO-8601 timestamp for the output
         
     Returns:
         PipelineResult with success status, output, and any errors
@@ -314,35 +753,93 @@ def run_stage4_safe(
             skip_llm=skip_llm,
             model=model,
             validate=validate,
+            prepared_text=prepared_text,
+            created_at=created_at,
         )
-        
-        warnings = output.get("payload", {}).get("extraction_warnings", [])
-        
-        return PipelineResult(
-            success=True,
-            output=output,
-            warnings=warnings,
-        )
+        return _success_result(output)
         
     except Exception as e:
-        logger.error(f"Pipeline failed for {listing_id}: {e}")
-        increment("stage4.pipeline_errors")
+        return _error_result(listing, listing_id, source_snapshot_id, e)
+
+
+async def run_stage4_safe_async(
+    listing: Dict[str, Any],
+    source_snapshot_id: Optional[str] = None,
+    skip_llm: bool = False,
+    model: str = DEFAULT_MODEL,
+    validate: bool = True,
+    client: Optional["AsyncOpenAI"] = None,
+    created_at: Optional[str] = None,
+) -> PipelineResult:
+    """
+    Async version of run_stage4_safe. Never raises.
+    
+    Args:
+        listing: Raw listing dictionary
+        source_snapshot_id: Optional snapshot ID
+        skip_llm: If True, skip LLM extraction
+        model: OpenAI model to use
+        validate: If True, validate output
+        client: Optional shared AsyncOpenAI client
+        created_at: Optional ISO-8601 timestamp for the output
         
-        # Create fallback output
-        fallback = create_fallback_output(
-            listing_id=listing_id,
-            source_snapshot_id=source_snapshot_id or listing_id,
-            title=listing.get("title", ""),
-            description=listing.get("description", ""),
-            warning=f"Pipeline error: {str(e)}",
+    Returns:
+        PipelineResult with success status, output, and any errors
+    """
+    listing_id = str(listing.get("listing_id", "unknown"))
+    
+    try:
+        output = await run_stage4_async(
+            listing=listing,
+            source_snapshot_id=source_snapshot_id,
+            skip_llm=skip_llm,
+            model=model,
+            validate=validate,
+            client=client,
+            created_at=created_at,
         )
+        return _success_result(output)
         
-        return PipelineResult(
-            success=False,
-            output=fallback,
-            error=e,
-            warnings=[f"Pipeline error: {str(e)}"],
-        )
+    except Exception as e:
+        return _error_result(listing, listing_id, source_snapshot_id, e)
+
+
+def _success_result(output: Dict[str, Any]) -> PipelineResult:
+    """Wrap a successful pipeline output in a PipelineResult."""
+    warnings = output.get("payload", {}).get("extraction_warnings", [])
+    
+    return PipelineResult(
+        success=True,
+        output=output,
+        warnings=warnings,
+    )
+
+
+def _error_result(
+    listing: Dict[str, Any],
+    listing_id: str,
+    source_snapshot_id: Optional[str],
+    error: Exception,
+) -> PipelineResult:
+    """Wrap a pipeline error in a PipelineResult with a fallback output."""
+    logger.error(f"Pipeline failed for {listing_id}: {error}")
+    increment("stage4.pipeline_errors")
+    
+    # Create fallback output
+    fallback = create_fallback_output(
+        listing_id=listing_id,
+        source_snapshot_id=source_snapshot_id or listing_id,
+        title=listing.get("title", ""),
+        description=listing.get("description", ""),
+        warning=f"Pipeline error: {str(error)}",
+    )
+    
+    return PipelineResult(
+        success=False,
+        output=fallback,
+        error=error,
+        warnings=[f"Pipeline error: {str(error)}"],
+    )
 
 
 def build_output(
@@ -355,6 +852,8 @@ def build_output(
     derived: Dict[str, str],
     llm_result: Dict[str, Any],
     model: Optional[str],
+    prepared_text: Optional[PreparedText] = None,
+    created_at: Optional[str] = None,
 ) -> Dict[str, Any]:
     """
     Build the final Stage 4 output structure.
@@ -369,6 +868,9 @@ def build_output(
         derived: Derived summary fields
         llm_result: Original LLM result (for missing_info, questions, warnings)
         model: Model used (None if LLM skipped)
+        prepared_text: Prepared text for the listing; reuses its
+            precomputed high-risk keyword check when available
+        created_at: Optional ISO-8601 timestamp; defaults to now
         
     Returns:
         Complete Stage 4 output dictionary
@@ -388,27 +890,27 @@ def build_output(
         )
     
     # Build source text stats
-    combined_text = f"{title}\n{description}"
+    if prepared_text is not None and prepared_text.contains_high_risk is not None:
+        contains_high_risk = prepared_text.contains_high_risk
+    else:
+        contains_high_risk = check_high_risk_keywords(f"{title}\n{description}")
+    
     source_text_stats = {
         "title_length": len(title),
         "description_length": len(description),
-        "contains_keywords_high_risk": check_high_risk_keywords(combined_text),
+        "contains_keywords_high_risk": contains_high_risk,
     }
     
     return {
         "listing_id": listing_id,
         "source_snapshot_id": source_snapshot_id,
-        "created_at": datetime.now(timezone.utc).isoformat(),
+        "created_at": created_at or datetime.now(timezone.utc).isoformat(),
         "stage_name": "stage4_description_intelligence",
         "stage_version": STAGE_VERSION,
         "ruleset_version": RULESET_VERSION,
         "llm_version": model,
         "payload": {
-            "risk_level_overall": derived["risk_level_overall"],
-            "negotiation_stance": derived["negotiation_stance"],
-            "claimed_condition": derived["claimed_condition"],
-            "service_history_level": derived["service_history_level"],
-            "mods_risk_level": derived["mods_risk_level"],
+            **derived,
             "signals": signals,
             "maintenance": maintenance,
             "missing_info": missing_info,
@@ -419,30 +921,97 @@ def build_output(
     }
 
 
+def _event_loop_running() -> bool:
+    """Return True if called from inside a running asyncio event loop."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
 def run_stage4_batch(
     listings: List[Dict[str, Any]],
     skip_llm: bool = False,
     model: str = DEFAULT_MODEL,
     validate: bool = True,
-) -> List[PipelineResult]:
+    concurrency: int = BATCH_CONCURRENCY,
+    mode: str = "online",
+    sink: Optional[ResultSink] = None,
+) -> Union[List[PipelineResult], BatchSummary]:
     """
     Run Stage 4 on a batch of listings.
     
+    With the LLM enabled, listings are processed concurrently (up to
+    `concurrency` in-flight OpenAI requests) via run_stage4_batch_async.
+    With skip_llm=True the work is pure CPU, so large batches (at least
+    BATCH_PROCESS_POOL_MIN_SIZE listings) are spread across worker
+    processes; smaller ones run serially. Metrics recorded inside worker
+    processes are not merged back into this process.
+    
+    mode="offline_batch" submits all LLM requests as one OpenAI Batch API
+    job instead (see run_stage4_batch_offline). This is cheaper but can take
+    up to 24h, so it is only suitable for offline bulk runs.
+    
+    Called from inside a running event loop (e.g. a Jupyter notebook),
+    LLM batches cannot start their own loop and are processed serially
+    instead; await run_stage4_batch_async there for concurrency.
+    
     Args:
         listings: List of listing dictionaries
         skip_llm: If True, only run guardrail rules
         model: OpenAI model to use
         validate: If True, validate each output
+        concurrency: Maximum number of concurrent LLM requests
+        mode: "online" (chat completions) or "offline_batch" (Batch API)
+        sink: Optional callable receiving each PipelineResult as soon as it
+            is ready (e.g. JsonlSink). Results are then not kept in memory
+            and may arrive out of input order.
         
     Returns:
-        List of PipelineResult objects
+        List of PipelineResult objects (same order as listings), or a
+        BatchSummary if a sink was given
     """
+    # One timestamp for the whole batch
+    created_at = datetime.now(timezone.utc).isoformat()
+    
+    if mode not in ("online", "offline_batch"):
+        raise ValueError(f"Unknown batch mode: {mode}")
+    
+    if mode == "offline_batch" and not skip_llm:
+        return run_stage4_batch_offline(
+            listings, model=model, validate=validate, created_at=created_at, sink=sink,
+        )
+    
+    if not skip_llm and not _event_loop_running():
+        return asyncio.run(run_stage4_batch_async(
+            listings,
+            model=model,
+            validate=validate,
+            concurrency=concurrency,
+            created_at=created_at,
+            sink=sink,
+        ))
+    
+    if not skip_llm:
+        logger.warning(
+            "run_stage4_batch called inside a running event loop; processing "
+            "serially (await run_stage4_batch_async for concurrent LLM calls)"
+        )
+    
     logger.info(f"Starting batch processing of {len(listings)} listings")
     start_time = time.time()
+    collector = _BatchCollector(len(listings), sink)
     
-    results = []
-    success_count = 0
-    error_count = 0
+    if skip_llm and len(listings) >= BATCH_PROCESS_POOL_MIN_SIZE and BATCH_MAX_WORKERS > 1:
+        run_one = partial(
+            _run_one_skip_llm, model=model, validate=validate, created_at=created_at,
+        )
+        with ProcessPoolExecutor(max_workers=BATCH_MAX_WORKERS) as executor:
+            for i, result in enumerate(executor.map(run_one, listings, chunksize=32)):
+                collector.add(i, result)
+        
+        return collector.finish(time.time() - start_time)
     
     for i, listing in enumerate(listings):
         listing_id = listing.get("listing_id", f"batch_{i}")
@@ -453,16 +1022,321 @@ def run_stage4_batch(
             skip_llm=skip_llm,
             model=model,
             validate=validate,
+            created_at=created_at,
         )
-        results.append(result)
+        collector.add(i, result)
+    
+    return collector.finish(time.time() - start_time)
+
+
+def _run_one_skip_llm(
+    listing: Dict[str, Any],
+    model: str = DEFAULT_MODEL,
+    validate: bool = True,
+    created_at: Optional[str] = None,
+) -> PipelineResult:
+    """
+    Run one listing without the LLM (process-pool worker entry point).
+    
+    Top-level so it can be pickled. The schema, validator and guardrail
+    patterns are module-level caches, so each worker builds them once.
+    """
+    return run_stage4_safe(
+        listing=listing,
+        skip_llm=True,
+        model=model,
+        validate=validate,
+        created_at=created_at,
+    )
+
+
+async def run_stage4_batch_async(
+    listings: List[Dict[str, Any]],
+    skip_llm: bool = False,
+    model: str = DEFAULT_MODEL,
+    validate: bool = True,
+    concurrency: int = BATCH_CONCURRENCY,
+    created_at: Optional[str] = None,
+    sink: Optional[ResultSink] = None,
+) -> Union[List[PipelineResult], BatchSummary]:
+    """
+    Run Stage 4 on a batch of listings concurrently.
+    
+    Runs as a two-stage pipeline so LLM I/O overlaps with CPU work:
+    - producers do text prep + the LLM call, sharing one AsyncOpenAI
+      client, with a semaphore capping in-flight requests
+    - consumers pull finished LLM results from a bounded queue and run the
+      CPU-bound steps (verification through validation) in worker threads,
+      keeping the event loop free to service in-flight requests
+    
+    Args:
+        listings: List of listing dictionaries
+        skip_llm: If True, only run guardrail rules
+        model: OpenAI model to use
+        validate: If True, validate each output
+        concurrency: Maximum number of concurrent LLM requests
+        created_at: Optional ISO-8601 timestamp shared by all outputs
+            (defaults to the batch start time)
+        sink: Optional callable receiving each PipelineResult as it
+            completes; called in a worker thread so it may block
+        
+    Returns:
+        List of PipelineResult objects (same order as listings), or a
+        BatchSummary if a sink was given
         
-        if result.success:
-            success_count += 1
+    Raises:
+        Exception: Whatever the sink raised; remaining work is cancelled
+    """
+    logger.info(
+        f"Starting async batch processing of {len(listings)} listings "
+        f"(concurrency={concurrency})"
+    )
+    start_time = time.time()
+    
+    if created_at is None:
+        created_at = datetime.now(timezone.utc).isoformat()
+    
+    concurrency = max(1, concurrency)
+    semaphore = asyncio.Semaphore(concurrency)
+    llm_done: asyncio.Queue = asyncio.Queue(maxsize=concurrency * 2)
+    collector = _BatchCollector(len(listings), sink)
+    loop = asyncio.get_running_loop()
+    client = None if skip_llm else _openai().AsyncOpenAI(api_key=get_openai_api_key())
+    
+    async def produce(index: int, listing: Dict[str, Any]) -> None:
+        async with semaphore:
+            try:
+                finalize_kwargs = await _extract_stage_async(
+                    listing=listing,
+                    source_snapshot_id=None,
+                    skip_llm=skip_llm,
+                    model=model,
+                    validate=validate,
+                    client=client,
+                    created_at=created_at,
+                )
+            except Exception as e:
+                error_result = _error_result(listing, str(listing.get("listing_id", "unknown")), None, e)
+                await collect(index, error_result)
+                return
+        await llm_done.put((index, listing, finalize_kwargs))
+    
+    async def collect(index: int, result: PipelineResult) -> None:
+        if sink is None:
+            collector.add(index, result)
         else:
-            error_count += 1
+            await loop.run_in_executor(None, collector.add, index, result)
+    
+    async def consume() -> None:
+        while True:
+            item = await llm_done.get()
+            if item is None:
+                break
+            index, listing, finalize_kwargs = item
+            try:
+                output = await loop.run_in_executor(
+                    None, partial(_finalize_from_llm, **finalize_kwargs)
+                )
+                result = _success_result(output)
+            except Exception as e:
+                result = _error_result(listing, finalize_kwargs["listing_id"], None, e)
+            await collect(index, result)
+    
+    consumers = [
+        asyncio.create_task(consume())
+        for _ in range(min(BATCH_MAX_WORKERS, max(1, len(listings))))
+    ]
+    
+    producing = asyncio.gather(*(produce(i, listing) for i, listing in enumerate(listings)))
+    
+    async def drain() -> None:
+        await producing
+        # One sentinel per consumer shuts the consumers down
+        for _ in consumers:
+            await llm_done.put(None)
+    
+    tasks = [asyncio.ensure_future(drain()), *consumers]
+    try:
+        # Stop on the first failure (e.g. the sink raised in a consumer)
+        # rather than leaving producers blocked on a queue nobody reads
+        await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+        for task in tasks:
+            if task.done() and not task.cancelled() and task.exception() is not None:
+                raise task.exception()
+    finally:
+        for task in (producing, *tasks):
+            task.cancel()
+        await asyncio.gather(producing, *tasks, return_exceptions=True)
+        if client is not None:
+            await client.close()
+    
+    return collector.finish(time.time() - start_time)
+
+
+def run_stage4_batch_offline(
+    listings: List[Dict[str, Any]],
+    model: str = DEFAULT_MODEL,
+    validate: bool = True,
+    poll_interval: float = 30.0,
+    max_wait_seconds: Optional[float] = None,
+    created_at: Optional[str] = None,
+    sink: Optional[ResultSink] = None,
+) -> Union[List[PipelineResult], BatchSummary]:
+    """
+    Run Stage 4 on a batch of listings using the OpenAI Batch API.
+    
+    All extraction prompts are submitted as Batch API jobs (split to stay
+    under the per-job request limit) and billed at the batch discount; once
+    they complete, each response runs through the same post-LLM steps as
+    run_stage4. Listings whose request failed (or all listings, if a job
+    failed) fall back to guardrail-only output, as with a failed online call.
+    
+    Args:
+        listings: List of listing dictionaries
+        model: OpenAI model to use
+        validate: If True, validate each output
+        poll_interval: Seconds between batch status checks
+        max_wait_seconds: Give up waiting after this many seconds
+        created_at: Optional ISO-8601 timestamp shared by all outputs
+            (defaults to when the batch results are processed)
+        sink: Optional callable receiving each PipelineResult in turn
+        
+    Returns:
+        List of PipelineResult objects (same order as listings), or a
+        BatchSummary if a sink was given
+    """
+    logger.info(f"Starting offline batch processing of {len(listings)} listings")
+    start_time = time.time()
+    
+    # Build one request per listing. custom_id is prefixed with the position
+    # so duplicate listing_ids cannot collide.
+    prepared = []
+    requests = []
+    for i, listing in enumerate(listings):
+        fields = _listing_fields(listing)
+        listing_id, title, description, vehicle_type, price, mileage = fields
+        prompt = build_extraction_prompt(
+            listing_id=listing_id,
+            title=title,
+            description=description,
+            vehicle_type=vehicle_type,
+            price=price,
+            mileage=mileage,
+        )
+        custom_id = f"{i}:{listing_id}"
+        prepared.append((custom_id, listing, fields))
+        requests.append((custom_id, build_chat_request(prompt, model)))
+    
+    try:
+        batch_results = _openai_batch().run_chat_batch(
+            requests,
+            poll_interval=poll_interval,
+            max_wait_seconds=max_wait_seconds,
+        )
+    except Exception as e:
+        logger.error(f"Offline batch failed: {e}")
+        increment("stage4.batch_offline_errors")
+        batch_results = {}
+    
+    if created_at is None:
+        created_at = datetime.now(timezone.utc).isoformat()
+    
+    collector = _BatchCollector(len(prepared), sink)
+    for i, (custom_id, listing, fields) in enumerate(prepared):
+        listing_id, title, description, _, _, _ = fields
+        item_start = time.time()
+        try:
+            prepared_text = normalize_text(title, description)
+            llm_result, token_usage = _llm_result_from_batch_line(
+                batch_results.get(custom_id), listing_id, title, description, model,
+            )
+            _record_llm_cost(token_usage)
+            output = _finalize_from_llm(
+                listing_id=listing_id,
+                source_snapshot_id=listing_id,
+                title=title,
+                description=description,
+                prepared_text=prepared_text,
+                llm_result=llm_result,
+                model=model,
+                validate=validate,
+                start_time=item_start,
+                token_usage=token_usage,
+                created_at=created_at,
+            )
+            result = _success_result(output)
+        except Exception as e:
+            result = _error_result(listing, listing_id, None, e)
+        collector.add(i, result)
+    
+    return collector.finish(time.time() - start_time)
+
+
+def _llm_result_from_batch_line(
+    line: Optional[Dict[str, Any]],
+    listing_id: str,
+    title: str,
+    description: str,
+    model: str,
+) -> Tuple[Dict[str, Any], Optional[TokenUsage]]:
+    """
+    Convert a Batch API result line into an LLM result, like extract_with_llm.
+    
+    Returns:
+        Tuple of (LLM result or fallback output, token usage or None)
+    """
+    response = (line or {}).get("response") or {}
+    body = response.get("body") or {}
+    
+    if response.get("status_code") != 200 or not body.get("choices"):
+        error = (line or {}).get("error") or body.get("error") or "no result"
+        logger.warning(f"Batch LLM extraction failed for listing {listing_id}: {error}")
+        return create_fallback_output(
+            listing_id=listing_id,
+            source_snapshot_id=listing_id,
+            title=title,
+            description=description,
+            warning="LLM batch extraction failed",
+        ), None
     
-    total_time = time.time() - start_time
-    avg_time = total_time / len(listings) if listings else 0
+    usage = body.get("usage")
+    token_usage = None
+    if usage:
+        token_usage = TokenUsage(
+            prompt_tokens=usage.get("prompt_tokens", 0),
+            completion_tokens=usage.get("completion_tokens", 0),
+            total_tokens=usage.get("total_tokens", 0),
+            model=model,
+            batch=True,
+        )
+    
+    try:
+        extraction = parse_llm_response(body["choices"][0]["message"]["content"] or "")
+        result = build_llm_output(
+            extraction=extraction,
+            listing_id=listing_id,
+            source_snapshot_id=listing_id,
+            title=title,
+            description=description,
+            model=model,
+        )
+        return result, token_usage
+        
+    except Exception as e:
+        logger.error(f"Error processing batch output for listing {listing_id}: {e}")
+        return create_fallback_output(
+            listing_id=listing_id,
+            source_snapshot_id=listing_id,
+            title=title,
+            description=description,
+            warning=f"Error processing LLM output: {str(e)}",
+        ), None
+
+
+def _record_batch_metrics(batch_size: int, success_count: int, total_time: float) -> None:
+    """Log a batch summary and record batch metrics."""
+    error_count = batch_size - success_count
+    avg_time = total_time / batch_size if batch_size else 0
     
     logger.info(
         f"Batch complete: {success_count} succeeded, {error_count} failed, "
@@ -471,10 +1345,8 @@ def run_stage4_batch(
     
     # Record batch metrics
     increment("stage4.batch_runs")
-    histogram("stage4.batch_size", len(listings))
-    histogram("stage4.batch_success_rate", success_count / len(listings) if listings else 0)
-    
-    return results
+    histogram("stage4.batch_size", batch_size)
+    histogram("stage4.batch_success_rate", success_count / batch_size if batch_size else 0)
 
 
 def run_guardrails_only(listing: Dict[str, Any]) -> Dict[str, list]:
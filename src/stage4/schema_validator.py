@@ -4,17 +4,30 @@ Schema Validator Module for Stage 4
 Validates Stage 4 output against the JSON Schema contract.
 """
 
-import json
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Tuple, Optional
+from typing import Any, Callable, Dict, List, Tuple, Optional
 
 import jsonschema
 from jsonschema import Draft202012Validator, ValidationError
 
-from config import STAGE4_SCHEMA_PATH
+try:
+    import fastjsonschema
+except ImportError:  # pragma: no cover - optional speedup
+    fastjsonschema = None
+
+from config import STAGE4_SCHEMA_PATH, USE_FASTJSONSCHEMA
+from common import json_utils
 
 
 _schema_cache: Optional[dict] = None
+_validator_cache: Optional[Draft202012Validator] = None
+_compiled_validator: Optional[Callable[[Any], Any]] = None
+
+# validate_signal lookup tables
+_REQUIRED_SIGNAL_FIELDS = ("type", "severity", "verification_level", "evidence_text", "confidence")
+_SEVERITIES = frozenset({"low", "medium", "high"})
+_VERIFICATION_LEVELS = frozenset({"verified", "inferred"})
 
 
 def load_schema() -> dict:
@@ -39,12 +52,60 @@ def load_schema() -> dict:
             f"Stage 4 schema not found at {STAGE4_SCHEMA_PATH}"
         )
     
-    with open(STAGE4_SCHEMA_PATH) as f:
-        _schema_cache = json.load(f)
+    with open(STAGE4_SCHEMA_PATH, "rb") as f:
+        _schema_cache = json_utils.loads(f.read())
     
     return _schema_cache
 
 
+def get_validator() -> Draft202012Validator:
+    """
+    Get the Stage 4 schema validator.
+    
+    The validator is built (and the schema checked) once on first use and
+    reused for every subsequent validation.
+    
+    Returns:
+        Draft202012Validator for the Stage 4 schema
+        
+    Raises:
+        SchemaError: If the schema itself is invalid
+    """
+    global _validator_cache
+    
+    if _validator_cache is None:
+        schema = load_schema()
+        Draft202012Validator.check_schema(schema)
+        _validator_cache = Draft202012Validator(schema)
+    
+    return _validator_cache
+
+
+def get_compiled_validator() -> Optional[Callable[[Any], Any]]:
+    """
+    Get the fastjsonschema compiled validator for the Stage 4 schema.
+    
+    Compiled once on first use. Returns None when fastjsonschema is not
+    installed, disabled via USE_FASTJSONSCHEMA, or cannot compile the schema.
+    
+    Returns:
+        Validation function raising JsonSchemaException, or None
+    """
+    global _compiled_validator
+    
+    if fastjsonschema is None or not USE_FASTJSONSCHEMA:
+        return None
+    
+    if _compiled_validator is None:
+        try:
+            _compiled_validator = fastjsonschema.compile(load_schema())
+        except Exception:
+            # Leave disabled; jsonschema handles validation
+            _compiled_validator = False
+    
+    return _compiled_validator or None
+
+
 def validate_stage4_output(output: Dict[str, Any]) -> Tuple[bool, List[str]]:
     """
     Validate Stage 4 output against the schema.
@@ -55,9 +116,18 @@ def validate_stage4_output(output: Dict[str, Any]) -> Tuple[bool, List[str]]:
     Returns:
         Tuple of (is_valid, list of error messages)
     """
-    schema = load_schema()
+    # Fast path: compiled validator accepts the (common) valid case. On
+    # failure fall through to jsonschema, which stays authoritative and
+    # produces the full error list in the usual format.
+    compiled = get_compiled_validator()
+    if compiled is not None:
+        try:
+            compiled(output)
+            return True, []
+        except fastjsonschema.JsonSchemaException:
+            pass
     
-    validator = Draft202012Validator(schema)
+    validator = get_validator()
     
     errors = list(validator.iter_errors(output))
     
@@ -94,6 +164,63 @@ def validate_or_raise(output: Dict[str, Any]) -> Dict[str, Any]:
     return output
 
 
+@lru_cache(maxsize=None)
+def _required_key_sets() -> Tuple[frozenset, frozenset]:
+    """Required top-level and payload keys from the schema (computed once)."""
+    return frozenset(get_required_fields()), frozenset(get_payload_required_fields())
+
+
+def shallow_check(output: Dict[str, Any]) -> Tuple[bool, List[str]]:
+    """
+    Cheap structural check: required top-level and payload keys are present.
+    
+    Does not check types, enums or nested structures; use
+    validate_stage4_output for that.
+    
+    Args:
+        output: Stage 4 output dictionary
+        
+    Returns:
+        Tuple of (is_valid, list of error messages)
+    """
+    required_top, required_payload = _required_key_sets()
+    
+    errors = [f"root: '{key}' is a required property" for key in sorted(required_top - output.keys())]
+    
+    payload = output.get("payload")
+    if isinstance(payload, dict):
+        errors.extend(
+            f"payload: '{key}' is a required property"
+            for key in sorted(required_payload - payload.keys())
+        )
+    elif "payload" in output:
+        errors.append("payload: is not of type 'object'")
+    
+    return len(errors) == 0, errors
+
+
+def shallow_check_or_raise(output: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Run shallow_check, raising on failure.
+    
+    Args:
+        output: Stage 4 output dictionary
+        
+    Returns:
+        The checked output (unchanged)
+        
+    Raises:
+        ValidationError: If required keys are missing
+    """
+    is_valid, errors = shallow_check(output)
+    
+    if not is_valid:
+        error_msg = "Schema validation failed:\n" + "\n".join(f"  - {e}" for e in errors)
+        raise ValidationError(error_msg)
+    
+    return output
+
+
 def validate_signal(signal: Dict[str, Any], signal_type: str) -> Tuple[bool, List[str]]:
     """
     Validate a single signal object.
@@ -108,8 +235,7 @@ def validate_signal(signal: Dict[str, Any], signal_type: str) -> Tuple[bool, Lis
     errors = []
     
     # Required fields
-    required = ["type", "severity", "verification_level", "evidence_text", "confidence"]
-    for field in required:
+    for field in _REQUIRED_SIGNAL_FIELDS:
         if field not in signal:
             errors.append(f"Missing required field: {field}")
     
@@ -118,13 +244,11 @@ def validate_signal(signal: Dict[str, Any], signal_type: str) -> Tuple[bool, Lis
         errors.append("'type' must be a string")
     
     # Severity validation
-    valid_severities = ["low", "medium", "high"]
-    if "severity" in signal and signal["severity"] not in valid_severities:
+    if "severity" in signal and signal["severity"] not in _SEVERITIES:
         errors.append(f"Invalid severity: {signal['severity']}")
     
     # Verification level validation
-    valid_verification = ["verified", "inferred"]
-    if "verification_level" in signal and signal["verification_level"] not in valid_verification:
+    if "verification_level" in signal and signal["verification_level"] not in _VERIFICATION_LEVELS:
         errors.append(f"Invalid verification_level: {signal['verification_level']}")
     
     # Evidence text validation
@@ -184,6 +308,7 @@ def create_minimal_valid_output(
     source_snapshot_id: str,
     stage_version: str = "v1.0.0",
     ruleset_version: str = "v1.0",
+    created_at: Optional[str] = None,
 ) -> Dict[str, Any]:
     """
     Create a minimal schema-valid output structure.
@@ -195,6 +320,7 @@ def create_minimal_valid_output(
         source_snapshot_id: Snapshot identifier
         stage_version: Stage version
         ruleset_version: Ruleset version
+        created_at: Optional ISO-8601 timestamp; defaults to now
         
     Returns:
         Minimal valid output dictionary
@@ -204,7 +330,7 @@ def create_minimal_valid_output(
     return {
         "listing_id": listing_id,
         "source_snapshot_id": source_snapshot_id,
-        "created_at": datetime.now(timezone.utc).isoformat(),
+        "created_at": created_at or datetime.now(timezone.utc).isoformat(),
         "stage_name": "stage4_description_intelligence",
         "stage_version": stage_version,
         "ruleset_version": ruleset_version,
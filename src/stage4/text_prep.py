@@ -6,24 +6,55 @@ original text for evidence matching.
 """
 
 import re
+import sys
+from bisect import bisect_right
 from dataclasses import dataclass
-from typing import Optional, List
+from functools import lru_cache
+from typing import Optional, List, Tuple
 
+from config import DISABLE_CACHE
 
-@dataclass
+
+# Precompiled patterns (hot path: used for every listing)
+_SENT_SPLIT_RE = re.compile(r'(?<=[.!?])\s+(?=[A-Z])')
+_LEAD_PUNCT_RE = re.compile(r'^[.,!?;:\s]+')
+_TRAIL_PUNCT_RE = re.compile(r'[.,!?;:\s]+$')
+
+# Upper bound for end offsets when bisecting (start, end) sentence tuples
+_MAX_OFFSET = sys.maxsize
+
+# slots=True is only accepted by dataclass on Python 3.10+
+_DATACLASS_KWARGS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_DATACLASS_KWARGS)
 class PreparedText:
-    """Container for prepared text with original preserved."""
+    """
+    Container for prepared text with original preserved.
+    
+    Immutable (frozen, tuple fields): normalize_text memoizes instances and
+    hands the same one to every caller with the same input.
+    """
     original_title: str
     original_description: str
     combined_text: str  # title + description for full text search
     normalized_text: str  # lowercased for pattern matching
-    sentences: List[str]  # sentence-split for evidence extraction
+    sentences: Tuple[str, ...]  # sentence-split for evidence extraction
+    # (start, end) of each sentence within combined_text
+    sentence_offsets: Tuple[Tuple[int, int], ...] = ()
+    combined_lower: str = ""  # combined_text.lower(), computed once
+    # High-risk keyword check for source_text_stats (None = not computed)
+    contains_high_risk: Optional[bool] = None
 
 
 def normalize_text(title: str, description: str) -> PreparedText:
     """
     Normalize text for extraction while preserving original for evidence.
     
+    Results are memoized on (title, description), so repeated listings
+    share one (immutable) PreparedText. Set STAGE4_DISABLE_CACHE=1 to
+    bypass the memo.
+    
     Args:
         title: Listing title
         description: Listing description
@@ -31,21 +62,52 @@ def normalize_text(title: str, description: str) -> PreparedText:
     Returns:
         PreparedText with original, combined, normalized, and sentences
     """
+    if DISABLE_CACHE:
+        return _normalize_text(title, description)
+    return _normalize_text_cached(title, description)
+
+
+def _normalize_text(title: str, description: str) -> PreparedText:
+    """Uncached normalize_text."""
     # Handle None/empty values
     title = (title or "").strip()
     description = (description or "").strip()
     
     # Combine title and description
-    combined = f"{title}\n{description}" if title and description else title or description
+    combined = _combine(title, description)
     
-    # Normalize whitespace but preserve original casing
-    normalized_whitespace = re.sub(r'\s+', ' ', combined).strip()
+    # Normalize whitespace but preserve original casing (str.split() splits
+    # on the same characters as \s, without the regex machinery)
+    normalized_whitespace = " ".join(combined.split())
     
     # Create lowercase version for pattern matching
     normalized_lower = normalized_whitespace.lower()
     
-    # Split into sentences
-    sentences = split_sentences(combined)
+    return _build_prepared_text(title, description, combined, normalized_lower, combined.lower())
+
+
+_normalize_text_cached = lru_cache(maxsize=1024)(_normalize_text)
+
+
+def _combine(title: str, description: str) -> str:
+    """Combine stripped title and description into the searchable text."""
+    return f"{title}\n{description}" if title and description else title or description
+
+
+def _build_prepared_text(
+    title: str,
+    description: str,
+    combined: str,
+    normalized_lower: str,
+    combined_lower: str,
+) -> PreparedText:
+    """Assemble a PreparedText from already-normalized strings."""
+    # Imported here: guardrails depends on this module
+    from stage4.guardrails import check_high_risk_keywords
+    
+    # Split into sentences, keeping their offsets for evidence lookup
+    sentence_offsets = tuple(split_sentence_offsets(combined))
+    sentences = tuple(combined[start:end] for start, end in sentence_offsets)
     
     return PreparedText(
         original_title=title,
@@ -53,6 +115,9 @@ def normalize_text(title: str, description: str) -> PreparedText:
         combined_text=combined,
         normalized_text=normalized_lower,
         sentences=sentences,
+        sentence_offsets=sentence_offsets,
+        combined_lower=combined_lower,
+        contains_high_risk=check_high_risk_keywords(combined_lower),
     )
 
 
@@ -71,35 +136,62 @@ def split_sentences(text: str) -> List[str]:
     Returns:
         List of sentences (may include partial sentences)
     """
+    return [text[start:end] for start, end in split_sentence_offsets(text)]
+
+
+def split_sentence_offsets(text: str) -> List[Tuple[int, int]]:
+    """
+    Split text into sentences, returning their (start, end) offsets.
+    
+    Same boundaries as split_sentences; text[start:end] is the sentence.
+    
+    Args:
+        text: Input text to split
+        
+    Returns:
+        List of (start, end) character offsets into text
+    """
     if not text:
         return []
     
+    offsets = []
+    line_start = 0
+    
     # First, split on newlines
-    lines = text.split('\n')
-    
-    sentences = []
-    for line in lines:
-        line = line.strip()
-        if not line:
-            continue
-            
+    for line in text.split('\n'):
+        line_end = line_start + len(line)
+        
         # Split on sentence-ending punctuation followed by space
         # This pattern handles: "sentence. Next" but not "Mr. Smith" as well
-        parts = re.split(r'(?<=[.!?])\s+(?=[A-Z])', line)
+        part_start = line_start
+        for match in _SENT_SPLIT_RE.finditer(line):
+            _append_stripped(text, part_start, line_start + match.start(), offsets)
+            part_start = line_start + match.end()
+        _append_stripped(text, part_start, line_end, offsets)
         
-        for part in parts:
-            part = part.strip()
-            if part:
-                sentences.append(part)
+        line_start = line_end + 1
     
-    return sentences
+    return offsets
+
+
+def _append_stripped(text: str, start: int, end: int, offsets: List[Tuple[int, int]]) -> None:
+    """Append (start, end) trimmed of surrounding whitespace, if non-empty."""
+    part = text[start:end]
+    stripped = part.lstrip()
+    if not stripped:
+        return
+    start += len(part) - len(stripped)
+    end = start + len(stripped.rstrip())
+    offsets.append((start, end))
 
 
 def find_evidence_span(
     pattern: str,
     text: str,
     sentences: List[str],
-    window_size: int = 200
+    window_size: int = 200,
+    sentence_offsets: Optional[List[Tuple[int, int]]] = None,
+    text_lower: Optional[str] = None,
 ) -> Optional[str]:
     """
     Find the evidence span containing a pattern match.
@@ -112,19 +204,38 @@ def find_evidence_span(
         text: Full text to search in
         sentences: Pre-split sentences
         window_size: Character window size for fallback
+        sentence_offsets: Optional (start, end) offsets of sentences in text
+            (PreparedText.sentence_offsets); enables the indexed lookup
+        text_lower: Optional precomputed text.lower()
         
     Returns:
         Evidence text span or None if not found
     """
     pattern_lower = pattern.lower()
     
-    # First, try to find a sentence containing the pattern
-    for sentence in sentences:
-        if pattern_lower in sentence.lower():
-            return sentence
+    if text_lower is None:
+        text_lower = text.lower()
+    
+    # Indexed lookup: search the lowercased text once and bisect each hit
+    # into the sentence offsets, instead of lowercasing every sentence.
+    # Only valid when lowercasing preserved character positions.
+    if sentence_offsets is not None and len(text_lower) == len(text):
+        idx = text_lower.find(pattern_lower)
+        while idx != -1:
+            # Last sentence starting at or before idx (tuples compare by
+            # start first, so no separate list of starts is needed)
+            i = bisect_right(sentence_offsets, (idx, _MAX_OFFSET)) - 1
+            if i >= 0 and idx + len(pattern_lower) <= sentence_offsets[i][1]:
+                start, end = sentence_offsets[i]
+                return text[start:end]
+            idx = text_lower.find(pattern_lower, idx + 1)
+    else:
+        # First, try to find a sentence containing the pattern
+        for sentence in sentences:
+            if pattern_lower in sentence.lower():
+                return sentence
     
     # Fallback: find in full text and extract window
-    text_lower = text.lower()
     idx = text_lower.find(pattern_lower)
     
     if idx == -1:
@@ -143,7 +254,24 @@ def find_evidence_span(
     return text[start:end].strip()
 
 
-def check_evidence_exists(evidence_text: str, original_text: str) -> bool:
+def normalize_for_match(text: str) -> str:
+    """
+    Lowercase text and collapse whitespace runs, for evidence matching.
+    
+    Args:
+        text: Text to normalize
+        
+    Returns:
+        Normalized text (same form as check_evidence_exists compares)
+    """
+    return " ".join(text.lower().split())
+
+
+def check_evidence_exists(
+    evidence_text: str,
+    original_text: str,
+    original_normalized: Optional[str] = None,
+) -> bool:
     """
     Check if evidence text exists verbatim in original text.
     
@@ -152,6 +280,8 @@ def check_evidence_exists(evidence_text: str, original_text: str) -> bool:
     Args:
         evidence_text: Claimed evidence text
         original_text: Original listing text (title + description)
+        original_normalized: Optional precomputed lowercased,
+            whitespace-collapsed original text (PreparedText.normalized_text)
         
     Returns:
         True if evidence exists in original text
@@ -160,8 +290,12 @@ def check_evidence_exists(evidence_text: str, original_text: str) -> bool:
         return False
     
     # Normalize both for comparison
-    evidence_normalized = re.sub(r'\s+', ' ', evidence_text.lower()).strip()
-    original_normalized = re.sub(r'\s+', ' ', original_text.lower()).strip()
+    evidence_normalized = normalize_for_match(evidence_text)
+    if not evidence_normalized:
+        # Whitespace-only evidence is not evidence
+        return False
+    if original_normalized is None:
+        original_normalized = normalize_for_match(original_text)
     
     return evidence_normalized in original_normalized
 
@@ -169,7 +303,8 @@ def check_evidence_exists(evidence_text: str, original_text: str) -> bool:
 def extract_keyword_context(
     keyword: str,
     text: str,
-    context_chars: int = 100
+    context_chars: int = 100,
+    text_lower: Optional[str] = None,
 ) -> Optional[str]:
     """
     Extract context around a keyword for evidence.
@@ -178,11 +313,13 @@ def extract_keyword_context(
         keyword: Keyword to find
         text: Text to search in
         context_chars: Characters to include before/after
+        text_lower: Optional precomputed text.lower()
         
     Returns:
         Context string or None if keyword not found
     """
-    text_lower = text.lower()
+    if text_lower is None:
+        text_lower = text.lower()
     keyword_lower = keyword.lower()
     
     idx = text_lower.find(keyword_lower)
@@ -202,7 +339,7 @@ def extract_keyword_context(
     context = text[start:end].strip()
     
     # Clean up leading/trailing punctuation
-    context = re.sub(r'^[.,!?;:\s]+', '', context)
-    context = re.sub(r'[.,!?;:\s]+$', '', context)
+    context = _LEAD_PUNCT_RE.sub('', context)
+    context = _TRAIL_PUNCT_RE.sub('', context)
     
     return context if context else None
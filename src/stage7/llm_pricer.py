@@ -3,23 +3,367 @@ LLM Pricer Module for Stage 7
 Uses OpenAI to estimate market price for a vehicle based on its details.
 """
 
-import json
+import asyncio
+import atexit
+import copy
+import hashlib
 import logging
+import random
+import re
 import time
-from typing import Any, Dict, Optional, Tuple
+from functools import lru_cache
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
-from openai import OpenAI
+import httpx
+from pydantic import BaseModel
+from openai import APIConnectionError, APITimeoutError, AsyncOpenAI, OpenAI, RateLimitError
 from config import (
     get_openai_api_key,
     DEFAULT_MODEL,
     DEFAULT_TEMPERATURE,
     MAX_OUTPUT_TOKENS,
     OPENAI_TIMEOUT,
+    MAX_RETRIES,
+    RETRY_DELAY_BASE,
+    PRICER_CONCURRENCY,
+    PRICER_REQUESTS_PER_MINUTE,
+    PRICER_TOKENS_PER_MINUTE,
 )
+from common import json_utils
+from common.caching import get_pricing_cache, get_pricing_disk_cache
+from common.openai_batch import run_chat_batch
+from common.rate_limiter import RateLimitConfig, RateLimitExceeded, RateLimiter
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Fixed instructions go in the system message: the identical prefix on
+# every call is eligible for OpenAI prompt caching
+_SYSTEM_MSG = (
+    "You are an expert vehicle appraiser. From the listing, identify year/make/model/trim "
+    "and estimate the current private-party fair market value for its condition and mileage. "
+    "Return JSON only: {\"estimated_market_price_p50\": number, "
+    "\"estimated_market_price_p25\": number, \"estimated_market_price_p75\": number, "
+    "\"confidence\": number 0-1 (how much info is given and how standard the vehicle is), "
+    "\"reasoning\": brief string, "
+    "\"comps_used_count\": number (rough count of similar listings in the market, e.g. 10, 50, 100)}"
+)
+
+_USER_TEMPLATE = "title={t}\ndesc={d}\nprice={p}\nmileage={m}\ntype={v}"
+
+
+class PriceEstimate(BaseModel):
+    """LLM price estimate, enforced on the model via Structured Outputs."""
+    estimated_market_price_p50: float
+    estimated_market_price_p25: float
+    estimated_market_price_p75: float
+    confidence: float
+    reasoning: str
+    comps_used_count: int
+
+
+def _strict_response_format(model_cls: type) -> Dict[str, Any]:
+    """Build a strict json_schema response_format for a Pydantic model."""
+    schema = model_cls.model_json_schema()
+    schema["additionalProperties"] = False
+    return {
+        "type": "json_schema",
+        "json_schema": {"name": model_cls.__name__, "strict": True, "schema": schema},
+    }
+
+
+# Plain request parameter (not client.beta...parse) so the same body works
+# for the sync, async and Batch API paths
+_PRICE_RESPONSE_FORMAT = _strict_response_format(PriceEstimate)
+
+# Longer descriptions are clipped before prompting (~500 tokens); the
+# clip is measured in tokens when tiktoken is installed
+_MAX_DESC_CHARS = 2000
+_MAX_DESC_TOKENS = 512
+
+# Sentence splitter for clipping long descriptions
+_SENTENCE_RE = re.compile(r"[^.!?]+[.!?]*")
+
+# Terms marking a sentence as pricing-relevant: year, mileage, service
+# history, owners, and condition/damage
+_KEY_SENTENCE_RE = re.compile(
+    r"\b(?:\d{4}|\d+k|km|kms|miles|service|serviced|owners?"
+    r"|blown|slip(?:s|ping)?|damaged?|accident|write[\s-]?off|defect(?:ed)?"
+    r"|not\s+running|won'?t\s+start|rust|leak(?:s|ing)?|issues?|faults?|needs?)\b",
+    re.IGNORECASE,
+)
+
+# Matches a completed p50 value in a partially streamed response
+_P50_RE = re.compile(r'"estimated_market_price_p50"\s*:\s*(-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?)\s*[,}]')
+
+# Transient errors worth retrying; anything else goes straight to fallback
+_RETRYABLE_ERRORS = (RateLimitError, APITimeoutError, APIConnectionError)
+
+# Upper bound on a single retry delay (seconds)
+_MAX_RETRY_DELAY = 20.0
+
+# Completion tokens assumed per request when pacing tokens-per-minute
+_EST_COMPLETION_TOKENS = 300
+
+# Smallest tokens-per-minute bucket: comfortably above the estimate for one
+# request with a clipped description, so a low STAGE7_PRICER_TPM still
+# charges each request in full
+_MIN_TOKEN_BUCKET = 2048
+
+# Shared sync client, so calls reuse pooled keep-alive connections
+_client: Optional[OpenAI] = None
+
+
+def _get_client() -> OpenAI:
+    """Get the shared OpenAI client (created on first use)."""
+    global _client
+    if _client is None:
+        _client = OpenAI(
+            api_key=get_openai_api_key(),
+            timeout=OPENAI_TIMEOUT,
+            max_retries=0,  # retried with jitter in _create_completion
+            http_client=httpx.Client(
+                limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+            ),
+        )
+        atexit.register(_client.close)
+    return _client
+
+
+@lru_cache(maxsize=4)
+def _encoder(model: str) -> Optional[Any]:
+    """
+    Get the tiktoken encoder for a model, loaded once per model.
+    
+    Returns:
+        Encoding, or None if tiktoken is not installed
+    """
+    try:
+        import tiktoken
+    except ImportError:  # pragma: no cover - optional dependency
+        return None
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return tiktoken.get_encoding("o200k_base")
+
+
+def _truncate_description(description: str, model: str = DEFAULT_MODEL) -> str:
+    """
+    Clip a description longer than _MAX_DESC_CHARS.
+    
+    Pricing-relevant sentences (years, mileage, service, owners, damage
+    and condition) are always kept. The remaining budget is filled with
+    the other sentences from the start of the description, and everything
+    kept stays in its original order. The result is cut to
+    _MAX_DESC_TOKENS tokens, or _MAX_DESC_CHARS characters without tiktoken.
+    """
+    if len(description) <= _MAX_DESC_CHARS:
+        return description
+    
+    sentences = [sentence.strip() for sentence in _SENTENCE_RE.findall(description)]
+    sentences = [sentence for sentence in sentences if sentence]
+    keep = [_KEY_SENTENCE_RE.search(sentence) is not None for sentence in sentences]
+    
+    used = sum(len(sentence) + 1 for sentence, kept in zip(sentences, keep) if kept)
+    for i, sentence in enumerate(sentences):
+        if keep[i]:
+            continue
+        if used + len(sentence) + 1 > _MAX_DESC_CHARS:
+            break
+        keep[i] = True
+        used += len(sentence) + 1
+    
+    clipped = " ".join(sentence for sentence, kept in zip(sentences, keep) if kept)
+    
+    encoder = _encoder(model)
+    if encoder is None:
+        return clipped[:_MAX_DESC_CHARS]
+    return encoder.decode(encoder.encode(clipped)[:_MAX_DESC_TOKENS])
+
+
+def _build_prompt(listing: Dict[str, Any], model: str = DEFAULT_MODEL) -> str:
+    """Build the pricing user message for a listing."""
+    price = listing.get("price")
+    mileage = listing.get("mileage")
+    return _USER_TEMPLATE.format(
+        t=listing.get("title", ""),
+        d=_truncate_description(listing.get("description") or "", model),
+        p=price if price else "unknown",
+        m=mileage if mileage else "unknown",
+        v=listing.get("vehicle_type", "car"),
+    )
+
+
+def _price_cache_key(request: Dict[str, Any]) -> str:
+    """
+    Build the pricing cache key: a hash of the full request body.
+    
+    The body includes the model, the (clipped) description and every other
+    listing field in the prompt, so only listings that would send the
+    identical request share an estimate.
+    """
+    return hashlib.blake2b(json_utils.dumps(request), digest_size=16).hexdigest()
+
+
+def _get_cached_price(request: Dict[str, Any]) -> Tuple[str, Optional[Dict[str, Any]]]:
+    """
+    Look up a cached estimate, in memory first, then on disk.
+    
+    Both caches use the same exact-request key, so a hit returns what a
+    fresh run of this request returned before.
+    
+    Returns:
+        Tuple of (cache key for _cache_price, copy of the cached estimate or None)
+    """
+    key = _price_cache_key(request)
+    
+    cached = get_pricing_cache().get(key)
+    if cached is None:
+        disk_cache = get_pricing_disk_cache()
+        cached = disk_cache.get(key) if disk_cache is not None else None
+        if cached is not None:
+            get_pricing_cache().set(key, cached)
+    
+    if cached is not None:
+        logger.debug(f"Pricing cache hit: {key[:8]}")
+        return key, copy.deepcopy(cached)
+    return key, None
+
+
+def _cache_price(key: str, result: Dict[str, Any]) -> None:
+    """Store a successful estimate in the memory and disk caches."""
+    get_pricing_cache().set(key, copy.deepcopy(result))
+    disk_cache = get_pricing_disk_cache()
+    if disk_cache is not None:
+        disk_cache.set(key, result)
+
+
+def _build_price_request(listing: Dict[str, Any], model: str) -> Dict[str, Any]:
+    """Build chat completion request parameters for a listing."""
+    return {
+        "model": model,
+        "messages": [
+            {"role": "system", "content": _SYSTEM_MSG},
+            {"role": "user", "content": _build_prompt(listing, model)}
+        ],
+        "temperature": DEFAULT_TEMPERATURE,
+        "max_tokens": MAX_OUTPUT_TOKENS,
+        "response_format": _PRICE_RESPONSE_FORMAT,
+    }
+
+
+def _retry_delay(attempt: int) -> float:
+    """Exponential backoff with full jitter for the given attempt (0-based)."""
+    return random.uniform(RETRY_DELAY_BASE, min(_MAX_RETRY_DELAY, RETRY_DELAY_BASE * 2 ** (attempt + 1)))
+
+
+def _create_completion(client: OpenAI, request: Dict[str, Any], max_retries: int = MAX_RETRIES) -> Any:
+    """
+    Create a chat completion, retrying transient errors with backoff.
+    
+    Raises:
+        The last error once max_retries attempts are exhausted, or any
+        non-transient error immediately
+    """
+    for attempt in range(max_retries):
+        try:
+            return client.chat.completions.create(**request)
+        except _RETRYABLE_ERRORS as e:
+            if attempt == max_retries - 1:
+                raise
+            delay = _retry_delay(attempt)
+            logger.warning(f"Pricing request failed ({e}); retrying in {delay:.1f}s")
+            time.sleep(delay)
+
+
+async def _create_completion_async(
+    client: AsyncOpenAI,
+    request: Dict[str, Any],
+    max_retries: int = MAX_RETRIES,
+) -> Any:
+    """Async version of _create_completion."""
+    for attempt in range(max_retries):
+        try:
+            return await client.chat.completions.create(**request)
+        except _RETRYABLE_ERRORS as e:
+            if attempt == max_retries - 1:
+                raise
+            delay = _retry_delay(attempt)
+            logger.warning(f"Pricing request failed ({e}); retrying in {delay:.1f}s")
+            await asyncio.sleep(delay)
+
+
+def _new_rate_limiters() -> Tuple[RateLimiter, RateLimiter]:
+    """
+    Create (requests-per-minute, tokens-per-minute) limiters for one batch.
+    
+    Buckets hold about one second of capacity (the token bucket at least
+    _MIN_TOKEN_BUCKET, so one request always fits), so requests are paced
+    smoothly instead of bursting into OpenAI 429s. Created per batch,
+    inside the running event loop the limiters' asyncio locks bind to.
+    """
+    return (
+        RateLimiter(RateLimitConfig(
+            calls_per_minute=PRICER_REQUESTS_PER_MINUTE,
+            burst_limit=max(1, PRICER_REQUESTS_PER_MINUTE // 60),
+            max_wait_seconds=600.0,
+        )),
+        RateLimiter(RateLimitConfig(
+            calls_per_minute=PRICER_TOKENS_PER_MINUTE,
+            burst_limit=max(_MIN_TOKEN_BUCKET, PRICER_TOKENS_PER_MINUTE // 60),
+            max_wait_seconds=600.0,
+        )),
+    )
+
+
+def _estimate_request_tokens(request: Dict[str, Any]) -> int:
+    """Rough token count of a request (~4 characters per prompt token)."""
+    prompt_chars = sum(len(message["content"]) for message in request["messages"])
+    return prompt_chars // 4 + _EST_COMPLETION_TOKENS
+
+
+async def _acquire_rate_limits(
+    rate_limiters: Tuple[RateLimiter, RateLimiter],
+    request: Dict[str, Any],
+) -> None:
+    """
+    Wait for request and token capacity for one request.
+    
+    Raises:
+        RateLimitExceeded: If capacity did not free up in time
+        ValueError: If the request is estimated larger than the token bucket
+    """
+    request_limiter, token_limiter = rate_limiters
+    if not await request_limiter.acquire_async():
+        raise RateLimitExceeded("Pricing requests-per-minute limit")
+    if not await token_limiter.acquire_async(tokens=_estimate_request_tokens(request)):
+        raise RateLimitExceeded("Pricing tokens-per-minute limit")
+
+
+def _parse_price_response(content: str, model: str) -> Dict[str, Any]:
+    """Parse the LLM response content and add metadata."""
+    result = PriceEstimate.model_validate_json(content).model_dump()
+    
+    # Add metadata
+    result["source"] = "llm_estimation"
+    result["model_used"] = model
+    
+    return result
+
+
+def _fallback_price(listing: Dict[str, Any], error: Exception) -> Dict[str, Any]:
+    """Build the fallback result returned when LLM pricing fails."""
+    price = listing.get("price")
+    return {
+        "estimated_market_price_p50": price if price else 0,
+        "confidence": 0.1,
+        "reasoning": f"LLM estimation failed: {str(error)}",
+        "comps_used_count": 0,
+        "error": str(error)
+    }
+
+
 def estimate_price_with_llm(
     listing: Dict[str, Any],
     model: str = DEFAULT_MODEL
@@ -34,73 +378,244 @@ def estimate_price_with_llm(
     Returns:
         Dictionary with estimated price data (p50, confidence, reasoning)
     """
-    client = OpenAI(api_key=get_openai_api_key())
+    request = _build_price_request(listing, model)
+    cache_key, cached = _get_cached_price(request)
+    if cached is not None:
+        return cached
     
-    # Extract details
-    title = listing.get("title", "")
-    description = listing.get("description", "")
-    price = listing.get("price")
-    mileage = listing.get("mileage")
-    vehicle_type = listing.get("vehicle_type", "car")
-    
-    # Build Prompt
-    prompt = f"""
-    You are an expert vehicle appraiser. I need you to estimate the current fair market value (Private Party) for the following vehicle.
-    
-    ## Vehicle Details
-    - Title: {title}
-    - Description: {description}
-    - Listed Price: {price if price else "Not provided"}
-    - Mileage: {mileage if mileage else "Not provided"}
-    - Type: {vehicle_type}
-    
-    ## Task
-    1. Identify the Year, Make, Model, and Trim from the text.
-    2. Estimate the fair market value range for this specific vehicle condition and mileage.
-    3. Provide a single point estimate (P50) for the fair market value.
-    4. Provide a confidence score (0.0 - 1.0) based on how much info is available and how standard the vehicle is.
-    5. Explain your reasoning briefly.
-    
-    ## Output Format
-    You MUST return valid JSON with the following structure:
-    {{
-        "estimated_market_price_p50": <number>,
-        "estimated_market_price_p25": <number>,
-        "estimated_market_price_p75": <number>,
-        "confidence": <number between 0 and 1>,
-        "reasoning": "<string explanation>",
-        "comps_used_count": <number, estimate how many similar listings exist in the market generally, e.g. 10, 50, 100>
-    }}
+    client = _get_client()
+    
+    try:
+        response = _create_completion(client, request)
+        result = _parse_price_response(response.choices[0].message.content, model)
+        _cache_price(cache_key, result)
+        return result
+        
+    except Exception as e:
+        logger.error(f"LLM Pricing failed: {e}")
+        # Return fallback
+        return _fallback_price(listing, e)
+
+
+async def estimate_price_with_llm_async(
+    listing: Dict[str, Any],
+    model: str = DEFAULT_MODEL,
+    client: Optional[AsyncOpenAI] = None,
+    rate_limiters: Optional[Tuple[RateLimiter, RateLimiter]] = None,
+) -> Dict[str, Any]:
+    """
+    Estimate market price using LLM knowledge (async version).
+    
+    Args:
+        listing: Listing dictionary containing title, description, price, mileage, etc.
+        model: OpenAI model to use
+        client: Optional shared AsyncOpenAI client (created and closed
+            per call if None)
+        rate_limiters: Optional (requests, tokens) per-minute limiters to
+            wait on before calling the API (cache hits skip them)
+        
+    Returns:
+        Dictionary with estimated price data (p50, confidence, reasoning)
     """
+    request = _build_price_request(listing, model)
+    cache_key, cached = _get_cached_price(request)
+    if cached is not None:
+        return cached
+    
+    owns_client = client is None
+    if owns_client:
+        client = AsyncOpenAI(api_key=get_openai_api_key(), timeout=OPENAI_TIMEOUT, max_retries=0)
     
     try:
-        response = client.chat.completions.create(
-            model=model,
-            messages=[
-                {"role": "system", "content": "You are a helpful and precise vehicle appraiser."},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=DEFAULT_TEMPERATURE,
-            max_tokens=MAX_OUTPUT_TOKENS,
-            response_format={"type": "json_object"}
-        )
+        if rate_limiters is not None:
+            await _acquire_rate_limits(rate_limiters, request)
+        response = await _create_completion_async(client, request)
+        result = _parse_price_response(response.choices[0].message.content, model)
+        _cache_price(cache_key, result)
+        return result
         
-        content = response.choices[0].message.content
-        result = json.loads(content)
+    except Exception as e:
+        logger.error(f"LLM Pricing failed: {e}")
+        return _fallback_price(listing, e)
+    
+    finally:
+        if owns_client:
+            await client.close()
+
+
+async def stream_price_with_llm(
+    listing: Dict[str, Any],
+    model: str = DEFAULT_MODEL,
+    client: Optional[AsyncOpenAI] = None,
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Estimate market price, yielding the p50 as soon as it is streamed.
+    
+    The completion is streamed. As soon as estimated_market_price_p50 is
+    complete (it is the first schema field) a partial result
+    {"estimated_market_price_p50": ..., "partial": True} is yielded, so
+    callers that only need p50 can stop iterating early (then aclose() the
+    generator, e.g. via contextlib.aclosing, to release the stream at once).
+    The full estimate (or the fallback on failure) is always yielded last.
+    
+    Args:
+        listing: Listing dictionary containing title, description, price, mileage, etc.
+        model: OpenAI model to use
+        client: Optional shared AsyncOpenAI client (created and closed
+            per call if None)
         
-        # Add metadata
-        result["source"] = "llm_estimation"
-        result["model_used"] = model
+    Yields:
+        Partial p50 result, then the complete estimate dictionary
+    """
+    request = _build_price_request(listing, model)
+    cache_key, cached = _get_cached_price(request)
+    if cached is not None:
+        yield cached
+        return
+    
+    owns_client = client is None
+    if owns_client:
+        client = AsyncOpenAI(api_key=get_openai_api_key(), timeout=OPENAI_TIMEOUT, max_retries=0)
+    
+    stream = None
+    content = ""
+    p50_sent = False
+    try:
+        stream = await _create_completion_async(client, {**request, "stream": True})
         
-        return result
+        async for chunk in stream:
+            delta = chunk.choices[0].delta.content if chunk.choices else None
+            if not delta:
+                continue
+            content += delta
+            
+            if not p50_sent:
+                match = _P50_RE.search(content)
+                if match:
+                    p50_sent = True
+                    yield {"estimated_market_price_p50": float(match.group(1)), "partial": True}
+        
+        result = _parse_price_response(content, model)
+        _cache_price(cache_key, result)
         
     except Exception as e:
         logger.error(f"LLM Pricing failed: {e}")
-        # Return fallback
-        return {
-            "estimated_market_price_p50": price if price else 0,
-            "confidence": 0.1,
-            "reasoning": f"LLM estimation failed: {str(e)}",
-            "comps_used_count": 0,
-            "error": str(e)
-        }
+        result = _fallback_price(listing, e)
+    
+    finally:
+        # Also runs when the caller stops after the partial p50
+        if stream is not None:
+            await stream.close()
+        if owns_client:
+            await client.close()
+    
+    yield result
+
+
+async def estimate_prices_with_llm_async(
+    listings: List[Dict[str, Any]],
+    model: str = DEFAULT_MODEL,
+    max_concurrent: int = PRICER_CONCURRENCY,
+    client: Optional[AsyncOpenAI] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Estimate market prices for many listings concurrently.
+    
+    Requests share one AsyncOpenAI client (connection pool). At most
+    max_concurrent are in flight at once, and requests are paced to
+    STAGE7_PRICER_RPM requests and STAGE7_PRICER_TPM tokens per minute.
+    
+    Args:
+        listings: List of listing dictionaries
+        model: OpenAI model to use
+        max_concurrent: Maximum number of concurrent requests
+        client: Optional shared AsyncOpenAI client (created and closed
+            per batch if None)
+        
+    Returns:
+        List of price estimate dictionaries (same order as listings);
+        failed listings get the fallback estimate
+    """
+    owns_client = client is None
+    if owns_client:
+        client = AsyncOpenAI(api_key=get_openai_api_key(), timeout=OPENAI_TIMEOUT, max_retries=0)
+    
+    semaphore = asyncio.Semaphore(max_concurrent)
+    rate_limiters = _new_rate_limiters()
+    start_time = time.time()
+    
+    async def price_one(listing: Dict[str, Any]) -> Dict[str, Any]:
+        async with semaphore:
+            return await estimate_price_with_llm_async(
+                listing, model=model, client=client, rate_limiters=rate_limiters
+            )
+    
+    try:
+        results = await asyncio.gather(*(price_one(listing) for listing in listings))
+    finally:
+        if owns_client:
+            await client.close()
+    
+    logger.info(f"Priced {len(listings)} listings in {time.time() - start_time:.2f}s")
+    return list(results)
+
+
+def estimate_prices_with_llm_batch(
+    listings: List[Dict[str, Any]],
+    model: str = DEFAULT_MODEL,
+    poll_interval: float = 30.0,
+    max_wait_seconds: Optional[float] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Estimate market prices for many listings using the OpenAI Batch API.
+    
+    Intended for offline bulk pricing: all prompts are submitted as Batch
+    API jobs (billed at a discount) and this call blocks until they
+    complete. Listings whose request failed (or all listings, if a job
+    failed) get the fallback estimate.
+    
+    Args:
+        listings: List of listing dictionaries
+        model: OpenAI model to use
+        poll_interval: Seconds between batch status checks
+        max_wait_seconds: Give up waiting after this many seconds
+        
+    Returns:
+        List of price estimate dictionaries (same order as listings)
+    """
+    # custom_id is prefixed with the position so duplicate listing_ids
+    # cannot collide
+    custom_ids = [
+        f"{i}:{listing.get('listing_id', 'unknown')}" for i, listing in enumerate(listings)
+    ]
+    requests = [
+        (custom_id, _build_price_request(listing, model))
+        for custom_id, listing in zip(custom_ids, listings)
+    ]
+    
+    try:
+        batch_results = run_chat_batch(
+            requests,
+            poll_interval=poll_interval,
+            max_wait_seconds=max_wait_seconds,
+            file_name="stage7_pricing_batch.jsonl",
+        )
+    except Exception as e:
+        logger.error(f"LLM Pricing batch failed: {e}")
+        return [_fallback_price(listing, e) for listing in listings]
+    
+    results = []
+    for custom_id, listing in zip(custom_ids, listings):
+        line = batch_results.get(custom_id) or {}
+        response = line.get("response") or {}
+        body = response.get("body") or {}
+        try:
+            if response.get("status_code") != 200 or not body.get("choices"):
+                raise ValueError(line.get("error") or body.get("error") or "no result")
+            content = body["choices"][0]["message"]["content"]
+            results.append(_parse_price_response(content, model))
+        except Exception as e:
+            logger.error(f"LLM Pricing failed for {custom_id}: {e}")
+            results.append(_fallback_price(listing, e))
+    
+    return results
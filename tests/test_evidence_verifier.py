@@ -17,7 +17,7 @@ from stage4.evidence_verifier import (
     is_explicit_evidence,
     classify_verification_level,
 )
-from stage4.text_prep import check_evidence_exists
+from stage4.text_prep import check_evidence_exists, normalize_for_match
 
 
 class TestEvidenceExists:
@@ -57,6 +57,19 @@ class TestEvidenceExists:
         original = "The car has been finely tuned by a mechanic."
         
         assert check_evidence_exists(evidence, original)
+    
+    def test_precomputed_normalized_original(self):
+        """Test passing a precomputed normalized original gives the same result."""
+        original = "Selling my car.\n\nThe car   is DEFECTED."
+        normalized = normalize_for_match(original)
+        
+        assert normalized == "selling my car. the car is defected."
+        assert check_evidence_exists("the car is defected", original, normalized)
+        assert not check_evidence_exists("write off", original, normalized)
+    
+    def test_whitespace_only_evidence_rejected(self):
+        """Test that whitespace-only evidence does not count as found."""
+        assert not check_evidence_exists("  \n ", "The car is defected.")
 
 
 class TestVerifySingleSignal:
@@ -3,7 +3,7 @@ Tests for Flipability Score Calculator
 """
 
 import pytest
-from src.common.scoring.flipability import calculate_flipability
+from src.common.scoring.flipability import calculate_flipability, calculate_flipability_batch
 
 def test_flipability_high_score():
     """
@@ -158,3 +158,45 @@ def test_flipability_service_history_none():
     assert components["risk_multiplier"] == 0.70
     assert len(result["penalties_applied"]) == 1
     assert result["penalties_applied"][0]["type"] == "service_history_none"
+
+def test_flipability_batch_matches_single():
+    """
+    Batch scores match calculate_flipability for each listing.
+    """
+    stage7_rows = [
+        {"asking_price": 20000, "estimated_market_price_p50": 25000, "comps_used_count": 60},
+        {"asking_price": 26000, "estimated_market_price_p50": 25000, "comps_used_count": 3},
+        {"asking_price": None, "estimated_market_price_p50": 25000, "comps_used_count": 15},
+        {"asking_price": 24000, "estimated_market_price_p50": 25000, "comps_used_count": 25},
+    ]
+    stage4_rows = [
+        {"signals": {}, "service_history_level": "full"},
+        {"signals": {}, "service_history_level": "none"},
+        {"signals": {"accident_history": [{"type": "writeoff", "verification_level": "verified"}]}},
+        {"signals": {"mods_performance": [{"type": "tuned", "verification_level": "inferred"}]}},
+    ]
+
+    expected = [
+        calculate_flipability(stage7, stage4)["flipability_score"]
+        for stage7, stage4 in zip(stage7_rows, stage4_rows)
+    ]
+
+    assert calculate_flipability_batch(stage7_rows, stage4_rows) == expected
+
+def test_flipability_batch_matches_single_float_inputs():
+    """
+    Batch scores match calculate_flipability for non-integer comps and prices.
+    """
+    comps_values = [49.5, 50.0, 19.5, 20.0, 9.5, 10.0, 4.5, 5.0]
+    stage7_rows = [
+        {"asking_price": 23999.5, "estimated_market_price_p50": 25000.25, "comps_used_count": comps}
+        for comps in comps_values
+    ]
+    stage4_rows = [{"signals": {}, "service_history_level": "full"} for _ in comps_values]
+
+    expected = [
+        calculate_flipability(stage7, stage4)["flipability_score"]
+        for stage7, stage4 in zip(stage7_rows, stage4_rows)
+    ]
+
+    assert calculate_flipability_batch(stage7_rows, stage4_rows) == expected
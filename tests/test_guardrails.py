@@ -343,5 +343,54 @@ class TestSignalProperties:
             assert signal["confidence"] >= 0.9
 
 
+class TestRulePrefilter:
+    """Test the optional single-pass rule prefilter."""
+    
+    def test_matching_rule_ids_gives_same_signals(self, monkeypatch):
+        """Test filtering rules by matched ids leaves signals unchanged."""
+        import re
+        import stage4.guardrails as guardrails
+        
+        text = normalize_text(
+            "Evo",
+            "Write off, not running, E85 tuned track car. Repairable write-off."
+        )
+        expected = run_guardrails(text)
+        
+        # Stand-in for the Hyperscan scan: ids of rules matching anywhere
+        monkeypatch.setattr(
+            guardrails,
+            "_matching_rule_ids",
+            lambda t: {
+                rule_id
+                for rule_id, (pattern, _, _, _) in enumerate(guardrails.ALL_RULES)
+                if re.search(pattern, t)
+            },
+        )
+        
+        assert run_guardrails(text) == expected
+    
+    def test_hyperscan_prefilter_gives_same_signals(self, monkeypatch):
+        """Test the real Hyperscan prefilter leaves signals unchanged."""
+        pytest.importorskip("hyperscan")
+        import stage4.guardrails as guardrails
+        
+        text = normalize_text(
+            "Evo",
+            "Write off, not running, E85 tuned track car. Repairable write-off."
+        )
+        
+        monkeypatch.setattr(guardrails, "USE_HYPERSCAN", True)
+        guardrails._hyperscan_db.cache_clear()
+        try:
+            assert guardrails._hyperscan_db() is not None
+            with_hyperscan = run_guardrails(text)
+        finally:
+            guardrails._hyperscan_db.cache_clear()
+        
+        monkeypatch.setattr(guardrails, "_matching_rule_ids", lambda t: None)
+        assert with_hyperscan == run_guardrails(text)
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,307 @@
+"""
+Tests for the Stage 7 LLM Pricer.
+
+Tests that:
+- Long descriptions are clipped without losing condition/damage facts
+- Sync, async, streaming and Batch API paths parse a mocked OpenAI client
+- Estimates are cached in memory and on disk by exact request
+- Transient errors are retried; other failures fall back
+- Rate limits that cannot be met fall back instead of calling the API
+"""
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from openai import APITimeoutError
+
+import stage7.llm_pricer as llm_pricer
+from common.caching import SQLiteCache, get_pricing_cache
+from common.rate_limiter import RateLimitConfig, RateLimiter
+from stage7.llm_pricer import _MAX_DESC_CHARS, _truncate_description
+
+
+ESTIMATE = {
+    "estimated_market_price_p50": 15000.0,
+    "estimated_market_price_p25": 13000.0,
+    "estimated_market_price_p75": 17000.0,
+    "confidence": 0.7,
+    "reasoning": "Typical price for the model and mileage.",
+    "comps_used_count": 40,
+}
+
+LISTING = {
+    "listing_id": "l1",
+    "title": "2015 Toyota Corolla",
+    "description": "Serviced regularly, 120k km.",
+    "price": 14000,
+    "mileage": 120000,
+    "vehicle_type": "car",
+}
+
+
+def _completion(content: str):
+    """Minimal chat completion response."""
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+class FakeClient:
+    """Sync OpenAI client stand-in returning queued results (or raising errors)."""
+    
+    def __init__(self, *results):
+        self.results = list(results) or [json.dumps(ESTIMATE)]
+        self.requests = []
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+    
+    def _create(self, **request):
+        self.requests.append(request)
+        result = self.results.pop(0) if len(self.results) > 1 else self.results[0]
+        if isinstance(result, Exception):
+            raise result
+        return _completion(result)
+
+
+class FakeAsyncClient(FakeClient):
+    """Async OpenAI client stand-in; streams the content in small chunks."""
+    
+    closed = False
+    
+    async def close(self):
+        self.closed = True
+    
+    async def _create(self, **request):
+        response = FakeClient._create(self, **request)
+        if not request.get("stream"):
+            return response
+        self.stream = FakeStream(response.choices[0].message.content)
+        return self.stream
+
+
+class FakeStream:
+    """Streamed completion stand-in yielding the content in 7-char chunks."""
+    
+    def __init__(self, content):
+        self.content = content
+        self.closed = False
+    
+    async def close(self):
+        self.closed = True
+    
+    async def __aiter__(self):
+        for i in range(0, len(self.content), 7):
+            delta = SimpleNamespace(content=self.content[i:i + 7])
+            yield SimpleNamespace(choices=[SimpleNamespace(delta=delta)])
+
+
+@pytest.fixture
+def disk_cache(monkeypatch, tmp_path):
+    """Empty memory cache and a per-test SQLite disk cache."""
+    cache = SQLiteCache(tmp_path / "pricing.sqlite3")
+    monkeypatch.setattr(llm_pricer, "get_pricing_disk_cache", lambda: cache)
+    get_pricing_cache().clear()
+    yield cache
+    get_pricing_cache().clear()
+
+
+class TestDescriptionTruncation:
+    """Test clipping of long descriptions before pricing."""
+    
+    def test_short_description_unchanged(self):
+        """Test descriptions within the budget are passed through."""
+        description = "Engine is blown. Serviced regularly."
+        
+        assert _truncate_description(description) == description
+    
+    def test_damage_sentence_survives_truncation(self):
+        """Test a damage sentence after filler is kept, with head context."""
+        description = (
+            "Selling my 2015 Toyota Corolla. Great little car, lovely colour. "
+            + "Drives nicely around town and fun on weekends. " * 60
+            + "Engine is blown and the gearbox slips. Serviced regularly."
+        )
+        assert len(description) > _MAX_DESC_CHARS
+        
+        clipped = _truncate_description(description)
+        
+        assert len(clipped) <= _MAX_DESC_CHARS
+        assert "Engine is blown and the gearbox slips." in clipped
+        # Budget is filled from the start, in original order
+        assert clipped.startswith("Selling my 2015 Toyota Corolla. Great little car, lovely colour.")
+        assert clipped.endswith("Engine is blown and the gearbox slips. Serviced regularly.")
+
+
+class TestSyncPricer:
+    """Test estimate_price_with_llm with a mocked client."""
+    
+    def test_parses_estimate(self, monkeypatch, disk_cache):
+        """Test the response is parsed and annotated."""
+        client = FakeClient()
+        monkeypatch.setattr(llm_pricer, "_get_client", lambda: client)
+        
+        result = llm_pricer.estimate_price_with_llm(LISTING, model="gpt-4o-mini")
+        
+        assert result["estimated_market_price_p50"] == 15000.0
+        assert result["source"] == "llm_estimation"
+        assert result["model_used"] == "gpt-4o-mini"
+        assert client.requests[0]["response_format"]["type"] == "json_schema"
+    
+    def test_memory_and_disk_cache_hits(self, monkeypatch, disk_cache):
+        """Test repeated requests are served from memory, then from disk."""
+        client = FakeClient()
+        monkeypatch.setattr(llm_pricer, "_get_client", lambda: client)
+        
+        first = llm_pricer.estimate_price_with_llm(LISTING)
+        assert llm_pricer.estimate_price_with_llm(LISTING) == first
+        
+        get_pricing_cache().clear()
+        assert llm_pricer.estimate_price_with_llm(LISTING) == first
+        assert len(client.requests) == 1
+    
+    def test_different_description_not_shared(self, monkeypatch, disk_cache):
+        """Test listings differing only in description are priced separately."""
+        client = FakeClient()
+        monkeypatch.setattr(llm_pricer, "_get_client", lambda: client)
+        
+        llm_pricer.estimate_price_with_llm(LISTING)
+        llm_pricer.estimate_price_with_llm({**LISTING, "description": "Engine blown, not running."})
+        
+        assert len(client.requests) == 2
+    
+    def test_retries_transient_error(self, monkeypatch, disk_cache):
+        """Test a timeout is retried and the next attempt succeeds."""
+        timeout = APITimeoutError(request=httpx.Request("POST", "https://api.openai.com/v1/chat/completions"))
+        client = FakeClient(timeout, json.dumps(ESTIMATE))
+        monkeypatch.setattr(llm_pricer, "_get_client", lambda: client)
+        monkeypatch.setattr(llm_pricer, "_retry_delay", lambda attempt: 0.0)
+        
+        result = llm_pricer.estimate_price_with_llm(LISTING)
+        
+        assert result["estimated_market_price_p50"] == 15000.0
+        assert len(client.requests) == 2
+    
+    def test_invalid_response_falls_back(self, monkeypatch, disk_cache):
+        """Test an unparseable response returns the uncached fallback."""
+        client = FakeClient("not json")
+        monkeypatch.setattr(llm_pricer, "_get_client", lambda: client)
+        
+        result = llm_pricer.estimate_price_with_llm(LISTING)
+        
+        assert "error" in result
+        assert result["estimated_market_price_p50"] == LISTING["price"]
+        assert disk_cache.get(llm_pricer._price_cache_key(client.requests[0])) is None
+
+
+class TestAsyncPricer:
+    """Test the async, streaming and rate-limited paths."""
+    
+    def test_batch_preserves_order(self, disk_cache):
+        """Test concurrent pricing returns one estimate per listing, in order."""
+        client = FakeAsyncClient()
+        listings = [{**LISTING, "listing_id": f"l{i}", "mileage": 100000 + i} for i in range(3)]
+        
+        results = asyncio.run(llm_pricer.estimate_prices_with_llm_async(listings, client=client))
+        
+        assert len(results) == 3
+        assert all(r["estimated_market_price_p50"] == 15000.0 for r in results)
+        assert [r["messages"][1]["content"].split("mileage=")[1][:6] for r in client.requests] == [
+            "100000", "100001", "100002",
+        ]
+    
+    def test_owned_client_closed(self, monkeypatch, disk_cache):
+        """Test a client created for a single call is closed afterwards."""
+        client = FakeAsyncClient()
+        monkeypatch.setattr(llm_pricer, "AsyncOpenAI", lambda **kwargs: client)
+        monkeypatch.setattr(llm_pricer, "get_openai_api_key", lambda: "test-key")
+        
+        result = asyncio.run(llm_pricer.estimate_price_with_llm_async(LISTING))
+        
+        assert result["estimated_market_price_p50"] == 15000.0
+        assert client.closed
+    
+    def test_stream_yields_partial_p50_then_full(self, disk_cache):
+        """Test streaming yields the p50 early, then the full estimate."""
+        client = FakeAsyncClient()
+        
+        async def collect():
+            return [r async for r in llm_pricer.stream_price_with_llm(LISTING, client=client)]
+        
+        partial, full = asyncio.run(collect())
+        
+        assert partial == {"estimated_market_price_p50": 15000.0, "partial": True}
+        assert full["reasoning"] == ESTIMATE["reasoning"]
+    
+    def test_stream_stopped_early_closes_stream_and_client(self, monkeypatch, disk_cache):
+        """Test stopping after the partial p50 releases the stream and owned client."""
+        client = FakeAsyncClient()
+        monkeypatch.setattr(llm_pricer, "AsyncOpenAI", lambda **kwargs: client)
+        monkeypatch.setattr(llm_pricer, "get_openai_api_key", lambda: "test-key")
+        
+        async def first_only():
+            stream = llm_pricer.stream_price_with_llm(LISTING)
+            partial = await stream.__anext__()
+            await stream.aclose()
+            return partial
+        
+        partial = asyncio.run(first_only())
+        
+        assert partial["partial"] is True
+        assert client.stream.closed
+        assert client.closed
+    
+    def test_rate_limit_timeout_falls_back(self, disk_cache):
+        """Test a request that cannot get rate-limit capacity is not sent."""
+        client = FakeAsyncClient()
+        config = RateLimitConfig(calls_per_minute=1, burst_limit=1, max_wait_seconds=0.05)
+        limiters = (RateLimiter(config), RateLimiter(RateLimitConfig(calls_per_minute=100000, burst_limit=100000)))
+        
+        async def price_two():
+            first = await llm_pricer.estimate_price_with_llm_async(LISTING, client=client, rate_limiters=limiters)
+            second = await llm_pricer.estimate_price_with_llm_async(
+                {**LISTING, "mileage": 1}, client=client, rate_limiters=limiters
+            )
+            return first, second
+        
+        first, second = asyncio.run(price_two())
+        
+        assert "error" not in first
+        assert "error" in second
+        assert len(client.requests) == 1
+    
+    def test_token_bucket_fits_long_request_at_low_tpm(self, monkeypatch):
+        """Test a low TPM still sizes the token bucket for a full request."""
+        monkeypatch.setattr(llm_pricer, "PRICER_TOKENS_PER_MINUTE", 30000)
+        request = llm_pricer._build_price_request(
+            {**LISTING, "description": "Engine is blown. " * 500}, "gpt-4o-mini"
+        )
+        
+        _, token_limiter = llm_pricer._new_rate_limiters()
+        
+        assert llm_pricer._estimate_request_tokens(request) <= token_limiter.config.burst_limit
+
+
+class TestBatchPricer:
+    """Test the Batch API path with a mocked batch runner."""
+    
+    def test_maps_results_and_failures(self, monkeypatch):
+        """Test batch lines map back by position; failed lines fall back."""
+        def fake_run_chat_batch(requests, **kwargs):
+            ok, failed = requests
+            return {
+                ok[0]: {"response": {"status_code": 200, "body": {
+                    "choices": [{"message": {"content": json.dumps(ESTIMATE)}}],
+                }}},
+                failed[0]: {"response": {"status_code": 500, "body": {"error": "server error"}}},
+            }
+        
+        monkeypatch.setattr(llm_pricer, "run_chat_batch", fake_run_chat_batch)
+        
+        ok, failed = llm_pricer.estimate_prices_with_llm_batch([LISTING, {**LISTING, "listing_id": "l2"}])
+        
+        assert ok["estimated_market_price_p50"] == 15000.0
+        assert "error" in failed
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
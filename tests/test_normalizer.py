@@ -0,0 +1,102 @@
+"""
+Tests for the Signal Normalizer.
+
+Tests that:
+- Severity and verification_level synonyms map to schema values
+- Upper/mixed-case values are lowercased for signals, claims and red flags
+- Unknown values fall back to the defaults (medium / inferred)
+"""
+
+import pytest
+
+from stage4.normalizer import SignalNormalizer
+
+
+@pytest.fixture
+def normalizer():
+    """Normalizer with the schema-loaded valid values."""
+    return SignalNormalizer()
+
+
+def _item(**fields):
+    """Minimal LLM item with evidence, so it is not filtered out."""
+    return {"type": "other", "evidence_text": "Car is defected.", "confidence": 0.8, **fields}
+
+
+class TestSeverityMapping:
+    """Test severity values on signals and red flags."""
+    
+    @pytest.mark.parametrize("raw,expected", [
+        ("low", "low"),
+        ("medium", "medium"),
+        ("high", "high"),
+        ("minor", "low"),
+        ("med", "medium"),
+        ("moderate", "medium"),
+        ("severe", "high"),
+        ("critical", "high"),
+        ("HIGH", "high"),
+        ("Critical", "high"),
+    ])
+    def test_signal_severity(self, normalizer, raw, expected):
+        """Test each valid value and synonym maps to its schema value."""
+        signal = normalizer.normalize_signal(_item(severity=raw), "legality")
+        
+        assert signal["severity"] == expected
+    
+    @pytest.mark.parametrize("raw", ["HIGH", "High", "high"])
+    def test_red_flag_severity_case_insensitive(self, normalizer, raw):
+        """Test red flags lowercase severity instead of defaulting it."""
+        flag = normalizer.normalize_red_flag(_item(severity=raw))
+        
+        assert flag["severity"] == "high"
+    
+    @pytest.mark.parametrize("raw", ["extreme", "", None, 3])
+    def test_unknown_severity_defaults_to_medium(self, normalizer, raw):
+        """Test unrecognised severities fall back to medium."""
+        signal = normalizer.normalize_signal(_item(severity=raw), "legality")
+        flag = normalizer.normalize_red_flag(_item(severity=raw))
+        
+        assert signal["severity"] == "medium"
+        assert flag["severity"] == "medium"
+
+
+class TestVerificationLevelMapping:
+    """Test verification_level values on signals, claims and red flags."""
+    
+    @pytest.mark.parametrize("raw,expected", [
+        ("verified", "verified"),
+        ("inferred", "inferred"),
+        ("confirmed", "verified"),
+        ("explicit", "verified"),
+        ("implied", "inferred"),
+        ("VERIFIED", "verified"),
+        ("Implied", "inferred"),
+    ])
+    def test_all_item_kinds(self, normalizer, raw, expected):
+        """Test signals, maintenance claims and red flags map the same way."""
+        item = _item(verification_level=raw)
+        
+        assert normalizer.normalize_signal(item, "legality")["verification_level"] == expected
+        assert normalizer.normalize_maintenance_claim(item)["verification_level"] == expected
+        assert normalizer.normalize_red_flag(item)["verification_level"] == expected
+    
+    @pytest.mark.parametrize("raw", ["guessed", "", None])
+    def test_unknown_verification_level_defaults_to_inferred(self, normalizer, raw):
+        """Test unrecognised verification levels fall back to inferred."""
+        item = _item(verification_level=raw)
+        
+        assert normalizer.normalize_signal(item, "legality")["verification_level"] == "inferred"
+        assert normalizer.normalize_maintenance_claim(item)["verification_level"] == "inferred"
+        assert normalizer.normalize_red_flag(item)["verification_level"] == "inferred"
+    
+    def test_missing_fields_use_defaults(self, normalizer):
+        """Test absent severity / verification_level get the defaults."""
+        signal = normalizer.normalize_signal(_item(), "legality")
+        
+        assert signal["severity"] == "medium"
+        assert signal["verification_level"] == "inferred"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,98 @@
+"""
+Tests for the OpenAI Batch API helpers.
+
+Tests that:
+- Large request lists are split into jobs under the per-job limit
+- Results from every job are merged by custom_id
+- Batch API usage is costed at the batch discount
+"""
+
+import json
+from types import SimpleNamespace
+
+import pytest
+
+import common.openai_batch as openai_batch
+from common.cost_calculator import BATCH_API_DISCOUNT, calculate_cost
+
+
+class FakeBatchClient:
+    """Stand-in OpenAI client whose batch jobs complete immediately."""
+    
+    def __init__(self):
+        self.uploads = {}
+        self.jobs = {}
+        self.files = SimpleNamespace(create=self._create_file, content=self._content)
+        self.batches = SimpleNamespace(create=self._create_batch, retrieve=self.jobs.get)
+    
+    def _create_file(self, file, purpose):
+        file_id = f"file-{len(self.uploads)}"
+        self.uploads[file_id] = file[1].getvalue()
+        return SimpleNamespace(id=file_id)
+    
+    def _create_batch(self, input_file_id, endpoint, completion_window):
+        batch = SimpleNamespace(
+            id=f"batch-{len(self.jobs)}",
+            status="completed",
+            output_file_id=input_file_id,
+            error_file_id=None,
+        )
+        self.jobs[batch.id] = batch
+        return batch
+    
+    def _content(self, file_id):
+        # Echo each request line back as its result line
+        lines = [
+            json.dumps({"custom_id": json.loads(line)["custom_id"], "response": {}})
+            for line in self.uploads[file_id].decode("utf-8").splitlines()
+        ]
+        return SimpleNamespace(content="\n".join(lines).encode("utf-8"))
+
+
+class TestRunChatBatch:
+    """Test splitting requests across Batch API jobs."""
+    
+    def test_requests_split_under_job_limit(self, monkeypatch):
+        """Test each job stays under the limit and all results are returned."""
+        monkeypatch.setattr(openai_batch, "MAX_REQUESTS_PER_BATCH", 2)
+        client = FakeBatchClient()
+        requests = [(f"{i}:l{i}", {"model": "gpt-4o-mini"}) for i in range(5)]
+        
+        results = openai_batch.run_chat_batch(requests, client=client)
+        
+        assert len(client.jobs) == 3
+        assert all(
+            len(content.splitlines()) <= 2 for content in client.uploads.values()
+        )
+        assert sorted(results) == sorted(custom_id for custom_id, _ in requests)
+    
+    def test_failed_job_raises(self, monkeypatch):
+        """Test a job ending in a non-completed status raises BatchJobError."""
+        client = FakeBatchClient()
+        create_batch = client._create_batch
+        
+        def failing_batch(**kwargs):
+            batch = create_batch(**kwargs)
+            batch.status = "failed"
+            return batch
+        
+        client.batches.create = failing_batch
+        
+        with pytest.raises(openai_batch.BatchJobError):
+            openai_batch.run_chat_batch([("0:l0", {})], client=client)
+
+
+class TestBatchCost:
+    """Test Batch API usage is costed at the discounted price."""
+    
+    def test_batch_discount_applied(self):
+        """Test batch=True scales the on-demand cost by the discount."""
+        on_demand, _ = calculate_cost(1_000_000, 1_000_000, "gpt-4o-mini")
+        batch, pricing_info = calculate_cost(1_000_000, 1_000_000, "gpt-4o-mini", batch=True)
+        
+        assert batch == pytest.approx(on_demand * BATCH_API_DISCOUNT)
+        assert pricing_info["total_cost"] == pytest.approx(batch)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
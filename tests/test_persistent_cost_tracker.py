@@ -0,0 +1,139 @@
+"""
+Tests for the Persistent Cost Tracker.
+
+Tests that:
+- Recording appends one ndjson line per call
+- Statistics and recent usage read the appended records back
+- A legacy usage_history.json is migrated on first use
+- Unreadable lines are skipped and reset clears the history
+- Recording does not regenerate the usage report
+"""
+
+import json
+
+import pytest
+
+from common.cost_calculator import TokenUsage
+from common.persistent_cost_tracker import (
+    HISTORY_FILE_NAME,
+    LEGACY_HISTORY_FILE_NAME,
+    PersistentCostTracker,
+)
+
+
+def _usage(prompt_tokens=100, completion_tokens=50, model="gpt-4o-mini"):
+    return TokenUsage(
+        prompt_tokens=prompt_tokens,
+        completion_tokens=completion_tokens,
+        total_tokens=prompt_tokens + completion_tokens,
+        model=model,
+    )
+
+
+@pytest.fixture
+def tracker(tmp_path, monkeypatch):
+    """Tracker writing to a temp file, with report generation stubbed out."""
+    monkeypatch.setattr(PersistentCostTracker, "_update_report", lambda self: None)
+    return PersistentCostTracker(storage_path=tmp_path / HISTORY_FILE_NAME)
+
+
+class TestRecordUsage:
+    """Test appending and reading usage records."""
+    
+    def test_record_appends_one_line_per_call(self, tracker):
+        """Test each record_usage call appends a JSON line."""
+        tracker.record_usage(_usage(), listing_id="a1")
+        tracker.record_usage(_usage(model="gpt-4o"), listing_id="a2")
+        
+        lines = tracker.storage_path.read_text(encoding="utf-8").splitlines()
+        
+        assert [json.loads(line)["listing_id"] for line in lines] == ["a1", "a2"]
+    
+    def test_stats_read_back_records(self, tracker):
+        """Test cumulative stats and recent usage reflect recorded calls."""
+        tracker.record_usage(_usage(), listing_id="a1")
+        tracker.record_usage(_usage(), listing_id="a2")
+        tracker.record_usage(_usage(model="gpt-4o"), listing_id="a3")
+        
+        stats = tracker.get_cumulative_stats()
+        
+        assert stats["total_calls"] == 3
+        assert stats["total_tokens"] == 450
+        assert list(stats["model_breakdown"]) == ["gpt-4o", "gpt-4o-mini"]
+        assert stats["model_breakdown"]["gpt-4o-mini"]["calls"] == 2
+        assert [r.listing_id for r in tracker.get_recent_usage(limit=2)] == ["a2", "a3"]
+    
+    def test_unreadable_line_skipped(self, tracker):
+        """Test a truncated line does not break reading the history."""
+        tracker.record_usage(_usage(), listing_id="a1")
+        with open(tracker.storage_path, "ab") as f:
+            f.write(b'{"timestamp": "2024-01-15T10:30\n')
+        tracker.record_usage(_usage(), listing_id="a2")
+        
+        assert tracker.get_cumulative_stats()["total_calls"] == 2
+    
+    def test_record_does_not_regenerate_report(self, tmp_path, monkeypatch):
+        """Test recording only appends and leaves the report alone."""
+        calls = []
+        monkeypatch.setattr(
+            PersistentCostTracker, "_update_report", lambda self: calls.append(1)
+        )
+        tracker = PersistentCostTracker(storage_path=tmp_path / HISTORY_FILE_NAME)
+        
+        for _ in range(3):
+            tracker.record_usage(_usage())
+        
+        assert calls == []
+    
+    def test_reset_clears_history(self, tracker):
+        """Test reset empties the history file."""
+        tracker.record_usage(_usage())
+        tracker.reset()
+        
+        assert tracker.get_cumulative_stats()["total_calls"] == 0
+
+
+class TestLegacyMigration:
+    """Test migrating the legacy single-document history file."""
+    
+    def test_legacy_json_migrated(self, tmp_path, monkeypatch):
+        """Test records in usage_history.json are moved to the ndjson file."""
+        monkeypatch.setattr(PersistentCostTracker, "_update_report", lambda self: None)
+        records = [
+            {
+                "timestamp": f"2024-01-15T10:30:0{i}+00:00",
+                "listing_id": f"a{i}",
+                "model": "gpt-4o-mini",
+                "prompt_tokens": 100,
+                "completion_tokens": 50,
+                "total_tokens": 150,
+                "cost_usd": 0.001,
+            }
+            for i in range(2)
+        ]
+        (tmp_path / LEGACY_HISTORY_FILE_NAME).write_text(
+            json.dumps({"records": records}), encoding="utf-8"
+        )
+        
+        tracker = PersistentCostTracker(storage_path=tmp_path / HISTORY_FILE_NAME)
+        tracker.record_usage(_usage(), listing_id="new")
+        
+        assert [r.listing_id for r in tracker.get_recent_usage(limit=0)] == ["a0", "a1", "new"]
+        assert tracker.get_cumulative_stats()["first_record"] == "2024-01-15T10:30:00+00:00"
+    
+    def test_existing_ndjson_not_overwritten(self, tmp_path, monkeypatch):
+        """Test migration is skipped once the ndjson file exists."""
+        monkeypatch.setattr(PersistentCostTracker, "_update_report", lambda self: None)
+        storage_path = tmp_path / HISTORY_FILE_NAME
+        PersistentCostTracker(storage_path=storage_path).record_usage(_usage(), listing_id="kept")
+        (tmp_path / LEGACY_HISTORY_FILE_NAME).write_text(
+            json.dumps({"records": []}), encoding="utf-8"
+        )
+        
+        tracker = PersistentCostTracker(storage_path=storage_path)
+        
+        assert [r.listing_id for r in tracker.get_recent_usage()] == ["kept"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
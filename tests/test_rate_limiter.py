@@ -0,0 +1,62 @@
+"""
+Tests for the Rate Limiter.
+
+Tests that:
+- acquire(tokens=N) charges N tokens from the bucket
+- Requests larger than the bucket are rejected, not under-charged
+- The async path charges the same way
+"""
+
+import asyncio
+
+import pytest
+
+from common.rate_limiter import RateLimitConfig, RateLimiter
+
+
+def _limiter(burst_limit=1000, calls_per_minute=60):
+    """Limiter whose bucket refills slowly enough not to matter in a test."""
+    return RateLimiter(RateLimitConfig(
+        calls_per_minute=calls_per_minute,
+        burst_limit=burst_limit,
+        max_wait_seconds=0.05,
+    ))
+
+
+class TestAcquireTokens:
+    """Test charging multiple tokens per acquire."""
+    
+    def test_acquire_charges_requested_tokens(self):
+        """Test the full token count is deducted from the bucket."""
+        limiter = _limiter()
+        
+        assert limiter.acquire(tokens=900)
+        assert not limiter.acquire(tokens=200)
+        assert limiter.acquire(tokens=100)
+    
+    def test_acquire_over_burst_limit_raises(self):
+        """Test a request larger than the bucket is rejected."""
+        limiter = _limiter(burst_limit=500)
+        
+        with pytest.raises(ValueError):
+            limiter.acquire(tokens=900)
+        
+        # Nothing was charged
+        assert limiter.acquire(tokens=500)
+    
+    def test_acquire_async_charges_requested_tokens(self):
+        """Test the async path deducts and rejects the same way."""
+        limiter = _limiter()
+        
+        async def acquire_all():
+            first = await limiter.acquire_async(tokens=900)
+            second = await limiter.acquire_async(tokens=200)
+            with pytest.raises(ValueError):
+                await limiter.acquire_async(tokens=1001)
+            return first, second
+        
+        assert asyncio.run(acquire_all()) == (True, False)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -8,6 +8,7 @@ Tests that:
 - Invalid confidence ranges fail
 """
 
+import copy
 import pytest
 from datetime import datetime, timezone
 
@@ -16,9 +17,31 @@ from stage4.schema_validator import (
     validate_or_raise,
     create_minimal_valid_output,
     load_schema,
+    get_validator,
+    get_compiled_validator,
+    shallow_check,
 )
 
 
+# Well-formed signal; invalid-field cases override one key
+VALID_SIGNAL = {
+    "type": "defected",
+    "severity": "high",
+    "verification_level": "verified",
+    "evidence_text": "test evidence",
+    "confidence": 0.9,
+}
+
+
+@pytest.fixture(scope="module")
+def base_output():
+    """Minimal valid output shared by the module; deepcopy before mutating."""
+    return create_minimal_valid_output(
+        listing_id="test123",
+        source_snapshot_id="snap123",
+    )
+
+
 class TestSchemaValidation:
     """Test suite for schema validation."""
     
@@ -29,24 +52,39 @@ class TestSchemaValidation:
         assert "$schema" in schema
         assert "properties" in schema
     
-    def test_minimal_valid_output_passes(self):
+    def test_validator_built_once(self):
+        """Test the schema validator is constructed once and reused."""
+        assert get_validator() is get_validator()
+        assert get_validator().schema is load_schema()
+    
+    def test_compiled_validator_agrees_with_jsonschema(self, base_output):
+        """Test the fastjsonschema fast path accepts/rejects like jsonschema."""
+        fastjsonschema = pytest.importorskip("fastjsonschema")
+        compiled = get_compiled_validator()
+        if compiled is None:
+            pytest.skip("compiled validator disabled or unavailable")
+        
+        invalid = copy.deepcopy(base_output)
+        invalid["payload"]["risk_level_overall"] = "extreme"
+        
+        for output in (base_output, invalid):
+            try:
+                compiled(output)
+                compiled_ok = True
+            except fastjsonschema.JsonSchemaException:
+                compiled_ok = False
+            assert compiled_ok == get_validator().is_valid(output)
+    
+    def test_minimal_valid_output_passes(self, base_output):
         """Test that minimal valid output passes validation."""
-        output = create_minimal_valid_output(
-            listing_id="test123",
-            source_snapshot_id="snap123",
-        )
-        
-        is_valid, errors = validate_stage4_output(output)
+        is_valid, errors = validate_stage4_output(base_output)
         
         assert is_valid, f"Validation failed: {errors}"
         assert len(errors) == 0
     
-    def test_missing_listing_id_fails(self):
+    def test_missing_listing_id_fails(self, base_output):
         """Test that missing listing_id fails validation."""
-        output = create_minimal_valid_output(
-            listing_id="test123",
-            source_snapshot_id="snap123",
-        )
+        output = copy.deepcopy(base_output)
         del output["listing_id"]
         
         is_valid, errors = validate_stage4_output(output)
@@ -54,12 +92,9 @@ class TestSchemaValidation:
         assert not is_valid
         assert any("listing_id" in e for e in errors)
     
-    def test_missing_payload_fails(self):
+    def test_missing_payload_fails(self, base_output):
         """Test that missing payload fails validation."""
-        output = create_minimal_valid_output(
-            listing_id="test123",
-            source_snapshot_id="snap123",
-        )
+        output = copy.deepcopy(base_output)
         del output["payload"]
         
         is_valid, errors = validate_stage4_output(output)
@@ -67,108 +102,26 @@ class TestSchemaValidation:
         assert not is_valid
         assert any("payload" in e for e in errors)
     
-    def test_invalid_severity_enum_fails(self):
-        """Test that invalid severity enum value fails."""
-        output = create_minimal_valid_output(
-            listing_id="test123",
-            source_snapshot_id="snap123",
-        )
-        
-        # Add signal with invalid severity
-        output["payload"]["signals"]["legality"].append({
-            "type": "defected",
-            "severity": "invalid_severity",  # Invalid!
-            "verification_level": "verified",
-            "evidence_text": "test evidence",
-            "confidence": 0.9,
-        })
+    @pytest.mark.parametrize("field,value", [
+        ("severity", "invalid_severity"),
+        ("verification_level", "maybe"),
+        ("confidence", -0.1),
+        ("confidence", 1.5),
+        ("evidence_text", ""),
+    ])
+    def test_invalid_signal_field_fails(self, base_output, field, value):
+        """Test that a signal with one invalid field fails."""
+        output = copy.deepcopy(base_output)
+        
+        output["payload"]["signals"]["legality"].append({**VALID_SIGNAL, field: value})
         
         is_valid, errors = validate_stage4_output(output)
         
         assert not is_valid
     
-    def test_invalid_verification_level_fails(self):
-        """Test that invalid verification_level fails."""
-        output = create_minimal_valid_output(
-            listing_id="test123",
-            source_snapshot_id="snap123",
-        )
-        
-        output["payload"]["signals"]["legality"].append({
-            "type": "defected",
-            "severity": "high",
-            "verification_level": "maybe",  # Invalid!
-            "evidence_text": "test evidence",
-            "confidence": 0.9,
-        })
-        
-        is_valid, errors = validate_stage4_output(output)
-        
-        assert not is_valid
-    
-    def test_confidence_below_zero_fails(self):
-        """Test that confidence < 0 fails."""
-        output = create_minimal_valid_output(
-            listing_id="test123",
-            source_snapshot_id="snap123",
-        )
-        
-        output["payload"]["signals"]["legality"].append({
-            "type": "defected",
-            "severity": "high",
-            "verification_level": "verified",
-            "evidence_text": "test evidence",
-            "confidence": -0.1,  # Invalid!
-        })
-        
-        is_valid, errors = validate_stage4_output(output)
-        
-        assert not is_valid
-    
-    def test_confidence_above_one_fails(self):
-        """Test that confidence > 1 fails."""
-        output = create_minimal_valid_output(
-            listing_id="test123",
-            source_snapshot_id="snap123",
-        )
-        
-        output["payload"]["signals"]["legality"].append({
-            "type": "defected",
-            "severity": "high",
-            "verification_level": "verified",
-            "evidence_text": "test evidence",
-            "confidence": 1.5,  # Invalid!
-        })
-        
-        is_valid, errors = validate_stage4_output(output)
-        
-        assert not is_valid
-    
-    def test_empty_evidence_text_fails(self):
-        """Test that empty evidence_text fails."""
-        output = create_minimal_valid_output(
-            listing_id="test123",
-            source_snapshot_id="snap123",
-        )
-        
-        output["payload"]["signals"]["legality"].append({
-            "type": "defected",
-            "severity": "high",
-            "verification_level": "verified",
-            "evidence_text": "",  # Invalid!
-            "confidence": 0.9,
-        })
-        
-        is_valid, errors = validate_stage4_output(output)
-        
-        assert not is_valid
-    
-    def test_valid_signal_passes(self):
+    def test_valid_signal_passes(self, base_output):
         """Test that properly formed signal passes."""
-        output = create_minimal_valid_output(
-            listing_id="test123",
-            source_snapshot_id="snap123",
-        )
+        output = copy.deepcopy(base_output)
         
         output["payload"]["signals"]["legality"].append({
             "type": "defected",
@@ -189,17 +142,27 @@ class TestSchemaValidation:
         with pytest.raises(Exception):
             validate_or_raise(output)
     
-    def test_invalid_risk_level_overall_fails(self):
+    def test_invalid_risk_level_overall_fails(self, base_output):
         """Test that invalid risk_level_overall fails."""
-        output = create_minimal_valid_output(
-            listing_id="test123",
-            source_snapshot_id="snap123",
-        )
+        output = copy.deepcopy(base_output)
         output["payload"]["risk_level_overall"] = "very_high"  # Invalid!
         
         is_valid, errors = validate_stage4_output(output)
         
         assert not is_valid
+    
+    def test_shallow_check_missing_keys(self, base_output):
+        """Test that shallow_check catches missing required keys only."""
+        output = copy.deepcopy(base_output)
+        assert shallow_check(output) == (True, [])
+        
+        del output["listing_id"]
+        del output["payload"]["signals"]
+        
+        is_valid, errors = shallow_check(output)
+        
+        assert not is_valid
+        assert len(errors) == 2
 
 
 if __name__ == "__main__":
@@ -6,6 +6,7 @@ Usage:
     python view_cumulative_usage.py
 """
 
+import io
 import sys
 from pathlib import Path
 
@@ -16,63 +17,73 @@ sys.path.insert(0, str(project_root / "src"))
 from common.persistent_cost_tracker import get_persistent_tracker
 
 
-def print_cumulative_usage():
-    """Print cumulative usage statistics across all sessions."""
-    tracker = get_persistent_tracker()
+def _fmt(ts: str) -> str:
+    """Format a stored ISO-8601 timestamp for display (no tz conversion)."""
+    # "2024-01-15T10:30:22.123456+00:00" -> "2024-01-15 10:30:22"
+    return ts[:19].replace('T', ' ')
+
+
+def _render_cumulative_usage(tracker) -> str:
+    """Render the cumulative usage report as one string."""
+    out = io.StringIO()
+    
     stats = tracker.get_cumulative_stats()
     
-    print("=" * 70)
-    print("📊 CUMULATIVE LLM Usage & Cost (All Sessions)")
-    print("=" * 70)
+    print("=" * 70, file=out)
+    print("📊 CUMULATIVE LLM Usage & Cost (All Sessions)", file=out)
+    print("=" * 70, file=out)
     
     if stats["total_calls"] == 0:
-        print("\n⚠️  No usage data found.")
-        print("   Usage data is stored in: .metrics/usage_history.json")
-        print("   Run some listings through the pipeline to start tracking.")
-        return
+        print("\n⚠️  No usage data found.", file=out)
+        print("   Usage data is stored in: .metrics/usage_history.jsonl", file=out)
+        print("   Run some listings through the pipeline to start tracking.", file=out)
+        return out.getvalue()
     
-    print(f"\n📈 Total Summary (All Time):")
-    print(f"   Total LLM calls: {stats['total_calls']:,}")
-    print(f"   Total tokens: {stats['total_tokens']:,}")
-    print(f"   Total prompt tokens: {stats['total_prompt_tokens']:,}")
-    print(f"   Total completion tokens: {stats['total_completion_tokens']:,}")
-    print(f"   Total cost: ${stats['total_cost_usd']:.4f}")
+    print(f"\n📈 Total Summary (All Time):", file=out)
+    print(f"   Total LLM calls: {stats['total_calls']:,}", file=out)
+    print(f"   Total tokens: {stats['total_tokens']:,}", file=out)
+    print(f"   Total prompt tokens: {stats['total_prompt_tokens']:,}", file=out)
+    print(f"   Total completion tokens: {stats['total_completion_tokens']:,}", file=out)
+    print(f"   Total cost: ${stats['total_cost_usd']:.4f}", file=out)
     
     if stats["first_record"] and stats["last_record"]:
-        from datetime import datetime
-        first = datetime.fromisoformat(stats["first_record"].replace('Z', '+00:00'))
-        last = datetime.fromisoformat(stats["last_record"].replace('Z', '+00:00'))
-        print(f"\n   First usage: {first.strftime('%Y-%m-%d %H:%M:%S')}")
-        print(f"   Last usage: {last.strftime('%Y-%m-%d %H:%M:%S')}")
+        print(f"\n   First usage: {_fmt(stats['first_record'])}", file=out)
+        print(f"   Last usage: {_fmt(stats['last_record'])}", file=out)
     
     if stats["model_breakdown"]:
-        print(f"\n💰 Cost Breakdown by Model:")
-        for model, breakdown in sorted(stats["model_breakdown"].items()):
+        print(f"\n💰 Cost Breakdown by Model:", file=out)
+        for model, breakdown in stats["model_breakdown"].items():
             avg_cost = breakdown['total_cost'] / breakdown['calls'] if breakdown['calls'] > 0 else 0
             avg_tokens = breakdown['total_tokens'] / breakdown['calls'] if breakdown['calls'] > 0 else 0
-            print(f"\n   {model}:")
-            print(f"      Calls: {breakdown['calls']:,}")
-            print(f"      Total cost: ${breakdown['total_cost']:.4f}")
-            print(f"      Average cost per call: ${avg_cost:.4f}")
-            print(f"      Total tokens: {breakdown['total_tokens']:,}")
-            print(f"      Average tokens per call: {avg_tokens:,.0f}")
-            print(f"      Prompt tokens: {breakdown['prompt_tokens']:,}")
-            print(f"      Completion tokens: {breakdown['completion_tokens']:,}")
+            print(f"\n   {model}:", file=out)
+            print(f"      Calls: {breakdown['calls']:,}", file=out)
+            print(f"      Total cost: ${breakdown['total_cost']:.4f}", file=out)
+            print(f"      Average cost per call: ${avg_cost:.4f}", file=out)
+            print(f"      Total tokens: {breakdown['total_tokens']:,}", file=out)
+            print(f"      Average tokens per call: {avg_tokens:,.0f}", file=out)
+            print(f"      Prompt tokens: {breakdown['prompt_tokens']:,}", file=out)
+            print(f"      Completion tokens: {breakdown['completion_tokens']:,}", file=out)
     
     # Show recent usage
     recent = tracker.get_recent_usage(limit=5)
     if recent:
-        print(f"\n📋 Recent Usage (Last 5 calls):")
+        print(f"\n📋 Recent Usage (Last 5 calls):", file=out)
         for i, record in enumerate(recent, 1):
-            from datetime import datetime
-            dt = datetime.fromisoformat(record.timestamp.replace('Z', '+00:00'))
-            print(f"   {i}. {dt.strftime('%Y-%m-%d %H:%M:%S')} - {record.model}")
-            print(f"      Tokens: {record.total_tokens:,} | Cost: ${record.cost_usd:.4f}")
+            print(f"   {i}. {_fmt(record.timestamp)} - {record.model}", file=out)
+            print(f"      Tokens: {record.total_tokens:,} | Cost: ${record.cost_usd:.4f}", file=out)
     
-    print(f"\n💾 Storage Location:")
-    print(f"   {tracker.storage_path}")
-    print(f"\n💡 Tip: This data persists across all notebook runs and sessions!")
-    print("=" * 70)
+    print(f"\n💾 Storage Location:", file=out)
+    print(f"   {tracker.storage_path}", file=out)
+    print(f"\n💡 Tip: This data persists across all notebook runs and sessions!", file=out)
+    print("=" * 70, file=out)
+    
+    return out.getvalue()
+
+
+def print_cumulative_usage():
+    """Print cumulative usage statistics across all sessions."""
+    # Written in one go rather than one stdout write per line
+    sys.stdout.write(_render_cumulative_usage(get_persistent_tracker()))
 
 
 if __name__ == "__main__":